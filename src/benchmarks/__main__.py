@@ -0,0 +1,174 @@
+"""
+asv 없이 팀 매칭 엔진 벤치마크를 실행하고 기준값과 비교
+
+    cd src
+    python -m benchmarks --save            # 기준값 저장 (benchmarks/baseline.json)
+    python -m benchmarks                   # 기준값과 비교해서 느려지거나 점수가 나빠진 항목 출력
+    python -m benchmarks --check           # 성능 저하가 있으면 종료 코드 1 (CI 등에서 사용)
+    python -m benchmarks --engines annealing tabu --sizes 30 120
+    python -m benchmarks --engines polish pipeline exact   # 마무리 탐색, 전체 과정만 측정
+
+engines에는 엔진 이름과 함께 polish(마무리 탐색), pipeline(멀티 스타트 엔진 + 마무리 탐색),
+exact(멀티 스타트 담금질 기법 + 분기 한정법 + 마무리 탐색, MATCHING_EXACT_MAX_SIZE 이하의 매칭룸만)를 쓸 수 있다.
+
+기준값에는 측정한 환경의 지문(get_machine())이 함께 저장된다.
+점수는 반복 횟수로 끝나므로 어느 환경에서나 비교하지만, 실행 시간은 환경에 따라 다르므로
+같은 환경에서 저장한 기준값하고만 비교한다. (다른 환경에서는 먼저 --save로 기준값을 다시 저장)
+분기 한정법(exact)은 시간 제한으로 끝나서 점수도 환경에 따라 달라지므로 점수 역시 같은 환경에서만 비교한다.
+성능 저하는 기본적으로 출력만 하고, --check를 주면 종료 코드 1로 실패시킨다.
+"""
+import argparse
+import json
+import hashlib
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from matchings.matching.engines import ENGINES
+from matchings.matching.parameter import MATCHING_EXACT_MAX_SIZE
+
+from .bench_engines import (
+    ROOM_SIZES,
+    setup_engine,
+    setup_exact,
+    setup_pipeline,
+    setup_polish,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# 점수는 시드로 재현되므로 부동소수점 오차만 허용
+SCORE_TOLERANCE = 1e-6
+
+# 엔진 외에 측정할 수 있는 대상
+SETUPS = {"polish": setup_polish, "pipeline": setup_pipeline, "exact": setup_exact}
+
+# 시간 제한으로 끝나서 점수가 실행 환경에 따라 달라지는 대상
+TIME_LIMITED = {"exact"}
+
+
+def get_machine() -> str:
+    """
+    실행 환경의 지문 (호스트, CPU, 파이썬 버전이 같으면 같은 값)
+    """
+    info = "|".join(
+        [
+            platform.node(),
+            platform.machine(),
+            platform.processor(),
+            str(os.cpu_count()),
+            platform.python_implementation(),
+            platform.python_version(),
+        ]
+    )
+    return hashlib.sha256(info.encode()).hexdigest()[:12]
+
+
+def measure(target: str, size: int) -> dict:
+    """
+    엔진(또는 polish, pipeline)을 한 번 실행해서 실행 시간, 초당 반복 횟수, 최대 메모리, 최종 점수를 측정
+
+    초당 반복 횟수는 엔진이 SolverTelemetry에 기록한 반복 횟수로 계산한다. (반복 횟수가 없는 polish는 None)
+    """
+    run = SETUPS[target](size) if target in SETUPS else setup_engine(target, size)
+
+    started = time.perf_counter()
+    score, iterations = run()
+    elapsed = time.perf_counter() - started
+
+    # tracemalloc은 실행을 느리게 하므로 메모리는 따로 한 번 더 실행해서 측정
+    tracemalloc.start()
+    run()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "time": elapsed,
+        "iterations_per_second": None if iterations is None else iterations / elapsed,
+        "peak_memory": peak_memory,
+        "score": score,
+        "machine": get_machine(),
+    }
+
+
+def compare(
+    result: dict, baseline: dict, time_tolerance: float, time_limited: bool = False
+) -> list[str]:
+    """
+    기준값보다 time_tolerance 비율 이상 느려졌거나 점수가 나빠진 항목을 반환
+
+    실행 시간(time_limited이면 점수도)은 기준값을 같은 환경에서 저장했을 때만 비교한다.
+    """
+    regressions = []
+    same_machine = baseline.get("machine") == result["machine"]
+    if same_machine and result["time"] > baseline["time"] * (1 + time_tolerance):
+        regressions.append(f"시간 {baseline['time']:.3f}초 -> {result['time']:.3f}초")
+    if (same_machine or not time_limited) and result["score"] > baseline["score"] + SCORE_TOLERANCE:
+        regressions.append(f"점수 {baseline['score']:.2f} -> {result['score']:.2f}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="팀 매칭 엔진 벤치마크")
+    targets = [*ENGINES, *SETUPS]
+    parser.add_argument("--engines", nargs="+", default=targets, choices=targets)
+    parser.add_argument("--sizes", nargs="+", type=int, default=ROOM_SIZES)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 파일 경로")
+    parser.add_argument("--save", action="store_true", help="측정값을 기준값으로 저장")
+    parser.add_argument(
+        "--check", action="store_true", help="성능 저하가 있으면 종료 코드 1로 실패"
+    )
+    parser.add_argument(
+        "--time-tolerance", type=float, default=0.25, help="허용하는 실행 시간 증가 비율"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = {}
+    failed = False
+    machine = get_machine()
+    if not args.save and any(
+        entry.get("machine") != machine for entry in baseline.values()
+    ):
+        print("다른 환경에서 저장한 기준값은 실행 시간을 비교하지 않습니다. (같은 환경에서 --save로 다시 저장)")
+    print(f"{'engine':<12}{'size':>6}{'time(s)':>10}{'iter/s':>12}{'peak(MB)':>10}{'score':>10}")
+    for engine in args.engines:
+        for size in args.sizes:
+            if engine == "exact" and size > MATCHING_EXACT_MAX_SIZE:
+                continue
+            key = f"{engine}-{size}"
+            result = measure(engine, size)
+            results[key] = result
+            iterations_per_second = (
+                "-" if result["iterations_per_second"] is None
+                else f"{result['iterations_per_second']:.0f}"
+            )
+            print(
+                f"{engine:<12}{size:>6}{result['time']:>10.3f}{iterations_per_second:>12}"
+                f"{result['peak_memory'] / 2**20:>10.1f}{result['score']:>10.2f}"
+            )
+
+            if not args.save and key in baseline:
+                regressions = compare(
+                    result, baseline[key], args.time_tolerance, engine in TIME_LIMITED
+                )
+                if regressions:
+                    failed = True
+                    print(f"  성능 저하: {', '.join(regressions)}")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({**baseline, **results}, f, indent=2)
+        print(f"기준값을 저장했습니다: {args.baseline}")
+        return 0
+    return 1 if failed and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
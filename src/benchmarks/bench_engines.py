@@ -0,0 +1,207 @@
+"""
+팀 매칭 엔진 벤치마크 (asv 형식)
+
+    cd src && asv run        # 현재 환경에서 실행 (asv.conf.json)
+    cd src && asv continuous main HEAD   # 두 커밋 비교
+
+asv 없이 실행하고 기준값을 저장, 비교하려면 python -m benchmarks 를 사용한다.
+
+    - EngineSuite: 엔진 하나를 한 번 실행
+    - PolishSuite: annealing 결과를 마무리 탐색(steepest_descent)으로 다듬기
+    - PipelineSuite: 실제 매칭과 같은 과정 (멀티 스타트 엔진 + 마무리 탐색, pipeline.solve_matching)
+    - ExactSuite: 멀티 스타트 담금질 기법 + 분기 한정법 + 마무리 탐색 (MATCHING_EXACT_MAX_SIZE 이하의 매칭룸만)
+"""
+import time
+
+from matchings.matching.engines import ENGINES, EXACT_ENGINE
+from matchings.matching.parameter import (
+    MATCHING_ENGINE,
+    MATCHING_EXACT_MAX_SIZE,
+    MATCHING_INITIALIZER,
+    MULTI_START_COUNT,
+)
+from matchings.matching.pipeline import solve_matching
+from matchings.matching.polish import steepest_descent
+from matchings.matching.room_context import RoomContext
+from matchings.matching.room_factory import make_room
+from matchings.matching.simulated_annealing import random_team_assignment, simulated_annealing
+from matchings.matching.telemetry import SolverTelemetry
+
+# 벤치마크할 참가자 수 (TEAM_COUNT개 팀의 파트별 최소 인원 이상)
+ROOM_SIZES = [30, 60, 120, 250, 500]
+
+# 실행 환경과 무관하게 같은 양의 탐색을 하도록 반복 횟수로만 종료
+MAX_ITERATIONS = 20000
+SEED = 0
+ENGINE_KWARGS = {"time_budget": None, "patience": None, "max_iterations": MAX_ITERATIONS}
+
+# 분기 한정법을 실행하는 매칭룸 크기
+EXACT_ROOM_SIZES = [size for size in ROOM_SIZES if size <= MATCHING_EXACT_MAX_SIZE]
+
+# 전체 과정 벤치마크의 실행 설정 (pipeline.get_engine_params()와 같은 형식)
+# 점수가 실행 환경과 무관하게 재현되도록 시간 예산 대신 반복 횟수로 종료하고 마무리 탐색의 시간 제한도 두지 않음
+# (분기 한정법은 시간 제한으로만 끝나므로 최적성을 증명하지 못하면 점수가 실행 환경에 따라 달라질 수 있음)
+PIPELINE_PARAMS = {
+    "engine": MATCHING_ENGINE,
+    "initializer": MATCHING_INITIALIZER,
+    "start_count": MULTI_START_COUNT,
+    "polish": True,
+    "polish_time_limit": None,
+    "exact_time_limit": 2.0,
+    "engine_kwargs": ENGINE_KWARGS,
+}
+
+
+def setup_engine(engine: str, size: int):
+    """
+    벤치마크용 매칭룸과 초기 해를 생성 (같은 크기이면 항상 같은 매칭룸)
+
+    return:
+        - run: 엔진을 한 번 실행하고 (best_score, 반복 횟수)를 반환하는 함수
+          (반복 횟수는 엔진이 SolverTelemetry에 기록한 값)
+    """
+    context = RoomContext(make_room(size, seed=size))
+    initial_assignment = random_team_assignment(context.room, SEED)
+
+    def run():
+        telemetry = SolverTelemetry()
+        _, best_score = ENGINES[engine](
+            context, initial_assignment, rng=SEED, telemetry=telemetry, **ENGINE_KWARGS
+        )
+        return best_score, telemetry.iterations
+
+    return run
+
+
+def setup_polish(size: int):
+    """
+    annealing 결과를 시작점으로 마무리 탐색을 준비 (시간 제한 없이 국소 최적해까지 다듬음)
+
+    return:
+        - run: 마무리 탐색을 한 번 실행하고 (점수, None)을 반환하는 함수
+    """
+    context = RoomContext(make_room(size, seed=size))
+    initial_assignment, _ = simulated_annealing(
+        context, random_team_assignment(context.room, SEED), rng=SEED, **ENGINE_KWARGS
+    )
+
+    def run():
+        _, score, _ = steepest_descent(context, initial_assignment, time_limit=None)
+        return score, None
+
+    return run
+
+
+def setup_pipeline(size: int, engine: str = MATCHING_ENGINE):
+    """
+    실제 매칭과 같은 과정(멀티 스타트 엔진 + 마무리 탐색)을 준비 (engine이 EXACT_ENGINE이면 분기 한정법 포함)
+
+    return:
+        - run: 한 번 실행하고 (최종 점수, 모든 실행의 반복 횟수 합)을 반환하는 함수
+    """
+    context = RoomContext(make_room(size, seed=size))
+    engine_params = {**PIPELINE_PARAMS, "engine": engine}
+
+    def run():
+        _, score, run_stats = solve_matching(context, SEED, engine_params, telemetry=True)
+        return score, run_stats["iterations"]
+
+    return run
+
+
+def setup_exact(size: int):
+    return setup_pipeline(size, EXACT_ENGINE)
+
+
+class EngineSuite:
+    params = (list(ENGINES), ROOM_SIZES)
+    param_names = ["engine", "size"]
+    timeout = 300
+
+    def setup(self, engine, size):
+        self.run = setup_engine(engine, size)
+
+    def time_engine(self, engine, size):
+        self.run()
+
+    def peakmem_engine(self, engine, size):
+        self.run()
+
+    def track_score(self, engine, size):
+        return self.run()[0]
+
+    track_score.unit = "score"
+
+    def track_iterations_per_second(self, engine, size):
+        started = time.perf_counter()
+        _, iterations = self.run()
+        return iterations / (time.perf_counter() - started)
+
+    track_iterations_per_second.unit = "iterations/s"
+
+
+class PolishSuite:
+    params = ROOM_SIZES
+    param_names = ["size"]
+    timeout = 300
+
+    def setup(self, size):
+        self.run = setup_polish(size)
+
+    def time_polish(self, size):
+        self.run()
+
+    def peakmem_polish(self, size):
+        self.run()
+
+    def track_score(self, size):
+        return self.run()[0]
+
+    track_score.unit = "score"
+
+
+class PipelineSuite:
+    params = ROOM_SIZES
+    param_names = ["size"]
+    timeout = 300
+
+    def setup(self, size):
+        self.run = setup_pipeline(size)
+
+    def time_pipeline(self, size):
+        self.run()
+
+    def peakmem_pipeline(self, size):
+        self.run()
+
+    def track_score(self, size):
+        return self.run()[0]
+
+    track_score.unit = "score"
+
+    def track_iterations_per_second(self, size):
+        started = time.perf_counter()
+        _, iterations = self.run()
+        return iterations / (time.perf_counter() - started)
+
+    track_iterations_per_second.unit = "iterations/s"
+
+
+class ExactSuite:
+    params = EXACT_ROOM_SIZES
+    param_names = ["size"]
+    timeout = 300
+
+    def setup(self, size):
+        self.run = setup_exact(size)
+
+    def time_exact(self, size):
+        self.run()
+
+    def peakmem_exact(self, size):
+        self.run()
+
+    def track_score(self, size):
+        return self.run()[0]
+
+    track_score.unit = "score"
@@ -201,3 +201,5 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+# 워커 프로세스 수 (None이면 CPU 코어 수, 팀 매칭 멀티 스타트의 프로세스 수도 이 값으로 정함)
+CELERY_WORKER_CONCURRENCY = int(os.getenv("CELERY_WORKER_CONCURRENCY") or 0) or None
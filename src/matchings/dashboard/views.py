@@ -50,10 +50,19 @@ class DashboardAPIView(APIView):
             )
         teams = Team.objects.filter(result=latest_result).order_by("team_number")
 
+        # 모든 팀의 팀원을 쿼리 1회로 읽어서 팀 번호별로 묶음 (팀별 분포 계산에 공통으로 사용)
+        team_members = {team.team_number: [] for team in teams}
+        for m in (
+            Member.objects.filter(team__result=latest_result)
+            .select_related("team", "participant__user")
+            .order_by("id")
+        ):
+            team_members[m.team.team_number].append(m)
+
         # 팀별 파트 분포
         part_dist = []
         for team in teams:
-            members = Member.objects.filter(team=team).select_related("participant")
+            members = team_members[team.team_number]
             part_count = {
                 "team_number": team.team_number,
                 "PM": 0,
@@ -70,7 +79,7 @@ class DashboardAPIView(APIView):
         # 팀별 프레임워크/언어 분포 (예시: FE/BE의 development_score 평균)
         framework_dist = []
         for team in teams:
-            members = Member.objects.filter(team=team).select_related("participant")
+            members = team_members[team.team_number]
             framework_scores = {}
             # FE
             fe_members = [m for m in members if m.participant.part == "FE"]
@@ -134,7 +143,7 @@ class DashboardAPIView(APIView):
         # 팀별 PM/디자인 역량 분포
         pm_design_dist = []
         for team in teams:
-            members = Member.objects.filter(team=team).select_related("participant")
+            members = team_members[team.team_number]
             pm_score = None
             pm_dev_score = None
             design_score = None
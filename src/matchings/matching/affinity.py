@@ -0,0 +1,108 @@
+import glob
+import hashlib
+import os
+
+import numpy as np
+
+from .parameter import MATCHING_CACHE_DIR
+from .room_model import MatchingRoom
+
+
+def get_room_fingerprint(room: MatchingRoom) -> str:
+    """
+    매칭룸 스냅샷(참가자, 파트, 카테고리 데이터, 꼬리 흔들기)의 지문
+
+    참가자 정보나 꼬리 흔들기가 바뀌면 지문도 바뀌므로 캐시 파일 이름에 사용한다.
+    """
+    digest = hashlib.sha256()
+    for array in (
+        room.participant_ids,
+        room.part,
+        room.category,
+        room.wagger,
+        room.waggee,
+    ):
+        digest.update(np.ascontiguousarray(array).tobytes())
+        digest.update(b"|")
+    return digest.hexdigest()[:16]
+
+
+def build_affinity(
+    room: MatchingRoom, category_weight: list[list[float]], max_weight: float
+) -> dict[str, np.ndarray]:
+    """
+    참가자 쌍별 관계 행렬을 계산
+
+    return:
+        - wagging: (N, N) bool, [i][j]는 i가 j에게 꼬리를 흔들었는지 여부
+        - category_agreement: (N, N) float32, 두 참가자가 같은 선택지를 고른 카테고리의 가중치 합
+          (CATEGORY 개수 * max_weight로 나눠서 0 ~ 1, 대각 성분은 0)
+    """
+    wagging = np.zeros((room.size, room.size), dtype=bool)
+    wagging[room.wagger, room.waggee] = True
+
+    category_agreement = np.zeros((room.size, room.size), dtype=np.float64)
+    for category_idx, weights in enumerate(category_weight):
+        values = room.category[:, category_idx]
+        same = values[:, None] == values[None, :]
+        category_agreement += same * np.asarray(weights)[values][:, None]
+    category_agreement /= room.category.shape[1] * max_weight
+    np.fill_diagonal(category_agreement, 0)
+
+    return {
+        "wagging": wagging,
+        "category_agreement": category_agreement.astype(np.float32),
+    }
+
+
+def load_affinity(
+    room_id: int,
+    room: MatchingRoom,
+    category_weight: list[list[float]],
+    max_weight: float,
+) -> dict[str, np.ndarray]:
+    """
+    매칭룸의 참가자 쌍별 관계 행렬을 캐시에서 읽고, 없으면 계산해서 저장
+
+    캐시 파일은 MATCHING_CACHE_DIR/room_{room_id}_{지문}.npz 이며,
+    같은 매칭룸의 지문이 다른(참가자가 바뀐) 파일은 새로 저장할 때 삭제한다.
+    (다른 프로세스가 쓰는 중인 임시 파일 .room_{room_id}_{지문}.npz.{pid}.tmp.npz는 삭제하지 않음)
+    캐시를 읽거나 쓸 수 없으면 계산한 값을 그대로 사용한다.
+    """
+    path = os.path.join(
+        MATCHING_CACHE_DIR, f"room_{room_id}_{get_room_fingerprint(room)}.npz"
+    )
+
+    try:
+        with np.load(path) as cached:
+            return {key: cached[key] for key in cached.files}
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"관계 행렬 캐시를 읽을 수 없어 다시 계산합니다. ({e})")
+
+    affinity = build_affinity(room, category_weight, max_weight)
+
+    try:
+        os.makedirs(MATCHING_CACHE_DIR, exist_ok=True)
+        for stale_path in glob.glob(
+            os.path.join(MATCHING_CACHE_DIR, f"room_{room_id}_*.npz")
+        ):
+            if stale_path == path:
+                continue
+            try:
+                os.remove(stale_path)
+            except FileNotFoundError:
+                pass  # 다른 프로세스가 먼저 삭제함
+
+        # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        # (임시 파일은 점으로 시작해서 위의 room_{room_id}_*.npz 삭제 대상에 포함되지 않음)
+        temp_path = os.path.join(
+            MATCHING_CACHE_DIR, f".{os.path.basename(path)}.{os.getpid()}.tmp.npz"
+        )
+        np.savez_compressed(temp_path, **affinity)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"관계 행렬 캐시를 저장할 수 없습니다. ({e})")
+
+    return affinity
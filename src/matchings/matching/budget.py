@@ -0,0 +1,58 @@
+import time
+
+
+class SearchBudget:
+    """
+    탐색 엔진의 종료 조건을 관리하는 객체
+
+        - time_budget: 실행 시간 예산 (초)
+        - max_iterations: 최대 반복 횟수
+        - patience: 최고 점수가 이 반복 횟수 동안 개선되지 않으면 조기 종료
+
+    time_budget과 max_iterations 중 먼저 도달하는 쪽에서 종료한다.
+    """
+
+    def __init__(self, time_budget=None, max_iterations=None, patience=None):
+        if time_budget is None and max_iterations is None:
+            raise ValueError("시간 예산이나 최대 반복 횟수 중 하나는 지정해야 합니다.")
+
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.patience = patience
+        self.start_time = time.perf_counter()
+        self.last_improvement = 0
+
+    @property
+    def elapsed(self) -> float:
+        """
+        탐색을 시작한 뒤 지난 시간 (초)
+        """
+        return time.perf_counter() - self.start_time
+
+    def get_progress(self, iteration: int) -> float:
+        """
+        예산 대비 진행률 (0 ~ 1, 1이면 예산 소진)
+        """
+        progress = 0.0
+        if self.time_budget is not None:
+            if self.time_budget <= 0:
+                return 1.0
+            progress = self.elapsed / self.time_budget
+        if self.max_iterations is not None:
+            progress = max(progress, iteration / max(self.max_iterations, 1))
+        return min(progress, 1.0)
+
+    def record_improvement(self, iteration: int):
+        """
+        최고 점수가 개선된 반복 번호를 기록
+        """
+        self.last_improvement = iteration
+
+    def is_stalled(self, iteration: int) -> bool:
+        """
+        patience 동안 최고 점수가 개선되지 않았는지 여부
+        """
+        return (
+            self.patience is not None
+            and iteration - self.last_improvement >= self.patience
+        )
@@ -1,62 +1,177 @@
 from math import log
-from .parameter import CATEGORY
+from typing import TYPE_CHECKING
 
+import numpy as np
 
-def get_category_score(team_list: list[list[dict]]) -> list[dict]:
+from .parameter import CATEGORY, TEAM_COUNT
+from .room_model import CATEGORY_KEYS, CATEGORY_SIZE, MatchingRoom
+
+if TYPE_CHECKING:
+    from .room_context import RoomContext
+
+
+def get_category_score(
+    context: "RoomContext", assignment: np.ndarray, team_count: int = TEAM_COUNT
+) -> list[float]:
     """
     모든 팀의 카테고리 데이터 점수를 반환
 
     input:
-        - team_list = [
-            [
-                {member1},
-                {member2},
-                ...
-            ],
-            [],
-            [],
-            ...
-        ]
+        - context: RoomContext (미리 계산된 카테고리 가중치 사용)
+        - assignment = [0, 3, 1, ...] 참가자 인덱스별 팀 번호
 
     return:
-        - category_score = [0.45, 0.88]
+        - category_score = [45.0, 88.0]
     """
-    category_weight = _get_category_weight(team_list)
-    weight_list = []
-    for value_dict in category_weight.values():
-        weight_list.extend(value_dict.values())
-    max_weight = max(weight_list)  # 가장 큰 weight
-
     category_score = []
 
-    for team in team_list:
-        team_similarity = _get_team_category_rate(team)
-        team_score = 0
-
-        for key, values in team_similarity.items():
-            most_frequent_value, rate = sorted(
-                [(value, team_similarity[key][value]) for value in values],
-                key=lambda x: -x[1],
-            )[0]
-            weight = category_weight[key][most_frequent_value]
-            score = rate * weight
-            team_score += score
-        team_score = round(team_score / len(team_similarity) / max_weight, 2) * 100
-        category_score.append(team_score)
+    for team_category_count in _get_category_count(
+        context.room, assignment, team_count
+    ):
+        category_score.append(
+            _get_team_category_score(
+                team_category_count.tolist(),
+                context.category_weight,
+                context.max_weight,
+            )
+        )
 
     return category_score
 
 
-def _get_team_category_rate(member_list: list[dict]) -> dict[dict]:
+def _get_team_category_score(
+    team_category_count: list[list[int]],
+    category_weight: list[list[float]],
+    max_weight: float,
+) -> float:
+    """
+    한 팀의 카테고리 데이터 인원수와 가중치로 팀의 카테고리 점수를 반환
+
+    Args:
+        - team_category_count = [[3, 2], [1, 4], [5, 0]] 카테고리별 선택지 인원수
+        - category_weight: _get_category_weight()의 반환값
+        - max_weight: 가장 큰 weight
+
+    Returns:
+        - team_score = 57.0
+    """
+    team_score = 0
+
+    for category_idx, values in enumerate(team_category_count):
+        rates = _get_rate(values)
+
+        # 비율이 같으면 CATEGORY에 먼저 정의된 값을 선택
+        most_frequent_value = max(range(len(rates)), key=lambda x: (rates[x], -x))
+        weight = category_weight[category_idx][most_frequent_value]
+        score = rates[most_frequent_value] * weight
+        team_score += score
+    return round(team_score / len(team_category_count) / max_weight, 2) * 100
+
+
+def _get_team_category_scores(
+    team_category_count: np.ndarray,
+    category_weight: np.ndarray,
+    max_weight: float,
+) -> np.ndarray:
+    """
+    _get_team_category_score()를 여러 팀에 대해 NumPy로 한 번에 계산
+
+    Args:
+        - team_category_count: (팀 개수, 카테고리 개수, 선택지 개수) 인원수 배열
+        - category_weight: (카테고리 개수, 선택지 개수) 가중치 배열
+        - max_weight: 가장 큰 weight
+
+    Returns:
+        - team_score: (팀 개수,) 배열
+    """
+    size = team_category_count.sum(axis=2, keepdims=True)
+    rates = _round(team_category_count / size)
+
+    # argmax는 최댓값이 여러 개면 첫 번째를 반환 (CATEGORY에 먼저 정의된 값을 선택)
+    most_frequent_value = rates.argmax(axis=2)
+    rate = np.take_along_axis(rates, most_frequent_value[..., None], axis=2)[..., 0]
+    weight = category_weight[
+        np.arange(category_weight.shape[0]), most_frequent_value
+    ]
+
+    team_score = (rate * weight).sum(axis=1)
+    return _round(team_score / team_category_count.shape[1] / max_weight) * 100
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    """
+    파이썬 round(value, 2)와 같은 결과를 내는 NumPy 반올림
+
+    np.round()는 value * 100을 반올림하므로 0.xx5 근처의 값에서 파이썬 round()와 결과가 다를 수 있다.
+    경계에 가까운 값만 파이썬 round()로 다시 계산한다.
+    """
+    scaled = values * 100
+    result = np.round(scaled) / 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        result[near_half] = [round(value, 2) for value in values[near_half].tolist()]
+    return result
+
+
+def _get_max_weight(category_weight: list[list[float]]) -> float:
+    """
+    카테고리 가중치 중 가장 큰 값을 반환
+    """
+    weight_list = []
+    for category_idx, key in enumerate(CATEGORY_KEYS):
+        weight_list.extend(category_weight[category_idx][: len(CATEGORY[key])])
+    return max(weight_list)
+
+
+def _get_rate(values: list[int]) -> list[float]:
+    """
+    선택지별 인원수를 비율로 변환
+    """
+    value_total = sum(values)
+    return [round(value / value_total, 2) for value in values]
+
+
+def _count_category(category: np.ndarray) -> np.ndarray:
+    """
+    참가자들의 카테고리 데이터를 (카테고리 개수, 선택지 개수) 인원수 배열로 변환
+    """
+    category_count = np.zeros((len(CATEGORY_KEYS), CATEGORY_SIZE), dtype=np.int64)
+    np.add.at(
+        category_count, (np.arange(len(CATEGORY_KEYS))[None, :], category), 1
+    )
+    return category_count
+
+
+def _get_category_count(
+    room: MatchingRoom, assignment: np.ndarray, team_count: int = TEAM_COUNT
+) -> np.ndarray:
+    """
+    팀별 카테고리 데이터의 인원수를 반환
+
+    Returns:
+        - category_count: (팀 개수, 카테고리 개수, 선택지 개수) 배열
+    """
+    category_count = np.zeros(
+        (team_count, len(CATEGORY_KEYS), CATEGORY_SIZE), dtype=np.int64
+    )
+    np.add.at(
+        category_count,
+        (
+            assignment[:, None],
+            np.arange(len(CATEGORY_KEYS))[None, :],
+            room.category,
+        ),
+        1,
+    )
+    return category_count
+
+
+def _get_team_category_rate(room: MatchingRoom, members: list[int]) -> dict[dict]:
     """
     한 팀의 카테고리 데이터의 비율을 반환
 
     Args:
-        - member_list = [
-            {member1},
-            {member2},
-            ...
-        ]
+        - members = [0, 4, 7, ...] 팀 멤버의 참가자 인덱스
 
     Returns:
         - similarity = {
@@ -65,78 +180,48 @@ def _get_team_category_rate(member_list: list[dict]) -> dict[dict]:
             "meeting_preference: {}
         }
     """
-
-    # 카테고리 개수를 저장할 딕셔너리
-    team_category_count = {
-        key: {value: 0 for value in values} for key, values in CATEGORY.items()
-    }
-
-    # team _category_count 업데이트
-    for member in member_list:
-        for category_key in CATEGORY:
-            team_category_count[category_key][member[category_key]] += 1
+    team_category_count = _count_category(room.category[members])
 
     # 각 카테고리의 유사도를 저장 (카테고리가 일치하는 사람의 비율)
     similarity = {}
-    for key, values in team_category_count.items():
-        similarity[key] = {}  # 추가 필요
-        value_total = sum(team_category_count[key][value] for value in values)
-
-        for value in values:
-            similarity[key][value] = round(
-                team_category_count[key][value] / value_total, 2
-            )
+    for category_idx, key in enumerate(CATEGORY_KEYS):
+        values = CATEGORY[key]
+        rates = _get_rate(team_category_count[category_idx][: len(values)].tolist())
+        similarity[key] = dict(zip(values, rates))
 
     return similarity
 
 
-def _get_category_weight(team_list: list[list[dict]]) -> dict[dict]:
+def _get_category_weight(room: MatchingRoom) -> list[list[float]]:
     """
-    카테고리 데이터의 가중치 정보를 담은 딕셔너리를 반환
+    카테고리 데이터의 가중치 정보를 반환 (전체 참가자의 분포로 계산)
 
-    input:
-        - team_list = [
-            [
-                {member1},
-                {member2},
-                ...
-            ],
-            [],
-            [],
+    return:
+        - category_weight = [
+            [0.82, 0.18],  # team_vibe: learning, professional
+            [],            # active_hours
             ...
         ]
-
-    return:
-        - category_weight = {
-            team_vibe: {learning: 0.82, professional: 0.18},
-            active_hours: {},
-        }
     """
     # 카테고리 통계
-    category_count = {
-        key: {value: 0 for value in values} for key, values in CATEGORY.items()
-    }
-    for team in team_list:
-        for member in team:
-            for key in CATEGORY:
-                category_count[key][member[key]] += 1
+    category_count = _count_category(room.category)
 
     # 카테고리별 가중치 계산
-    category_weight = {}
-    participant_count = sum([len(team) for team in team_list])
+    category_weight = []
+    participant_count = room.size
 
     # ex) team_vibe, [learning, professional]
-    for key, values in category_count.items():
-        value_total = sum(category_count[key][value] for value in values)
-        category_weight[key] = {}
+    for category_idx, key in enumerate(CATEGORY_KEYS):
+        values = category_count[category_idx][: len(CATEGORY[key])].tolist()
+        value_total = sum(values)
+        weights = [0.0] * CATEGORY_SIZE
 
-        for value in values:
+        for value_idx, count in enumerate(values):
             # 모든 참가자가 같은 카테고리를 선택한 경우에는 가중치를 1 (만점처리)
-            if category_count[key][value] == participant_count:
-                category_weight[key][value] = 1
+            if count == participant_count:
+                weights[value_idx] = 1
             else:
-                category_weight[key][value] = round(
-                    -log(category_count[key][value] / value_total), 2
-                )
+                weights[value_idx] = round(-log(count / value_total), 2)
+        category_weight.append(weights)
 
     return category_weight
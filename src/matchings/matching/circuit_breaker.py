@@ -0,0 +1,56 @@
+import threading
+import time
+
+# 차단기 상태
+CLOSED = "closed"  # 호출 허용
+OPEN = "open"  # 호출 차단
+HALF_OPEN = "half_open"  # 시험 호출 하나만 진행 중, 나머지 호출은 차단
+
+
+class CircuitBreaker:
+    """
+    외부 호출이 연속으로 실패하면 일정 시간 동안 호출을 막는 차단기
+
+        - threshold: 연속 실패가 이 횟수에 도달하면 차단
+        - cooldown: 차단한 뒤 다시 호출을 허용하기까지의 시간 (초)
+
+    cooldown이 지나면 처음 allow()를 호출한 한 곳에만 시험 호출을 허용하고(half-open),
+    시험 호출의 결과가 기록될 때까지 다른 호출은 계속 막는다.
+    시험 호출이 성공하면 연속 실패 횟수를 초기화하고, 실패하면 다시 cooldown 동안 차단한다.
+    시험 호출의 결과가 cooldown이 지나도록 기록되지 않으면 다음 호출을 새 시험 호출로 허용한다.
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.state = CLOSED
+        self.opened_at = None  # 차단하거나 시험 호출을 허용한 시각
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        지금 호출해도 되는지 여부 (True를 받은 호출은 결과를 record_success/record_failure로 기록해야 함)
+        """
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.state = HALF_OPEN
+            self.opened_at = time.monotonic()
+            return True
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.state = CLOSED
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
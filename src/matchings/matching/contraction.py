@@ -0,0 +1,327 @@
+import numpy as np
+
+from .incremental_score import IncrementalEvaluator
+from .neighborhoods import anneal_moves
+from .parameter import MATCHING_PATIENCE, MATCHING_TIME_BUDGET, TEAM_COUNT
+from .rng import get_rng
+from .room_context import RoomContext
+from .room_model import PARTS, MatchingRoom
+from .simulated_annealing import _get_team_template
+
+
+def contract_mutual_waggings(
+    context: RoomContext, max_cluster_size: int = 2
+) -> list[list[int]]:
+    """
+    서로 꼬리를 흔든 참가자들을 하나의 묶음(super-node)으로 합침
+
+    서로 꼬리를 흔든 쌍을 union-find로 합치되, 합친 묶음이 max_cluster_size보다 커지거나
+    파트 구성이 어떤 팀 템플릿에도 들어가지 않거나, 모든 묶음을 팀 템플릿에 나눠 담을 수 없게 되면 합치지 않는다.
+    (묶음이 크면 맞바꿀 상대가 줄어들어 카테고리 점수를 개선하기 어려워짐)
+
+    input:
+        - context: RoomContext
+        - max_cluster_size: 묶음의 최대 인원수
+
+    return:
+        - clusters = [[0, 5], [3, 8, 11], ...] 두 명 이상인 묶음의 참가자 인덱스 리스트
+    """
+    room = context.room
+    team_template = _get_team_template(room)
+    if not team_template:
+        raise ValueError("요청하신 개수만큼의 팀을 생성할 수 없습니다.")
+    template = [[team[part] for part in PARTS] for team in team_template]
+
+    parent = list(range(room.size))
+    part_count = [[0] * len(PARTS) for _ in range(room.size)]
+    for person, part in enumerate(room.part.tolist()):
+        part_count[person][part] = 1
+
+    def find(person):
+        while parent[person] != person:
+            parent[person] = parent[parent[person]]
+            person = parent[person]
+        return person
+
+    mutual_pairs = np.argwhere(
+        np.triu(context.wagging_matrix & context.wagging_matrix.T)
+    ).tolist()
+    for person_a, person_b in mutual_pairs:
+        root_a, root_b = find(person_a), find(person_b)
+        if root_a == root_b:
+            continue
+
+        merged = [a + b for a, b in zip(part_count[root_a], part_count[root_b])]
+        if sum(merged) > max_cluster_size:
+            continue
+        if not any(_fits(merged, team) for team in template):
+            continue
+
+        # 합친 뒤에도 모든 묶음을 팀 템플릿에 나눠 담을 수 있을 때만 확정
+        cluster_counts = [
+            part_count[root]
+            for root in range(room.size)
+            if find(root) == root and root not in (root_a, root_b)
+        ]
+        if not _can_pack(cluster_counts + [merged], template):
+            continue
+
+        parent[root_b] = root_a
+        part_count[root_a] = merged
+
+    clusters = {}
+    for person in range(room.size):
+        clusters.setdefault(find(person), []).append(person)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def _fits(count: list[int], vacancy: list[int]) -> bool:
+    return all(c <= v for c, v in zip(count, vacancy))
+
+
+def _can_pack(cluster_counts: list[list[int]], template: list[list[int]]) -> bool:
+    """
+    묶음들을 팀 템플릿에 나눠 담을 수 있는지 확인 (큰 묶음부터 첫 번째로 들어가는 팀에 배치)
+
+    파트별 전체 인원수는 팀 템플릿과 같으므로 한 명짜리 묶음은 항상 남은 자리에 들어간다.
+    """
+    vacancy = [list(team) for team in template]
+    for count in sorted(
+        (count for count in cluster_counts if sum(count) > 1), key=sum, reverse=True
+    ):
+        for team in vacancy:
+            if _fits(count, team):
+                for part, c in enumerate(count):
+                    team[part] -= c
+                break
+        else:
+            return False
+    return True
+
+
+def _gather_clusters(
+    room: MatchingRoom, assignment: np.ndarray, clusters: list[list[int]]
+) -> tuple[np.ndarray, list[list[int]]]:
+    """
+    초기 해에서 각 묶음의 참가자를 같은 팀으로 모음 (같은 파트끼리 교환하므로 팀 템플릿 유지)
+
+    큰 묶음부터 이미 가장 많은 멤버가 있는 팀으로 모으고, 담을 수 있는 팀이 없으면 그 묶음은 풀어서 사용한다.
+
+    return:
+        - assignment: 묶음이 같은 팀에 모인 팀 매칭
+        - clusters: 실제로 사용한 묶음 리스트
+    """
+    assignment = assignment.copy()
+    part = room.part.tolist()
+
+    # 팀별, 파트별로 아직 묶음에 고정되지 않은 자리 수
+    free = [[0] * len(PARTS) for _ in range(TEAM_COUNT)]
+    for person, team in enumerate(assignment.tolist()):
+        free[team][part[person]] += 1
+    fixed = [False] * room.size
+
+    gathered = []
+    for members in sorted(clusters, key=len, reverse=True):
+        count = [0] * len(PARTS)
+        for member in members:
+            count[part[member]] += 1
+
+        teams = [team for team in range(TEAM_COUNT) if _fits(count, free[team])]
+        if not teams:
+            continue
+        target = max(teams, key=lambda t: (sum(assignment[members] == t), -t))
+
+        for member in members:
+            if assignment[member] == target:
+                continue
+            # 같은 팀, 같은 파트의 고정되지 않은 참가자와 교환
+            partner = next(
+                person
+                for person in np.flatnonzero(assignment == target).tolist()
+                if part[person] == part[member]
+                and not fixed[person]
+                and person not in members
+            )
+            assignment[member], assignment[partner] = target, assignment[member]
+
+        for member in members:
+            fixed[member] = True
+            free[target][part[member]] -= 1
+        gathered.append(members)
+
+    return assignment, gathered
+
+
+class UnitSampler:
+    """
+    묶음(super-node)과 한 명짜리 참가자를 이동 단위로 하는 교환 샘플러
+
+    이동은 서로 다른 두 팀의 파트 구성이 같은 두 단위를 맞바꾼다.
+        - 한 명 <-> 같은 파트의 한 명
+        - 묶음 <-> 파트 구성이 같은 묶음
+        - 묶음 <-> 상대 팀에서 파트 구성이 같도록 고른 한 명짜리 참가자들
+    따라서 묶음은 항상 한 팀에 모여 있고 팀 템플릿의 파트별 인원수도 유지된다.
+    무작위 선택에는 rng(시드 또는 random.Random)를 사용한다.
+    """
+
+    def __init__(
+        self,
+        room: MatchingRoom,
+        assignment: np.ndarray,
+        clusters: list[list[int]],
+        team_count: int = TEAM_COUNT,
+        rng=None,
+    ):
+        self.rng = get_rng(rng)
+        self.part = room.part.tolist()
+        self.team = assignment.tolist()
+        self.clusters = [
+            sorted(members, key=lambda member: (self.part[member], member))
+            for members in clusters
+        ]
+        self.signatures = [
+            tuple(self.part[member] for member in members) for members in self.clusters
+        ]
+
+        # cluster_of[참가자]: 묶음 번호 (한 명짜리 참가자는 -1)
+        self.cluster_of = [-1] * room.size
+        for cluster, members in enumerate(self.clusters):
+            for member in members:
+                self.cluster_of[member] = cluster
+
+        # singles[팀][파트] = [한 명짜리 참가자 인덱스, ...]
+        self.singles = [[[] for _ in PARTS] for _ in range(team_count)]
+        for person, team in enumerate(self.team):
+            if self.cluster_of[person] < 0:
+                self.singles[team][self.part[person]].append(person)
+
+        # team_clusters[팀] = [묶음 번호, ...]
+        self.team_clusters = [[] for _ in range(team_count)]
+        for cluster, members in enumerate(self.clusters):
+            self.team_clusters[self.team[members[0]]].append(cluster)
+
+        self.team_count = team_count
+        self.size = room.size
+
+    def sample(self):
+        """
+        이동 하나를 무작위로 선택
+
+        return:
+            - [(person_a, person_b), ...] 같은 파트끼리 짝지은 교환 목록
+            - 선택한 단위와 맞바꿀 상대가 없으면 None
+        """
+        rng = self.rng
+        person = rng.randrange(self.size)
+        team_a = self.team[person]
+        team_b = rng.randrange(self.team_count - 1)
+        if team_b >= team_a:
+            team_b += 1
+
+        cluster = self.cluster_of[person]
+        if cluster < 0:
+            candidates = self.singles[team_b][self.part[person]]
+            if not candidates:
+                return None
+            return [(person, rng.choice(candidates))]
+
+        members = self.clusters[cluster]
+        signature = self.signatures[cluster]
+        same_clusters = [
+            other
+            for other in self.team_clusters[team_b]
+            if self.signatures[other] == signature
+        ]
+        required = [signature.count(part) for part in range(len(PARTS))]
+        has_singles = all(
+            len(self.singles[team_b][part]) >= count
+            for part, count in enumerate(required)
+        )
+        if not same_clusters and not has_singles:
+            return None
+
+        if same_clusters and (not has_singles or rng.random() < 0.5):
+            partners = self.clusters[rng.choice(same_clusters)]
+        else:
+            partners = []
+            for part, count in enumerate(required):
+                partners.extend(rng.sample(self.singles[team_b][part], count))
+
+        # members와 partners는 모두 파트 순서로 정렬되어 있으므로 같은 위치끼리 같은 파트
+        return list(zip(members, partners))
+
+    def apply(self, swaps: list[tuple[int, int]]):
+        """
+        채택한 이동을 인덱스에 반영
+        """
+        team_a = self.team[swaps[0][0]]
+        team_b = self.team[swaps[0][1]]
+
+        for side, (from_team, to_team) in enumerate(
+            ((team_a, team_b), (team_b, team_a))
+        ):
+            moved = [swap[side] for swap in swaps]
+            cluster = self.cluster_of[moved[0]]
+            if cluster >= 0:
+                self.team_clusters[from_team].remove(cluster)
+                self.team_clusters[to_team].append(cluster)
+            else:
+                for person in moved:
+                    self.singles[from_team][self.part[person]].remove(person)
+                    self.singles[to_team][self.part[person]].append(person)
+
+        for person_a, person_b in swaps:
+            self.team[person_a], self.team[person_b] = team_b, team_a
+
+
+def contracted_annealing(
+    context: RoomContext,
+    initial_assignment: np.ndarray,
+    initial_temp=1.0,
+    min_temp=0.001,
+    time_budget=MATCHING_TIME_BUDGET,
+    patience=MATCHING_PATIENCE,
+    max_iterations=None,
+    max_cluster_size=2,
+    rng=None,
+    telemetry=None,
+):
+    """
+    서로 꼬리를 흔든 참가자들을 묶음으로 고정한 축소 문제에서 담금질 기법으로 팀 매칭을 최적화
+
+    1) contract_mutual_waggings()로 묶음을 만들고 초기 해에서 묶음을 같은 팀으로 모음
+    2) 묶음과 한 명짜리 참가자를 단위로 교환하는 담금질 (묶음은 항상 같은 팀에 유지)
+    3) 결과는 참가자별 팀 번호이므로 그대로 펼친 해가 됨
+
+    꼬리흔들기가 많은 매칭룸에서는 서로 꼬리를 흔든 참가자를 떼어놓는 이동을 시도하지 않으므로
+    더 적은 이동으로 수렴한다. max_cluster_size는 묶음의 최대 인원수이며 나머지 인자(rng, telemetry 포함)는 simulated_annealing()과 같다.
+
+    return:
+        - best_assignment: 가장 좋은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - best_score: best_assignment의 점수
+    """
+    rng = get_rng(rng)
+    room = context.room
+    assignment, clusters = _gather_clusters(
+        room, initial_assignment, contract_mutual_waggings(context, max_cluster_size)
+    )
+    evaluator = IncrementalEvaluator(context, assignment)
+    sampler = UnitSampler(room, assignment, clusters, rng=rng)
+
+    # 파트 구성이 같은 두 단위를 교환하고, 채택된 교환만 샘플러에 반영
+    def on_result(swaps, accepted):
+        if accepted:
+            sampler.apply(swaps)
+
+    return anneal_moves(
+        evaluator,
+        sampler.sample,
+        on_result,
+        initial_temp=initial_temp,
+        min_temp=min_temp,
+        time_budget=time_budget,
+        patience=patience,
+        max_iterations=max_iterations,
+        rng=rng,
+        telemetry=telemetry,
+    )
@@ -0,0 +1,56 @@
+from .contraction import contracted_annealing
+from .greedy_assignment import greedy_team_assignment
+from .neighborhoods import adaptive_annealing
+from .room_context import RoomContext
+from .simulated_annealing import random_team_assignment, simulated_annealing
+from .tabu_search import tabu_search
+
+# 팀 매칭 최적화 엔진 목록
+# 모든 엔진은 engine(context, initial_assignment, rng=None, **kwargs) -> (best_assignment, best_score) 형식을 따름
+# 모든 무작위 선택에 rng(시드 또는 random.Random)를 사용하므로 같은 시드와 반복 횟수로 실행하면 결과가 같음
+ENGINES = {
+    "annealing": simulated_annealing,
+    "tabu": tabu_search,
+    "contracted": contracted_annealing,
+    "adaptive": adaptive_annealing,
+}
+
+# 분기 한정법(exact_solver.exact_search)은 결정적이므로 시드마다 반복하지 않는다.
+# EXACT_ENGINE을 고르면 pipeline.solve_matching()이 EXACT_WARM_START_ENGINE으로 멀티 스타트를 실행하고,
+# 그 결과를 첫 번째 상한으로 분기 한정법을 한 번만 실행한다. (두 단계가 실행 시간 예산을 나눠 씀)
+EXACT_ENGINE = "exact"
+EXACT_WARM_START_ENGINE = "annealing"
+
+
+def get_engine(name: str):
+    """
+    이름으로 팀 매칭 최적화 엔진을 반환
+    """
+    if name not in ENGINES:
+        raise ValueError(
+            f"지원하지 않는 매칭 엔진입니다: {name} (사용 가능: {', '.join([*ENGINES, EXACT_ENGINE])})"
+        )
+    return ENGINES[name]
+
+
+def _random_initializer(context: RoomContext, rng=None):
+    return random_team_assignment(context.room, rng)
+
+
+# 초기 해 생성 방법 목록
+# 모든 생성 함수는 initializer(context, rng) -> assignment 형식을 따름 (rng: 시드 또는 random.Random)
+INITIALIZERS = {
+    "random": _random_initializer,
+    "greedy": greedy_team_assignment,
+}
+
+
+def get_initializer(name: str):
+    """
+    이름으로 초기 해 생성 함수를 반환
+    """
+    if name not in INITIALIZERS:
+        raise ValueError(
+            f"지원하지 않는 초기 해 생성 방법입니다: {name} (사용 가능: {', '.join(INITIALIZERS)})"
+        )
+    return INITIALIZERS[name]
@@ -0,0 +1,409 @@
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from .category_score import _get_team_category_score
+from .incremental_score import (
+    W_CATEGORY_MEAN,
+    W_CATEGORY_VAR,
+    W_WAGGING_MEAN,
+    W_WAGGING_VAR,
+    get_solution_score,
+)
+from .parameter import MATCHING_EXACT_TIME_LIMIT, TEAM_COUNT, TEAM_SCORE_CACHE_SIZE
+from .room_context import RoomContext
+from .room_model import CATEGORY_KEYS, CATEGORY_SIZE, PARTS
+from .simulated_annealing import _get_team_template, evaluate_solution
+
+# 부동소수점 오차로 최적해를 잘라내지 않기 위한 여유값
+EPSILON = 1e-9
+
+
+def exact_search(
+    context: RoomContext,
+    initial_assignment: np.ndarray,
+    time_limit=MATCHING_EXACT_TIME_LIMIT,
+    team_count: int = TEAM_COUNT,
+) -> tuple[np.ndarray, float, float]:
+    """
+    분기 한정법으로 팀 매칭을 탐색하고 최적해와의 차이(gap)를 함께 반환
+
+    initial_assignment는 첫 번째 상한으로 사용하며, 더 좋은 해를 찾지 못하면 그대로 반환한다.
+    탐색 순서가 초기 해나 난수에 의존하지 않는 결정적 탐색이므로 멀티 스타트로 반복하지 않고
+    pipeline.solve_matching()에서 멀티 스타트 담금질 기법의 결과로 한 번만 실행한다.
+
+    input:
+        - context: RoomContext
+        - initial_assignment: 첫 번째 상한으로 사용할 팀 매칭
+        - time_limit: 실행 시간 제한 (초)
+        - team_count: 생성할 팀의 개수
+
+    return:
+        - best_assignment: 가장 좋은 팀 매칭
+        - best_score: best_assignment의 점수
+        - gap: best_score - (탐색하지 못한 해들의 점수 하한), 0이면 최적해임이 증명됨
+    """
+    return _BranchAndBound(context, initial_assignment, time_limit, team_count).run()
+
+
+class _BranchAndBound:
+    """
+    참가자를 한 명씩 팀에 배치하며 하한이 현재 최고 점수보다 나쁜 가지를 잘라내는 탐색
+
+    하한은 목적 함수의 각 항을 따로 낙관적으로 계산한다.
+        - 카테고리: 완성된 팀은 실제 점수, 미완성 팀은 남은 자리를 모두 한 선택지로 채웠을 때의 최대 점수
+        - 꼬리흔들기: 아직 결정되지 않은 꼬리흔들기가 모두 적중한다고 가정
+        - 실패 패널티: 적중할 수 있는 꼬리흔들기가 남지 않은 참가자 수
+          (흔든 상대가 자리가 없는 팀에 배치되었거나, 두 사람의 파트 자리가 함께 남은 팀이 없는 경우)
+        - 분산 항: 팀별 카테고리 점수와 참가자별 적중 횟수가 위 범위 안에 있을 때 평균 항과 합한 값의 최솟값
+          (_get_balanced_values, 분산을 0으로 두는 것보다 하한이 높아서 가지를 더 많이 잘라냄)
+
+    대칭 제거:
+        - 꼬리흔들기와 무관하고 파트와 카테고리 데이터가 같은 참가자는 서로 바꿔도 같은 해이므로
+          팀 번호가 줄어들지 않는 순서로만 배치
+        - 팀 템플릿이 같은 팀은 번호만 다른 같은 해를 만들므로 빈 팀은 그중 첫 번째 빈 팀에만 배치
+          (템플릿이 같은 팀들의 첫 번째 멤버가 팀 번호 순서로 고정됨)
+        - 그 밖에도 상태가 완전히 같은 팀이 여러 개면 그중 첫 번째 팀에만 배치
+
+    탐색 순서는 초기 해나 난수에 의존하지 않으므로 최적성을 증명하면 항상 같은 결과를 반환한다.
+    """
+
+    def __init__(
+        self,
+        context: RoomContext,
+        initial_assignment: np.ndarray,
+        time_limit: float,
+        team_count: int = TEAM_COUNT,
+    ):
+        room = context.room
+        team_template = _get_team_template(room, team_count)
+        if not team_template:
+            raise ValueError("요청하신 개수만큼의 팀을 생성할 수 없습니다.")
+
+        self.context = context
+        self.team_count = team_count
+        self.deadline = time.perf_counter() + time_limit
+        self.member_count = room.size
+        self.part = room.part.tolist()
+        self.category = room.category.tolist()
+
+        # 팀별 남은 파트 자리 수와 최종 인원수
+        self.vacancy = [[team[part] for part in PARTS] for team in team_template]
+        self.team_size = [sum(vacancy) for vacancy in self.vacancy]
+
+        # 템플릿이 같은 바로 앞 팀 번호 (없으면 -1)
+        self.previous_twin = [
+            max(
+                (other for other in range(team) if team_template[other] == team_template[team]),
+                default=-1,
+            )
+            for team in range(team_count)
+        ]
+
+        # 꼬리흔들기 (wagger, waggee) 쌍
+        self.waggings = list(zip(room.wagger.tolist(), room.waggee.tolist()))
+        self.wagging_rows = context.wagging_rows
+        self.involved = [False] * room.size
+        for wagger, waggee in self.waggings:
+            self.involved[wagger] = self.involved[waggee] = True
+
+        self.order, self.same_class = self._get_order()
+
+        # 탐색 상태
+        self.team_of = [-1] * room.size
+        self.team_members = [[] for _ in range(team_count)]
+        self.team_category_count = [
+            [[0] * CATEGORY_SIZE for _ in CATEGORY_KEYS] for _ in range(team_count)
+        ]
+        # 팀의 카테고리 점수 상한은 팀 구성의 카테고리 인원수와 남은 자리 수로만 정해지므로 캐시
+        # (배치를 되돌릴 때와 형제 가지에서 같은 팀 구성이 반복해서 나옴)
+        self.category_upper = lru_cache(maxsize=TEAM_SCORE_CACHE_SIZE)(
+            self._compute_category_upper
+        )
+        self.team_upper = [
+            self._get_category_upper(team) for team in range(team_count)
+        ]
+        self.wagging_count = [0] * room.size
+
+        self.best_assignment = np.asarray(initial_assignment).copy()
+        self.best_score = evaluate_solution(context, self.best_assignment, team_count)
+        self.found = False  # 탐색 중에 초기 해 이상의 해를 찾았는지 여부
+        self.timed_out = False
+        self.open_bound = float("inf")  # 시간 초과로 탐색하지 못한 가지들의 하한
+
+    def run(self) -> tuple[np.ndarray, float, float]:
+        self._search(0, self._get_lower_bound())
+
+        gap = 0.0
+        if self.timed_out:
+            gap = max(self.best_score - self.open_bound, 0.0)
+        return self.best_assignment, self.best_score, gap
+
+    def _get_order(self):
+        """
+        배치 순서를 결정
+
+        꼬리흔들기와 관련된 참가자를 연결된 순서대로 먼저 배치해서 적중 여부가 빨리 결정되게 하고,
+        나머지는 (파트, 카테고리 데이터) 순으로 정렬해서 같은 참가자끼리 연속되게 한다.
+        """
+        order = []
+        visited = [False] * self.member_count
+        neighbors = [[] for _ in range(self.member_count)]
+        for wagger, waggee in self.waggings:
+            neighbors[wagger].append(waggee)
+            neighbors[waggee].append(wagger)
+
+        involved = [p for p in range(self.member_count) if self.involved[p]]
+        involved.sort(key=lambda p: (-len(neighbors[p]), p))
+        for start in involved:
+            if visited[start]:
+                continue
+            visited[start] = True
+            queue = [start]
+            while queue:
+                person = queue.pop(0)
+                order.append(person)
+                for other in sorted(neighbors[person]):
+                    if not visited[other]:
+                        visited[other] = True
+                        queue.append(other)
+
+        others = [p for p in range(self.member_count) if not self.involved[p]]
+        others.sort(key=lambda p: (self.part[p], self.category[p], p))
+        order.extend(others)
+
+        same_class = [False] * len(order)
+        for i in range(1, len(order)):
+            prev, person = order[i - 1], order[i]
+            same_class[i] = (
+                not self.involved[prev]
+                and not self.involved[person]
+                and self.part[prev] == self.part[person]
+                and self.category[prev] == self.category[person]
+            )
+        return order, same_class
+
+    def _search(self, depth: int, bound: float):
+        if self.timed_out or time.perf_counter() > self.deadline:
+            self.timed_out = True
+            self.open_bound = min(self.open_bound, bound)
+            return
+
+        if depth == len(self.order):
+            self._update_best()
+            return
+
+        person = self.order[depth]
+        part = self.part[person]
+        first_team = self.team_of[self.order[depth - 1]] if self.same_class[depth] else 0
+
+        # 1) 배치 가능한 팀 중 상태가 같은 팀은 첫 번째 팀만 남김
+        candidates = []
+        seen = set()
+        for team in range(first_team, self.team_count):
+            if self.vacancy[team][part] == 0:
+                continue
+            twin = self.previous_twin[team]
+            if not self.team_members[team] and twin >= 0 and not self.team_members[twin]:
+                continue
+            key = (
+                tuple(self.vacancy[team]),
+                tuple(map(tuple, self.team_category_count[team])),
+                tuple(m for m in self.team_members[team] if self.involved[m]),
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+
+            self._place(person, team)
+            candidates.append((self._get_lower_bound(), team))
+            self._remove(person, team)
+
+        # 2) 하한이 좋은 팀부터 탐색
+        candidates.sort()
+        for child_bound, team in candidates:
+            if self._is_pruned(child_bound):
+                break
+            self._place(person, team)
+            self._search(depth + 1, child_bound)
+            self._remove(person, team)
+
+            if self.timed_out:
+                self.open_bound = min(self.open_bound, bound)
+                return
+
+    def _is_pruned(self, bound: float) -> bool:
+        # 탐색 중 해를 찾기 전에는 초기 해와 같은 점수의 해도 탐색 (결과가 초기 해에 의존하지 않도록)
+        if self.found:
+            return bound >= self.best_score - EPSILON
+        return bound > self.best_score + EPSILON
+
+    def _update_best(self):
+        category_scores = self.team_upper  # 모든 팀이 완성되었으므로 실제 점수
+        wagging_sum = sum(self.wagging_count)
+        wagging_square_sum = sum(count * count for count in self.wagging_count)
+        score = get_solution_score(
+            category_scores,
+            wagging_sum,
+            wagging_square_sum,
+            self.wagging_count.count(0),
+            self.member_count,
+        )
+        if (self.found and score < self.best_score - EPSILON) or (
+            not self.found and score <= self.best_score + EPSILON
+        ):
+            self.best_assignment = np.asarray(self.team_of, dtype=np.int64)
+            self.best_score = score
+            self.found = True
+
+    def _place(self, person: int, team: int):
+        members = self.team_members[team]
+        rows = self.wagging_rows
+        self.wagging_count[person] = sum(rows[person][member] for member in members)
+        for member in members:
+            if rows[member][person]:
+                self.wagging_count[member] += 1
+
+        members.append(person)
+        self.team_of[person] = team
+        self.vacancy[team][self.part[person]] -= 1
+        for category_idx, value_idx in enumerate(self.category[person]):
+            self.team_category_count[team][category_idx][value_idx] += 1
+        self.team_upper[team] = self._get_category_upper(team)
+
+    def _remove(self, person: int, team: int):
+        members = self.team_members[team]
+        members.pop()
+        rows = self.wagging_rows
+        for member in members:
+            if rows[member][person]:
+                self.wagging_count[member] -= 1
+        self.wagging_count[person] = 0
+
+        self.team_of[person] = -1
+        self.vacancy[team][self.part[person]] += 1
+        for category_idx, value_idx in enumerate(self.category[person]):
+            self.team_category_count[team][category_idx][value_idx] -= 1
+        self.team_upper[team] = self._get_category_upper(team)
+
+    def _get_category_upper(self, team: int) -> float:
+        """
+        팀의 카테고리 점수 상한 (완성된 팀은 실제 점수)
+        """
+        return self.category_upper(
+            tuple(map(tuple, self.team_category_count[team])),
+            sum(self.vacancy[team]),
+            self.team_size[team],
+        )
+
+    def _compute_category_upper(self, count: tuple, remaining: int, size: int) -> float:
+        """
+        카테고리 인원수가 count이고 remaining자리가 남은 size명 팀의 카테고리 점수 상한
+        """
+        if remaining == 0:
+            return _get_team_category_score(
+                count, self.context.category_weight, self.context.max_weight
+            )
+
+        # 남은 자리가 모두 한 선택지를 고른 참가자로 채워진다고 가정
+        team_score = 0
+        for category_idx, values in enumerate(count):
+            weights = self.context.category_weight[category_idx]
+            team_score += max(
+                round(min(value + remaining, size) / size, 2) * weights[value_idx]
+                for value_idx, value in enumerate(values)
+            )
+        return round(team_score / len(count) / self.context.max_weight, 2) * 100
+
+    def _get_lower_bound(self) -> float:
+        """
+        현재 부분 배치에서 만들 수 있는 모든 해의 점수 하한
+        """
+        team_of = self.team_of
+
+        # hostable[a][b]: 파트 a와 파트 b의 남은 자리가 함께 있는 팀이 존재하는지 여부
+        # (같은 파트이면 그 파트의 자리가 2개 이상 남아야 함)
+        hostable = [[False] * len(PARTS) for _ in PARTS]
+        for vacancy in self.vacancy:
+            for part_a, vacancy_a in enumerate(vacancy):
+                if vacancy_a == 0:
+                    continue
+                for part_b, vacancy_b in enumerate(vacancy):
+                    if vacancy_b > (part_a == part_b):
+                        hostable[part_a][part_b] = True
+
+        # 참가자별로 아직 결정되지 않았지만 적중할 수 있는 꼬리흔들기 수
+        pending = [0] * self.member_count
+        for wagger, waggee in self.waggings:
+            team_a, team_b = team_of[wagger], team_of[waggee]
+            if team_a >= 0 and team_b >= 0:
+                continue
+            if team_a >= 0:
+                reachable = self.vacancy[team_a][self.part[waggee]] > 0
+            elif team_b >= 0:
+                reachable = self.vacancy[team_b][self.part[wagger]] > 0
+            else:
+                reachable = hostable[self.part[wagger]][self.part[waggee]]
+            if reachable:
+                pending[wagger] += 1
+
+        # 적중이 불가능한 참가자: 아직 적중이 없고 적중할 수 있는 꼬리흔들기도 남지 않은 경우
+        fail_count = sum(
+            1
+            for person in range(self.member_count)
+            if self.wagging_count[person] == 0 and not pending[person]
+        )
+
+        # 평균과 분산 항은 각 값이 가질 수 있는 범위 안에서 함께 최소화
+        # (카테고리: 완성된 팀은 실제 점수, 미완성 팀은 0 ~ 상한 / 꼬리흔들기: 현재 적중 횟수 ~ 남은 꼬리흔들기가 모두 적중)
+        category_scores = _get_balanced_values(
+            [
+                upper if sum(self.vacancy[team]) == 0 else 0.0
+                for team, upper in enumerate(self.team_upper)
+            ],
+            self.team_upper,
+            W_CATEGORY_MEAN / (2 * W_CATEGORY_VAR),
+        )
+        wagging_counts = _get_balanced_values(
+            self.wagging_count,
+            [count + extra for count, extra in zip(self.wagging_count, pending)],
+            W_WAGGING_MEAN / (2 * W_WAGGING_VAR),
+        )
+        wagging_sum = sum(wagging_counts)
+        return get_solution_score(
+            category_scores,
+            wagging_sum,
+            sum(count * count for count in wagging_counts),
+            fail_count,
+            self.member_count,
+        )
+
+
+def _get_balanced_values(lower: list, upper: list, spread: float) -> list:
+    """
+    lower <= value <= upper 범위에서 -평균 + 분산 / (2 * spread)를 최소로 하는 값 목록
+
+    목적 함수의 (-가중치 * 평균 + 가중치 * 분산) 꼴의 항은 spread = 평균 가중치 / (2 * 분산 가중치)일 때 이 식에 비례한다.
+    최적해는 value = clip(c, lower, upper)이고 c = 평균 + spread이다.
+    (평균보다 spread 이상 큰 값은 더 키워도 분산 증가가 평균 증가보다 크므로 c에서 멈춤)
+    경계값을 작은 순서로 지나면서 범위 안에 있는 값(free)과 경계에 고정된 값의 합(fixed)을 갱신하고,
+    c = (fixed + count * spread) / (count - free)가 현재 구간 안에 들어오는 곳을 찾는다.
+    """
+    count = len(upper)
+    if max(upper) - sum(upper) / count <= spread:
+        return upper
+
+    fixed, free = sum(lower), 0
+    for x, is_upper in sorted([(low, False) for low in lower] + [(high, True) for high in upper]):
+        if free < count:
+            c = (fixed + count * spread) / (count - free)
+            if c <= x:
+                break
+        if is_upper:
+            fixed, free = fixed + x, free - 1
+        else:
+            fixed, free = fixed - x, free + 1
+    else:
+        c = fixed / count + spread
+    return [min(max(c, low), high) for low, high in zip(lower, upper)]
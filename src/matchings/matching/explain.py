@@ -1,50 +1,38 @@
-from .parameter import CATEGORY, PART_MIN
 from .category_score import _get_team_category_rate
-from .wagging_score import _get_wagging_dict
+from .room_context import RoomContext
+from .room_model import MBTI_KEYS, PARTS
+from .explanation_cache import get_cache_key, get_explanations, save_explanations
+from .circuit_breaker import CircuitBreaker
+from .parameter import (
+    PART_MIN,
+    EXPLANATION_BREAKER_COOLDOWN,
+    EXPLANATION_BREAKER_THRESHOLD,
+    EXPLANATION_TIMEOUT,
+    EXPLANATION_WORKERS,
+)
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor, wait
+import numpy as np
+import math
 import os
 
 load_dotenv()
 
+LLM_MODEL = "gpt-5.1"
+
+# 프롬프트나 응답 형식을 바꾸면 올려서 이전 프롬프트로 만든 캐시된 설명글을 사용하지 않도록 함
+PROMPT_VERSION = "3"  # 2: 팀별로 따로 호출, 3: 팀 하나만 보고 설명하도록 프롬프트 수정
+
 
-def _get_team_info_list(team_list, waggings):
+def _get_team_info_list(context: RoomContext, assignment: np.ndarray):
     """
     팀 매칭 결과에 대한 설명글을 작성하기 위해 LLM에 전달할 팀별 통계 데이터를 반환
 
     Args:
-        - team_list = [
-            [
-                {
-                    "id": 1,
-                    "part": "",
-                    "team_vibe": "learning",
-                    "active_hours": "day",
-                    "meeting_preference": "offline",
-                    "ei": 0.65,
-                    "sn": 0.73,
-                    "tf": 0.42,
-                    "jp": 0.58,
-                    "devti": "골든 리트리버"
-                },
-                {member2},
-                ...
-            ],
-            [],
-            [],
-            ...
-        ]
-
-        - waggings = [
-            {
-                "id": 1,
-                "wagger": 1,
-                "waggee": 3
-            },
-            {wagging info},
-            {wagging info}
-        ]
+        - context: RoomContext
+        - assignment = [0, 3, 1, ...] 참가자 인덱스별 팀 번호
 
     Returns:
         - team_info_list = [
@@ -67,52 +55,41 @@ def _get_team_info_list(team_list, waggings):
             ...
         ]
     """
+    room = context.room
     team_info_list = []
-    wagging_dict = _get_wagging_dict(waggings)
 
-    for team in team_list:
+    for members in room.get_team_members(assignment):
         team_info = {part: 0 for part in PART_MIN.keys()}
 
         # 파트별 인원수
-        for member in team:
-            team_info[member["part"]] += 1
+        for member in members:
+            team_info[PARTS[room.part[member]]] += 1
 
         # 팀별 가장 높은 카테고리 데이터와 비율
-        team_category_rate = _get_team_category_rate(team)
+        team_category_rate = _get_team_category_rate(room, members)
         for key, rate_dict in team_category_rate.items():
             max_value, rate = max(rate_dict.items(), key=lambda x: x[1])
             team_info[key] = (max_value, rate)
 
-        # 팀별 mbti 통계
-        ei_mean = sum([member["ei"] for member in team]) / len(team)
-        sn_mean = sum([member["sn"] for member in team]) / len(team)
-        tf_mean = sum([member["tf"] for member in team]) / len(team)
-        jp_mean = sum([member["jp"] for member in team]) / len(team)
-        team_info["ei"] = ei_mean
-        team_info["sn"] = sn_mean
-        team_info["tf"] = tf_mean
-        team_info["jp"] = jp_mean
+        # 팀별 mbti 통계 (프로필이 없는 참가자는 제외)
+        team_mbti = room.mbti[members]
+        for mbti_idx, key in enumerate(MBTI_KEYS):
+            values = team_mbti[:, mbti_idx]
+            values = values[~np.isnan(values)]
+            team_info[key] = float(values.mean()) if len(values) else None
 
         # 팀에 있는 강아지 목록 추가
-        team_info["poppy_list"] = [member["devti"] for member in team]
+        team_info["poppy_list"] = [room.devti[member] for member in members]
 
         # 꼬리흔들기 짝궁 구하기
         wagging_pairs = []
-        for i in range(len(team)):
-            member1 = team[i]
-            waggees = wagging_dict.get(member1["id"], set())
-
-            for j in range(len(team)):
-                if i == j:
-                    continue
-                member2 = team[j]
-                if member2["id"] in waggees:
-                    wagging_pairs.append(
-                        [
-                            f"{member1['devti']}({member1['part']})",
-                            f"{member2['devti']}({member2['part']})",
-                        ]
-                    )
+        for wagger, waggee in context.get_team_wagging_pairs(members):
+            wagging_pairs.append(
+                [
+                    f"{room.devti[wagger]}({PARTS[room.part[wagger]]})",
+                    f"{room.devti[waggee]}({PARTS[room.part[waggee]]})",
+                ]
+            )
         team_info["wagging_pairs"] = wagging_pairs
 
         team_info_list.append(team_info)
@@ -120,38 +97,145 @@ def _get_team_info_list(team_list, waggings):
     return team_info_list
 
 
-def get_matching_explanations(team_list, waggings):
+def get_matching_explanations(context: RoomContext, assignment: np.ndarray):
     """
     Args:
-        - team_list = [
-            [
-                {
-                    "id": 1,
-                    "part": "",
-                    "team_vibe": "learning",
-                    "active_hours": "day",
-                    "meeting_preference": "offline",
-                    "ei": 0.65,
-                    "sn": 0.73,
-                    "tf": 0.42,
-                    "jp": 0.58,
-                    "devti": "골든 리트리버"
-                },
-                {member2},
-                ...
-            ],
-            [],
-            [],
-            ...
-        ]
+        - context: RoomContext
+        - assignment = [0, 3, 1, ...] 참가자 인덱스별 팀 번호
+
+    Returns:
+        - reasons: 팀 번호 순서의 팀 매칭 설명글 리스트
+
+    팀 통계와 프롬프트 버전이 같은 팀의 설명글은 캐시에서 가져오고,
+    캐시에 없는 팀만 팀별로 동시에 LLM을 호출한다. (모두 캐시에 있으면 호출하지 않음)
+    호출이 실패하거나 시간을 넘긴 팀은 get_fallback_explanation()의 설명글을 사용하며 캐시에 저장하지 않는다.
+    """
+    team_info_list = _get_team_info_list(context, assignment)
+    keys = [
+        get_cache_key(team_info, f"{PROMPT_VERSION}:{LLM_MODEL}")
+        for team_info in team_info_list
+    ]
+    reasons = get_explanations(keys)
+
+    missing = [i for i, reason in enumerate(reasons) if reason is None]
+    generated = _generate_explanations([team_info_list[i] for i in missing])
+    for i, reason in zip(missing, generated):
+        reasons[i] = (
+            reason if reason is not None else get_fallback_explanation(team_info_list[i])
+        )
+    save_explanations(
+        {keys[i]: reason for i, reason in zip(missing, generated) if reason is not None}
+    )
+
+    fallback_count = generated.count(None)
+    print(
+        f"팀 매칭 설명글: 캐시 {len(keys) - len(missing)}개 팀, "
+        f"새로 생성 {len(missing) - fallback_count}개 팀, 대체 설명글 {fallback_count}개 팀"
+    )
+    return reasons
+
+
+# LLM 호출이 연속으로 실패하면 잠시 호출하지 않고 대체 설명글을 사용 (Celery 워커 프로세스 단위)
+_breaker = CircuitBreaker(EXPLANATION_BREAKER_THRESHOLD, EXPLANATION_BREAKER_COOLDOWN)
+
+
+def _call_llm_if_allowed(team_info: dict, timeout: float):
+    """
+    차단기가 호출을 막고 있으면 None, 아니면 call_llm()의 설명글
+    """
+    if not _breaker.allow():
+        return None
+    return call_llm(team_info, timeout)
+
+
+def _generate_explanations(
+    team_info_list: list[dict],
+    timeout: float = EXPLANATION_TIMEOUT,
+    max_workers: int = EXPLANATION_WORKERS,
+) -> list:
+    """
+    팀별 LLM 호출을 스레드 풀에서 동시에 실행
+
+    호출마다 timeout초의 제한 시간을 두며, 끝나지 않은 호출은 기다리지 않는다.
 
     Returns:
-        - reasons: 각 팀마다 팀 매칭 설명을 담아서 반환
+        - reasons: 팀별 설명글 (실패, 시간 초과, 차단기로 호출하지 않은 팀은 None)
+    """
+    reasons = [None] * len(team_info_list)
+    if not team_info_list:
+        return reasons
+
+    max_workers = max(1, min(max_workers, len(team_info_list)))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {
+        executor.submit(_call_llm_if_allowed, team_info, timeout): i
+        for i, team_info in enumerate(team_info_list)
+    }
+    # 팀 수가 max_workers보다 많으면 나중에 시작하는 호출도 제한 시간을 온전히 갖도록 대기 시간을 늘림
+    rounds = math.ceil(len(futures) / max_workers)
+    done, not_done = wait(futures, timeout=timeout * rounds)
+
+    for future in done:
+        i = futures[future]
+        try:
+            reasons[i] = future.result()
+        except Exception as e:
+            print(f"{i + 1}번째 팀의 설명글 생성에 실패했습니다: {str(e)}")
+            _breaker.record_failure()
+            continue
+        if reasons[i] is not None:
+            _breaker.record_success()
+    for future in not_done:
+        print(f"{futures[future] + 1}번째 팀의 설명글 생성이 {timeout}초를 넘겨 대체 설명글을 사용합니다.")
+        _breaker.record_failure()
+
+    # 시간을 넘긴 호출은 OpenAI 클라이언트의 timeout으로 곧 끝나므로 기다리지 않고 반환
+    executor.shutdown(wait=False, cancel_futures=True)
+    return reasons
+
+
+VIBE_TEXT = {
+    "learning": "서로 배우면서 성장하는 분위기",
+    "professional": "좋은 결과를 내는 전문적인 분위기",
+}
+ACTIVE_HOURS_TEXT = {"day": "낮", "night": "밤"}
+MEETING_TEXT = {"online": "온라인", "offline": "오프라인"}
+MBTI_LETTERS = {"ei": "EI", "sn": "SN", "tf": "TF", "jp": "JP"}
+
+
+def get_fallback_explanation(team_info: dict) -> str:
     """
-    team_info_list = _get_team_info_list(team_list, waggings)
-    response = call_llm(team_info_list)
+    LLM 없이 팀 통계만으로 만드는 설명글 (같은 팀 통계에는 항상 같은 설명글)
+    """
+    poppies = ", ".join(dict.fromkeys(team_info["poppy_list"]))
+    lines = [f"{poppies} 친구들이 모인 팀이에요!"]
+
+    # MBTI 평균이 0.5에서 가장 멀리 떨어진 지표를 팀의 성향으로 소개 (0에 가까우면 앞 글자)
+    mbti = [(key, team_info[key]) for key in MBTI_KEYS if team_info[key] is not None]
+    if mbti:
+        key, value = max(mbti, key=lambda item: abs(item[1] - 0.5))
+        letter = MBTI_LETTERS[key][int(value >= 0.5)]
+        lines.append(f"이 팀은 {letter} 성향이 강한 팀이에요.")
+
+    vibe, vibe_rate = team_info["team_vibe"]
+    hours, hours_rate = team_info["active_hours"]
+    meeting, meeting_rate = team_info["meeting_preference"]
+    lines.append(
+        f"팀원의 {vibe_rate:.0%}가 {VIBE_TEXT[vibe]}를 원하고, "
+        f"{hours_rate:.0%}가 {ACTIVE_HOURS_TEXT[hours]}에 활동하기를 좋아해요."
+    )
+    lines.append(
+        f"회의는 {MEETING_TEXT[meeting]}으로 만나기를 선호하는 팀원이 {meeting_rate:.0%}예요."
+    )
 
-    return response
+    if team_info["wagging_pairs"]:
+        pairs = ", ".join(
+            f"{wagger} → {waggee}" for wagger, waggee in team_info["wagging_pairs"][:3]
+        )
+        lines.append(f"서로에게 꼬리를 흔든 친구들도 같은 팀이 되었어요. ({pairs})")
+
+    lines.append("즐거운 팀 프로젝트 되세요! 🐾")
+    return "\n".join(lines)
 
 
 class TeamVibe(BaseModel):
@@ -173,22 +257,20 @@ class Team(BaseModel):
     team_vibe: TeamVibe
     active_hours: ActiveHours
     meeting_preference: MeetingPreference
-    ei: float
-    sn: float
-    tf: float
-    jp: float
+    ei: float | None
+    sn: float | None
+    tf: float | None
+    jp: float | None
     poppy_list: list[str]
     reason: str
 
 
-class TeamList(BaseModel):
-    teams: list[Team]
-
-
-def call_llm(team_info_list):
+def call_llm(team_info: dict, timeout: float = EXPLANATION_TIMEOUT) -> str:
     """
-    Arge:
-        - type = "gemini" || "gpt"
+    팀 하나의 설명글을 LLM으로 생성 (timeout초 안에 응답이 없으면 예외 발생)
+
+    Args:
+        - team_info: _get_team_info_list()의 항목 하나
     """
     BASE_DIR = os.path.dirname(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -197,9 +279,10 @@ def call_llm(team_info_list):
 우리는 IT 개발 동아리에서 팀 매칭 서비스를 운영 중입니다. 
 팀 매칭 참가자들의 선호와 성격 유형을 바탕으로 재미있는 팀 매칭 경험을 제공하는 것이 서비스의 목표입니다.
 주요 특징으로는 mbti 검사 결과를 강아지와 매칭하여 보여주는 devti라는 검사를 만들어서 사용 중입니다. 예를 들어 ENFP는 골든 리트리버에 해당합니다.
-팀 매칭 알고리즘의 결과로 나온 팀들의 정보를 당신에게 전달해주면 각 팀마다 왜 이렇게 팀이 매칭되었는지, 그리고 다른 팀에 비해 그 팀이 가진 장점이 무엇인지 진지한 분위기 보다는 재미있는 분위기로 설명해줘야합니다.
+팀 매칭 알고리즘의 결과로 나온 팀 하나의 정보를 당신에게 전달해주면 왜 이렇게 팀이 매칭되었는지, 그리고 이 팀의 특징과 장점이 무엇인지 진지한 분위기 보다는 재미있는 분위기로 설명해줘야합니다.
+다른 팀의 정보는 전달되지 않으니 다른 팀과 비교하는 표현은 사용하지 말아주세요.
 
-당신에게 주어지는 팀들의 정보 "team_info_list"에는 다음과 같은 데이터들이 포함되어있습니다.
+당신에게 주어지는 팀의 정보 "team_info"에는 다음과 같은 데이터들이 포함되어있습니다.
 pm, de, fe, be: 팀의 파트별 인원수입니다.
 - pm (Product Manager): 팀의 기획과 관리를 담당하는 프로덕트 매니저
 - de (Data Engineer): UI/UX 디자이너
@@ -224,7 +307,7 @@ meeting_preference: (미팅 방식, 비율)
     "offline": 오프라인으로 만나 회의하는 것을 선호합니다.
 비율: 해당 미팅 방식을 선호하는 팀원의 비율 (0~1 사이의 실수)
 
-ei, sn, tf, jp: 각 팀의 MBTI 지표의 평균값입니다. (0~1 사이의 실수)
+ei, sn, tf, jp: 팀원들의 MBTI 지표의 평균값입니다. (0~1 사이의 실수, 프로필이 있는 팀원이 없으면 null)
 0에 가까울수록 각각 e, s, t, j 성향에 가깝고, 1에 가까울수록 i, n, f, p 성향에 가깝습니다.
 
 poppy_list: 팀원들의 devti(강아지 유형) 리스트
@@ -235,42 +318,45 @@ wagging_pairs: 팀에서 누가 누구를 좋아하는지를 담은 리스트입
 
 팀 매칭이유 설명글 내용 예시1:
 치와와, 도베르만, 시바견, 시고르자브종이 뛰어다니는 팀이네요!
-이 팀은 다른 팀에 비해 E 성향이 강한 팀이에요.
+이 팀은 E 성향이 강한 팀이에요.
 낮에 활동하기를 좋아하고 배우면서 성장하기를 원하는 팀원들이 모이도록있게 매칭이 되었어요.
 프론트의 치와와가 시바견을 좋아해요~ 서로 인사해보는건 어때요? 백엔드 파트의 도베르만도 시고르자브종이 마음에 드나봐요.
 
 팀 매칭이유 설명글 내용 예시2:
 보더콜리, 비글, 웰시코기, 푸들, 허스키가 뭉쳤네요.
-이 팀은 다른 팀에 비해 T성향을 강하게 매칭되었어요.
+이 팀은 T 성향이 강한 팀원들로 매칭되었어요.
 밤에 활동하기를 좋아하고 전문적인 프로젝트를 원하는 팀원들이 모이도록 해봤어요.
 푸들(백)이 보더콜리와 비글에 관심이 있었는데 같은 팀이 되이 되었네요. 팀플 열심히 해봐요!
 
 팀 매칭이유 설명글 내용 예시3:
 포메라니안, 진돗개, 사모예드, 그리고 허스키가 무려 3마리나 있네요!
-이 팀은 다른 팀에 비해 P성향이 엄청 강하게 매칭되었어요.
+이 팀은 P 성향이 엄청 강한 팀이에요.
 밤에 활동하기를 좋아하는 팀원이 최대한 모이도록 매칭해봤어요. 빡센 분위기 보다는 차근차근 학습하는 분위기를 선호하는 팀이에요.
 백엔드에 살고있는 허스키가 디자인 파트와 프론트 파트에 있는 허스키를 좋아해요. 사모예드끼리 즐겁게 공놀이라도 해봐요.
 
 주의사항:
 설명글은 공백 포함 300자 보다는 많게 작성해주세요. (약간의 이모지 사용도 허용)
-team_info_list에 팀별로 팀 매칭 이유를 생성하여 "reason" 속성에 담아서 반환해주세요. 반드시 "reason" 속성만 추가해야하며, 다른 속성 값은 team_info_list의 값을 그대로 유지해주세요.
+team_info의 팀 매칭 이유를 생성하여 "reason" 속성에 담아서 반환해주세요. 반드시 "reason" 속성만 추가해야하며, 다른 속성 값은 team_info의 값을 그대로 유지해주세요.
 wagging(와깅), team_vibe, learning 등 코드에서 사용했던 단어는 설명글에 포함하지 말아줘.
 백엔드의 푸들, 프론트의 사모예드와 같이 파트 이름까지 알려주는 표현은 똑같은 강아지들이 있어서 구별이 필요할 때 말고는 최대한 자제해줘.
 자기자신에게 꼬리를 흔드는 것은 불가능해. 설명 생성에 주의해줘.
 
 
-team_info_list: """
+team_info: """
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    # 제한 시간을 넘기지 않도록 재시도하지 않음
+    client = OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"), timeout=timeout, max_retries=0
+    )
     response = client.beta.chat.completions.parse(
-        model="gpt-5.1",
+        model=LLM_MODEL,
         messages=[
             {
                 "role": "system",
                 "content": prompt,
             },
-            {"role": "user", "content": f"{team_info_list}"},
+            {"role": "user", "content": f"{team_info}"},
         ],
-        response_format=TeamList,
+        response_format=Team,
     )
-    return response.choices[0].message.parsed.teams
+    return response.choices[0].message.parsed.reason
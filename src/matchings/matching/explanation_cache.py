@@ -0,0 +1,92 @@
+import hashlib
+import json
+import time
+
+import redis
+
+from .parameter import (
+    EXPLANATION_CACHE_SIZE,
+    EXPLANATION_CACHE_TIMEOUT,
+    EXPLANATION_CACHE_TTL,
+    EXPLANATION_CACHE_URL,
+)
+
+KEY_PREFIX = "matching:explanation:"
+INDEX_KEY = "matching:explanation-index"  # 설명글 키 -> 저장 시각 (크기 제한용 sorted set)
+
+_client = None
+
+
+def _get_client() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            EXPLANATION_CACHE_URL,
+            socket_connect_timeout=EXPLANATION_CACHE_TIMEOUT,
+            socket_timeout=EXPLANATION_CACHE_TIMEOUT,
+        )
+    return _client
+
+
+def get_cache_key(team_info: dict, prompt_version: str) -> str:
+    """
+    팀 통계(_get_team_info_list()의 항목 하나)와 프롬프트 버전으로 만든 캐시 키
+
+    팀 번호는 팀 통계에 포함되지 않으므로 재매칭에서 같은 구성의 팀이 다른 번호로 나와도 같은 키가 된다.
+    """
+    digest = hashlib.sha256()
+    digest.update(prompt_version.encode())
+    digest.update(b"|")
+    digest.update(
+        json.dumps(team_info, sort_keys=True, ensure_ascii=False).encode()
+    )
+    return KEY_PREFIX + digest.hexdigest()
+
+
+def get_explanations(keys: list[str]) -> list[str]:
+    """
+    캐시된 설명글을 한 번에 조회
+
+    return:
+        - explanations: 키별 설명글 (없으면 None), Redis에 연결할 수 없으면 모두 None
+    """
+    if not keys:
+        return []
+    try:
+        values = _get_client().mget(keys)
+    except redis.RedisError as e:
+        print(f"설명글 캐시를 읽을 수 없어 모든 팀의 설명글을 새로 생성합니다. ({e})")
+        return [None] * len(keys)
+    return [None if value is None else value.decode() for value in values]
+
+
+def save_explanations(
+    explanations: dict[str, str],
+    ttl: int = EXPLANATION_CACHE_TTL,
+    max_size: int = EXPLANATION_CACHE_SIZE,
+):
+    """
+    설명글을 ttl초 동안 캐시에 저장하고, 저장한 설명글이 max_size개를 넘으면 가장 오래 전에 저장한 것부터 삭제
+
+    만료된 키도 저장 시각 인덱스에 남아 있으므로 저장할 때마다 인덱스에서 함께 정리한다.
+    캐시에 저장하지 못해도 설명글 생성은 실패로 보지 않는다.
+    """
+    if not explanations:
+        return
+    now = time.time()
+    try:
+        client = _get_client()
+        pipeline = client.pipeline()
+        for key, explanation in explanations.items():
+            pipeline.set(key, explanation, ex=ttl)
+        pipeline.zadd(INDEX_KEY, {key: now for key in explanations})
+        pipeline.zremrangebyscore(INDEX_KEY, "-inf", now - ttl)
+        pipeline.zcard(INDEX_KEY)
+        size = pipeline.execute()[-1]
+
+        if size > max_size:
+            evicted = client.zpopmin(INDEX_KEY, size - max_size)
+            if evicted:
+                client.delete(*(key for key, _ in evicted))
+    except redis.RedisError as e:
+        print(f"설명글 캐시를 저장할 수 없습니다. ({e})")
@@ -0,0 +1,145 @@
+import numpy as np
+
+from .category_score import _get_team_category_score
+from .parameter import TEAM_COUNT
+from .rng import get_rng
+from .room_context import RoomContext
+from .room_model import CATEGORY_KEYS, CATEGORY_SIZE, PARTS
+from .simulated_annealing import _get_team_template
+
+
+def greedy_team_assignment(context: RoomContext, rng=None) -> np.ndarray:
+    """
+    탐욕적으로 초기 팀 매칭을 생성 (random_team_assignment 대체용)
+
+    1) 서로 꼬리를 흔든 두 참가자를 먼저 같은 팀에 배치
+    2) 남은 참가자를 무작위 순서로 점수가 가장 많이 좋아지는 팀에 배치
+       (카테고리 점수 증가량 + 꼬리흔들기 실패 패널티 감소량, 목적 함수와 같은 가중치)
+
+    두 단계 모두 _get_team_template()의 파트별 인원수를 그대로 지키며,
+    같은 점수의 팀이 여러 개면 무작위로 골라서 멀티 스타트마다 다른 초기 해를 만든다.
+
+    input:
+        - context: RoomContext
+        - rng: 시드 또는 random.Random (배치 순서와 동점 팀 선택에 사용)
+
+    return:
+        - assignment = [0, 3, 1, ...] 참가자 인덱스별 팀 번호
+    """
+    rng = get_rng(rng)
+    room = context.room
+    team_template = _get_team_template(room)
+    if not team_template:
+        raise ValueError("요청하신 개수만큼의 팀을 생성할 수 없습니다.")
+
+    # 팀별로 남은 파트 자리 수
+    vacancy = [[team[part] for part in PARTS] for team in team_template]
+    part = room.part.tolist()
+    category = room.category.tolist()
+
+    # 팀별 카테고리 데이터 인원수와 카테고리 점수 (빈 팀은 0점)
+    team_category_count = [
+        [[0] * CATEGORY_SIZE for _ in CATEGORY_KEYS] for _ in range(TEAM_COUNT)
+    ]
+    team_scores = [0.0] * TEAM_COUNT
+
+    # 배치된 참가자의 꼬리흔들기 적중 횟수
+    wagging_rows = context.wagging_rows
+    wagging_count = [0] * room.size
+    team_members = [[] for _ in range(TEAM_COUNT)]
+
+    assignment = np.full(room.size, -1, dtype=np.int64)
+
+    def get_added_count(team, people):
+        count = [list(values) for values in team_category_count[team]]
+        for person in people:
+            for category_idx, value_idx in enumerate(category[person]):
+                count[category_idx][value_idx] += 1
+        return count
+
+    def get_category_gain(team, people):
+        count = get_added_count(team, people)
+        score = _get_team_category_score(
+            count, context.category_weight, context.max_weight
+        )
+        return score - team_scores[team], count
+
+    def get_wagging_changes(team, people):
+        # people이 팀에 들어왔을 때 적중 횟수가 바뀌는 참가자 목록 [(참가자, 증가량), ...]
+        changes = []
+        for person in people:
+            hit_count = sum(wagging_rows[person][other] for other in people)
+            for member in team_members[team]:
+                hit_count += wagging_rows[person][member]
+                if wagging_rows[member][person]:
+                    changes.append((member, 1))
+            changes.append((person, hit_count))
+        return changes
+
+    def get_gain(team, people):
+        # 목적 함수의 가중치로 환산한 점수 개선량 (카테고리 평균, 꼬리흔들기 평균, 실패 패널티)
+        category_gain, _ = get_category_gain(team, people)
+        changes = get_wagging_changes(team, people)
+        hit_gain = sum(diff for _, diff in changes)
+        rescued = sum(
+            1 for person, diff in changes if diff and wagging_count[person] == 0
+        )
+        return (
+            2.0 * category_gain / TEAM_COUNT
+            + 2.0 * hit_gain / room.size
+            + 50.0 * rescued
+        )
+
+    def place(team, people):
+        gain, count = get_category_gain(team, people)
+        for person, diff in get_wagging_changes(team, people):
+            wagging_count[person] += diff
+        team_category_count[team] = count
+        team_scores[team] += gain
+        for person in people:
+            vacancy[team][part[person]] -= 1
+            assignment[person] = team
+            team_members[team].append(person)
+
+    def choose_team(people):
+        # 남은 자리가 있는 팀 중 점수가 가장 많이 좋아지는 팀 (동점이면 무작위)
+        best_teams = []
+        best_gain = None
+        for team in range(TEAM_COUNT):
+            required = [0] * len(PARTS)
+            for person in people:
+                required[part[person]] += 1
+            if any(vacancy[team][p] < required[p] for p in range(len(PARTS))):
+                continue
+
+            gain = get_gain(team, people)
+            if best_gain is None or gain > best_gain:
+                best_teams, best_gain = [team], gain
+            elif gain == best_gain:
+                best_teams.append(team)
+        return rng.choice(best_teams) if best_teams else None
+
+    # 1) 서로 꼬리를 흔든 쌍을 같은 팀에 배치
+    mutual_pairs = np.argwhere(
+        np.triu(context.wagging_matrix & context.wagging_matrix.T)
+    ).tolist()
+    rng.shuffle(mutual_pairs)
+    for person_a, person_b in mutual_pairs:
+        if assignment[person_a] >= 0 or assignment[person_b] >= 0:
+            continue
+        team = choose_team([person_a, person_b])
+        if team is not None:
+            place(team, [person_a, person_b])
+
+    # 2) 남은 참가자를 점수가 가장 많이 좋아지는 팀에 배치
+    remaining = np.flatnonzero(assignment < 0).tolist()
+    rng.shuffle(remaining)
+    for person in remaining:
+        team = choose_team([person])
+        if team is None:
+            raise ValueError(
+                f"팀 매칭에 필요한 파트원 수가 부족하여 매칭에 실패했습니다.\n파트: {PARTS[part[person]]}"
+            )
+        place(team, [person])
+
+    return assignment
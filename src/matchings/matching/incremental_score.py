@@ -0,0 +1,421 @@
+import numpy as np
+
+from .category_score import (
+    _get_category_count,
+    _get_team_category_score,
+    _get_team_category_scores,
+)
+from .parameter import TEAM_COUNT
+from .room_context import RoomContext
+from .room_model import CATEGORY_SIZE
+from .wagging_score import get_wagging_score
+
+# 가중치 설정 (분기 한정법의 하한 계산에서도 사용)
+W_CATEGORY_MEAN = 2.0  # 카테고리 매칭의 평균 품질
+W_CATEGORY_VAR = 0.1  # 팀 간 카테고리 균형
+W_WAGGING_MEAN = 2.0  # 꼬리흔들기 매칭의 평균 품질
+W_WAGGING_VAR = 0.1  # 팀 간 꼬리흔들기 균형
+W_WAGGING_PENALTY = 50.0  # 꼬리흔들기 매칭 실패 패널티
+
+
+def get_solution_score(
+    category_scores: list[float],
+    wagging_sum: int,
+    wagging_square_sum: int,
+    wagging_fail_count: int,
+    member_count: int,
+) -> float:
+    """
+    팀별 카테고리 점수와 꼬리흔들기 누적값으로 최종 점수를 계산
+    낮은 점수일수록 좋은 매칭을 의미함 (최소화 문제)
+
+    input:
+        - category_scores: 팀별 카테고리 점수
+        - wagging_sum: 모든 참가자의 꼬리흔들기 적중 횟수 합
+        - wagging_square_sum: 모든 참가자의 꼬리흔들기 적중 횟수 제곱의 합
+        - wagging_fail_count: 꼬리흔들기에 성공하지 못한 사람의 수
+        - member_count: 참가자 수
+    """
+    # 카테고리 점수의 평균과 분산 계산
+    # 평균: 전체적인 매칭 품질
+    # 분산: 팀 간 균형 (분산이 낮을수록 모든 팀이 고르게 좋음)
+    category_mean = sum(category_scores) / len(category_scores)
+    category_variance = sum(
+        (score - category_mean) ** 2 for score in category_scores
+    ) / len(category_scores)
+
+    # 적중 횟수는 정수이므로 정수 연산 후 한 번만 나눠서 분산을 계산
+    wagging_mean = wagging_sum / member_count
+    wagging_variance = (
+        member_count * wagging_square_sum - wagging_sum**2
+    ) / member_count**2
+
+    return _combine_score(
+        category_mean,
+        category_variance,
+        wagging_mean,
+        wagging_variance,
+        wagging_fail_count,
+    )
+
+
+def _combine_score(
+    category_mean,
+    category_variance,
+    wagging_mean,
+    wagging_variance,
+    wagging_fail_count,
+):
+    """
+    평균, 분산, 패널티에 가중치를 곱해서 최종 점수로 합산 (스칼라와 NumPy 배열 모두 사용 가능)
+    """
+    # 높은 점수를 낮은 비용으로 변환 (음수 사용)
+    # 분산은 그대로 사용 (낮을수록 좋음)
+    return (
+        -W_CATEGORY_MEAN * category_mean  # 카테고리 평균이 높을수록 비용 감소
+        + W_CATEGORY_VAR * category_variance  # 분산이 낮을수록 비용 감소
+        + -W_WAGGING_MEAN * wagging_mean  # 꼬리흔들기 평균이 높을수록 비용 감소
+        + W_WAGGING_VAR * wagging_variance  # 분산이 낮을수록 비용 감소
+        + W_WAGGING_PENALTY * wagging_fail_count
+    )
+
+
+class IncrementalEvaluator:
+    """
+    팀 매칭 점수를 증분 방식으로 계산하는 평가기
+
+    같은 파트끼리 두 팀의 멤버를 교환할 때 영향을 받는 두 팀만 다시 계산하여
+    evaluate_solution()과 같은 점수를 O(팀 인원수)로 계산한다.
+
+    교환은 복사 없이 제자리에서 적용하고(apply_swap), 채택하지 않으면 undo()로 되돌린다.
+    여러 교환 후보의 점수는 get_swap_scores()로 NumPy를 이용해 한 번에 계산할 수 있다.
+    여러 교환으로 이루어진 이동은 apply_move()로 적용하고 rollback()으로 한꺼번에 되돌린다.
+
+    유지하는 상태:
+        - assignment: 참가자 인덱스별 팀 번호
+        - team_members: 팀별 참가자 인덱스 리스트
+        - category_count: 팀별 카테고리 데이터 인원수
+        - category_scores: 팀별 카테고리 점수
+        - wagging_count: 참가자별 꼬리흔들기 적중 횟수
+        - wagging_sum, wagging_square_sum, wagging_fail_count: 평균, 분산, 패널티 계산용 누적값
+        - evaluated_count: 지금까지 점수를 계산한 교환 후보 수 (실행 환경과 무관한 탐색 비용 지표)
+
+    카테고리 가중치와 꼬리 흔들기 인접 행렬은 RoomContext에서 미리 계산된 값을 사용한다.
+    """
+
+    def __init__(
+        self,
+        context: RoomContext,
+        assignment: np.ndarray,
+        team_count: int = TEAM_COUNT,
+    ):
+        room = context.room
+        self.context = context
+        self.assignment = assignment.copy()
+        self.team_members = room.get_team_members(self.assignment, team_count)
+        self.position = [0] * room.size  # 참가자별 team_members 안에서의 위치
+        for members in self.team_members:
+            for pos, member in enumerate(members):
+                self.position[member] = pos
+        self._history = []  # undo()를 위한 교환 이력
+        self.evaluated_count = 0
+        self.category = room.category.tolist()
+        self.wagging_rows = context.wagging_rows
+
+        self.category_count = _get_category_count(
+            room, self.assignment, team_count
+        ).tolist()
+        self.category_scores = [
+            self._get_team_score(count) for count in self.category_count
+        ]
+
+        wagging_scores, _ = get_wagging_score(room, self.assignment, team_count)
+        self.wagging_count = wagging_scores.tolist()
+        self.member_count = room.size
+        self.wagging_sum = sum(self.wagging_count)
+        self.wagging_square_sum = sum(count * count for count in self.wagging_count)
+        self.wagging_fail_count = self.wagging_count.count(0)
+
+        # get_swap_scores()용 NumPy 배열
+        # category_onehot[i][c][v]: 참가자 i가 카테고리 c에서 선택지 v를 골랐는지 여부
+        self._category_onehot = np.eye(CATEGORY_SIZE, dtype=np.int64)[room.category]
+        self._category_weight = np.array(context.category_weight)
+        self._wagging_matrix = context.wagging_matrix.astype(np.int64)
+        self._wagged_matrix = self._wagging_matrix.T.copy()  # [j][i]: i가 j에게 꼬리를 흔들었는지 여부
+
+        self.score = self._get_score(
+            self.category_scores,
+            self.wagging_sum,
+            self.wagging_square_sum,
+            self.wagging_fail_count,
+        )
+
+    def get_swap_score(self, person_a: int, person_b: int) -> float:
+        """
+        두 참가자(인덱스)의 팀을 교환했을 때의 점수를 반환 (상태는 변경하지 않음)
+        """
+        return self._get_swap_state(person_a, person_b)[0]
+
+    def get_swap_scores(
+        self, person_a: np.ndarray, person_b: np.ndarray
+    ) -> np.ndarray:
+        """
+        여러 교환 후보의 점수를 NumPy로 한 번에 계산 (상태는 변경하지 않음)
+
+        파이썬 반복문 대신 (후보 수, 팀 수), (후보 수, 참가자 수) 배열 연산으로 계산하므로
+        후보 한 개당 비용이 get_swap_score()보다 훨씬 작다.
+        합산 순서 차이로 get_swap_score()와 부동소수점 오차(1e-9 이하)가 있을 수 있으므로
+        후보 선택에만 사용하고, 채택한 교환의 점수는 apply_swap()의 반환값을 사용한다.
+
+        input:
+            - person_a, person_b: (후보 수,) 교환할 두 참가자 인덱스 배열
+
+        return:
+            - scores: (후보 수,) 교환 후 점수 배열
+        """
+        person_a = np.asarray(person_a, dtype=np.int64)
+        person_b = np.asarray(person_b, dtype=np.int64)
+        rows = np.arange(len(person_a))
+        self.evaluated_count += len(rows)
+        team_a = self.assignment[person_a]
+        team_b = self.assignment[person_b]
+
+        # 1) 카테고리: 두 팀의 인원수를 옮긴 뒤 두 팀의 점수만 다시 계산
+        category_count = np.array(self.category_count)
+        move = self._category_onehot[person_b] - self._category_onehot[person_a]
+        category_scores = np.tile(np.array(self.category_scores), (len(rows), 1))
+        category_scores[rows, team_a] = _get_team_category_scores(
+            category_count[team_a] + move,
+            self._category_weight,
+            self.context.max_weight,
+        )
+        category_scores[rows, team_b] = _get_team_category_scores(
+            category_count[team_b] - move,
+            self._category_weight,
+            self.context.max_weight,
+        )
+        category_mean = category_scores.mean(axis=1)
+        category_variance = ((category_scores - category_mean[:, None]) ** 2).mean(
+            axis=1
+        )
+
+        # 2) 꼬리흔들기: 팀 a 멤버는 (b를 흔들었는지 - a를 흔들었는지)만큼, 팀 b 멤버는 그 반대만큼 변화
+        in_team_a = self.assignment[None, :] == team_a[:, None]
+        in_team_b = self.assignment[None, :] == team_b[:, None]
+        diff = self._wagged_matrix[person_b] - self._wagged_matrix[person_a]
+        wagging_count = (
+            np.array(self.wagging_count)[None, :]
+            + np.where(in_team_a, diff, 0)
+            - np.where(in_team_b, diff, 0)
+        )
+        # 교환된 두 참가자는 새로운 팀에서 다시 계산
+        wagging_count[rows, person_a] = (
+            self._wagging_matrix[person_a] * in_team_b
+        ).sum(axis=1) - self._wagging_matrix[person_a, person_b]
+        wagging_count[rows, person_b] = (
+            self._wagging_matrix[person_b] * in_team_a
+        ).sum(axis=1) - self._wagging_matrix[person_b, person_a]
+
+        wagging_sum = wagging_count.sum(axis=1)
+        wagging_square_sum = (wagging_count * wagging_count).sum(axis=1)
+        wagging_fail_count = (wagging_count == 0).sum(axis=1)
+
+        n = self.member_count
+        return _combine_score(
+            category_mean,
+            category_variance,
+            wagging_sum / n,
+            (n * wagging_square_sum - wagging_sum**2) / n**2,
+            wagging_fail_count,
+        )
+
+    def apply_swap(self, person_a: int, person_b: int) -> float:
+        """
+        두 참가자의 팀을 제자리에서 교환하고 상태를 갱신한 뒤 새로운 점수를 반환
+
+        교환 전 상태는 이력에 저장되며 undo()로 되돌리거나 commit()으로 확정한다.
+        """
+        (
+            score,
+            category_scores,
+            wagging_state,
+            (team_a, count_a),
+            (team_b, count_b),
+            wagging_changes,
+        ) = self._get_swap_state(person_a, person_b)
+
+        self._history.append(
+            (
+                person_a,
+                person_b,
+                self.score,
+                self.category_scores,
+                (self.wagging_sum, self.wagging_square_sum, self.wagging_fail_count),
+                self.category_count[team_a],
+                self.category_count[team_b],
+                wagging_changes,
+            )
+        )
+
+        self.score = score
+        self.category_scores = category_scores
+        self.wagging_sum, self.wagging_square_sum, self.wagging_fail_count = (
+            wagging_state
+        )
+        self.category_count[team_a] = count_a
+        self.category_count[team_b] = count_b
+        for person, _, new in wagging_changes:
+            self.wagging_count[person] = new
+        self._swap_members(person_a, person_b)
+
+        return self.score
+
+    def apply_move(self, swaps: list[tuple[int, int]]) -> float:
+        """
+        여러 교환을 순서대로 적용하고 새로운 점수를 반환 (한 번에 여러 명을 옮기는 이동)
+
+        rollback()으로 한꺼번에 되돌리거나 commit()으로 확정한다.
+        """
+        for person_a, person_b in swaps:
+            self.apply_swap(person_a, person_b)
+        return self.score
+
+    def rollback(self) -> float:
+        """
+        commit() 이후 적용한 모든 교환을 되돌리고 되돌린 뒤의 점수를 반환
+        """
+        while self._history:
+            self.undo()
+        return self.score
+
+    def undo(self) -> float:
+        """
+        마지막으로 적용한 교환을 되돌리고 되돌린 뒤의 점수를 반환
+        """
+        (
+            person_a,
+            person_b,
+            self.score,
+            self.category_scores,
+            (self.wagging_sum, self.wagging_square_sum, self.wagging_fail_count),
+            count_a,
+            count_b,
+            wagging_changes,
+        ) = self._history.pop()
+
+        # 교환된 상태이므로 person_b가 원래 person_a의 팀에 있음
+        team_a, team_b = int(self.assignment[person_b]), int(self.assignment[person_a])
+        self.category_count[team_a] = count_a
+        self.category_count[team_b] = count_b
+        for person, old, _ in reversed(wagging_changes):
+            self.wagging_count[person] = old
+        self._swap_members(person_a, person_b)
+
+        return self.score
+
+    def commit(self):
+        """
+        지금까지 적용한 교환을 확정 (되돌리기 이력 삭제)
+        """
+        self._history.clear()
+
+    def _swap_members(self, person_a, person_b):
+        """
+        두 참가자의 팀 번호와 팀 멤버 리스트의 위치를 교환
+        """
+        team_a, team_b = int(self.assignment[person_a]), int(self.assignment[person_b])
+        pos_a, pos_b = self.position[person_a], self.position[person_b]
+        self.team_members[team_a][pos_a] = person_b
+        self.team_members[team_b][pos_b] = person_a
+        self.position[person_a], self.position[person_b] = pos_b, pos_a
+        self.assignment[person_a], self.assignment[person_b] = team_b, team_a
+
+    def _get_swap_state(self, person_a, person_b):
+        """
+        교환 후의 점수, 팀별 카테고리 점수, 꼬리흔들기 누적값, 두 팀의 새로운 카운트를 계산
+        """
+        self.evaluated_count += 1
+        team_a, team_b = int(self.assignment[person_a]), int(self.assignment[person_b])
+
+        # 1) 카테고리: 두 팀의 인원수만 갱신
+        count_a = self._move_category(self.category_count[team_a], person_a, person_b)
+        count_b = self._move_category(self.category_count[team_b], person_b, person_a)
+
+        category_scores = list(self.category_scores)
+        category_scores[team_a] = self._get_team_score(count_a)
+        category_scores[team_b] = self._get_team_score(count_b)
+
+        # 2) 꼬리흔들기: 두 팀 멤버들의 적중 횟수만 갱신
+        wagging_changes = self._move_wagging(
+            team_a, person_a, person_b
+        ) + self._move_wagging(team_b, person_b, person_a)
+
+        wagging_sum = self.wagging_sum
+        wagging_square_sum = self.wagging_square_sum
+        wagging_fail_count = self.wagging_fail_count
+        for _, old, new in wagging_changes:
+            wagging_sum += new - old
+            wagging_square_sum += new * new - old * old
+            wagging_fail_count += (new == 0) - (old == 0)
+
+        score = self._get_score(
+            category_scores, wagging_sum, wagging_square_sum, wagging_fail_count
+        )
+        return (
+            score,
+            category_scores,
+            (wagging_sum, wagging_square_sum, wagging_fail_count),
+            (team_a, count_a),
+            (team_b, count_b),
+            wagging_changes,
+        )
+
+    def _move_category(self, team_count, person_out, person_in):
+        """
+        person_out이 빠지고 person_in이 들어왔을 때의 팀 카테고리 인원수
+        """
+        new_count = [list(values) for values in team_count]
+        for category_idx, value_idx in enumerate(self.category[person_out]):
+            new_count[category_idx][value_idx] -= 1
+        for category_idx, value_idx in enumerate(self.category[person_in]):
+            new_count[category_idx][value_idx] += 1
+        return new_count
+
+    def _move_wagging(self, team, person_out, person_in):
+        """
+        팀의 person_out 자리에 person_in이 들어왔을 때 적중 횟수가 바뀌는 참가자 목록
+
+        return:
+            - [(참가자 인덱스, 기존 적중 횟수, 새로운 적중 횟수), ...]
+        """
+        changes = []
+        hit_count = 0
+        waggees_in = self.wagging_rows[person_in]
+        for member in self.team_members[team]:
+            if member == person_out:
+                continue
+            waggees = self.wagging_rows[member]
+            diff = waggees[person_in] - waggees[person_out]
+            if diff:
+                old = self.wagging_count[member]
+                changes.append((member, old, old + diff))
+            if waggees_in[member]:
+                hit_count += 1
+        changes.append((person_in, self.wagging_count[person_in], hit_count))
+        return changes
+
+    def _get_team_score(self, team_category_count):
+        return _get_team_category_score(
+            team_category_count, self.context.category_weight, self.context.max_weight
+        )
+
+    def _get_score(
+        self, category_scores, wagging_sum, wagging_square_sum, wagging_fail_count
+    ):
+        return get_solution_score(
+            category_scores,
+            wagging_sum,
+            wagging_square_sum,
+            wagging_fail_count,
+            self.member_count,
+        )
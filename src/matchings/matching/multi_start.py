@@ -0,0 +1,144 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from .engines import get_engine, get_initializer
+from .parameter import (
+    MATCHING_ENGINE,
+    MATCHING_INITIALIZER,
+    MATCHING_TIME_BUDGET,
+    MULTI_START_COUNT,
+    MULTI_START_WORKERS,
+)
+from .rng import derive_seeds, get_rng, new_seed
+from .room_context import RoomContext
+from .room_model import MatchingRoom
+from .telemetry import SolverTelemetry
+
+
+def run_multi_start(
+    context: RoomContext,
+    engine: str = MATCHING_ENGINE,
+    initializer: str = MATCHING_INITIALIZER,
+    start_count: int = MULTI_START_COUNT,
+    max_workers: int = MULTI_START_WORKERS,
+    seed: int = None,
+    telemetry: list = None,
+    **engine_kwargs,
+) -> tuple[np.ndarray, float]:
+    """
+    서로 다른 시드로 초기 해를 만들어 최적화 엔진을 start_count번 실행하고 가장 좋은 결과를 반환
+    각 실행은 독립적이므로 프로세스 풀에서 동시에 실행한다.
+    프로세스 풀을 쓰지 않으면(max_workers가 1 이하이거나 Celery 워커처럼 자식 프로세스를 만들 수 없는 경우)
+    순차 실행하고, 이때는 실행 당 시간 예산을 start_count로 나눠서 전체 실행 시간이 늘어나지 않게 한다.
+
+    실행별 시드는 seed에서 결정적으로 만들므로 seed, start_count, 엔진 인자가 같으면
+    프로세스 수와 관계없이 같은 실행을 재현한다. (시간 예산으로 끝나는 실행은 반복 횟수가 달라질 수 있으므로
+    정확히 재현하려면 max_iterations를 지정)
+
+    input:
+        - context: RoomContext
+        - engine: 최적화 엔진 이름 (engines.ENGINES의 키)
+        - initializer: 초기 해 생성 방법 (engines.INITIALIZERS의 키)
+        - start_count: 엔진 실행 횟수
+        - max_workers: 동시에 실행할 프로세스 수 (1 이하이면 순차 실행)
+        - seed: 실행별 시드를 만들 시드 (None이면 임의의 시드)
+        - telemetry: 리스트를 넘기면 실행별 탐색 통계(SolverTelemetry.to_dict()에 seed, score 추가)를 실행 순서대로 추가
+        - engine_kwargs: 각 엔진 실행에 전달할 인자 (실행 당 예산, 순차 실행이면 time_budget은 나눠서 사용)
+
+    return:
+        - best_assignment: 가장 좋은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - best_score: best_assignment의 점수
+    """
+    # 프로세스를 만들기 전에 이름 검증
+    get_engine(engine)
+    get_initializer(initializer)
+    seeds = derive_seeds(new_seed() if seed is None else seed, max(start_count, 1))
+    workers = min(max_workers, len(seeds))
+
+    results = None
+    if workers > 1:
+        try:
+            # RoomContext 대신 MatchingRoom만 넘기고 각 프로세스에서 다시 만듦 (관계 행렬은 캐시에서 읽음)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        _run_single_start,
+                        [context.room] * len(seeds),
+                        [context.room_id] * len(seeds),
+                        [engine] * len(seeds),
+                        [initializer] * len(seeds),
+                        seeds,
+                        [engine_kwargs] * len(seeds),
+                        [telemetry is not None] * len(seeds),
+                    )
+                )
+        except (AssertionError, OSError, BrokenProcessPool) as e:
+            # Celery prefork 워커처럼 자식 프로세스를 만들 수 없는 환경에서는 순차 실행
+            print(f"프로세스 풀을 사용할 수 없어 순차적으로 엔진을 실행합니다. ({e})")
+
+    if results is None:
+        # 순차 실행에서는 전체 실행 시간이 한 번 실행한 것과 같도록 시간 예산을 실행 횟수로 나눔
+        time_budget = engine_kwargs.get("time_budget", MATCHING_TIME_BUDGET)
+        if time_budget is not None:
+            engine_kwargs = {**engine_kwargs, "time_budget": time_budget / len(seeds)}
+        results = [
+            _run_single_start(
+                context.room,
+                context.room_id,
+                engine,
+                initializer,
+                seed,
+                engine_kwargs,
+                telemetry is not None,
+                context,
+            )
+            for seed in seeds
+        ]
+
+    if telemetry is not None:
+        telemetry.extend(stats for _, _, stats in results)
+    best_assignment, best_score, _ = min(results, key=lambda result: result[1])
+    return best_assignment, best_score
+
+
+def _run_single_start(
+    room: MatchingRoom,
+    room_id: int,
+    engine: str,
+    initializer: str,
+    seed: int,
+    engine_kwargs: dict,
+    record_telemetry: bool = False,
+    context: RoomContext = None,
+) -> tuple[np.ndarray, float, dict]:
+    """
+    시드 하나로 초기 해를 만들고 최적화 엔진을 한 번 실행
+
+    return:
+        - best_assignment, best_score: 엔진의 반환값
+        - stats: 탐색 통계 (record_telemetry가 False이면 None)
+    """
+    if context is None:
+        context = RoomContext(room, room_id)
+
+    # 초기 해와 엔진이 하나의 난수 생성기를 순서대로 사용
+    rng = get_rng(seed)
+    initial_assignment = get_initializer(initializer)(context, rng)
+
+    if not record_telemetry:
+        best_assignment, best_score = get_engine(engine)(
+            context, initial_assignment, rng=rng, **engine_kwargs
+        )
+        return best_assignment, best_score, None
+
+    telemetry = SolverTelemetry()
+    best_assignment, best_score = get_engine(engine)(
+        context, initial_assignment, rng=rng, telemetry=telemetry, **engine_kwargs
+    )
+    return (
+        best_assignment,
+        best_score,
+        {"seed": seed, "score": best_score, **telemetry.to_dict()},
+    )
@@ -0,0 +1,294 @@
+import math
+import time
+
+import numpy as np
+
+from .budget import SearchBudget
+from .incremental_score import IncrementalEvaluator
+from .parameter import BUDGET_CHECK_INTERVAL, MATCHING_PATIENCE, MATCHING_TIME_BUDGET
+from .rng import get_rng
+from .room_context import RoomContext
+from .swap_sampler import SwapSampler
+
+# 부동소수점 오차를 개선으로 착각하지 않기 위한 최소 개선량
+MIN_IMPROVEMENT = 1e-9
+
+# 모든 채택률이 0이 되어 가중치를 계산할 수 없는 경우를 막기 위한 작은 값
+EPSILON = 1e-12
+
+
+def propose_swap(evaluator: IncrementalEvaluator, sampler: SwapSampler):
+    """
+    같은 파트의 두 참가자 교환
+    """
+    return [sampler.sample()]
+
+
+def propose_cycle(evaluator: IncrementalEvaluator, sampler: SwapSampler):
+    """
+    같은 파트의 세 참가자를 서로 다른 세 팀 사이에서 돌림 (a -> b의 팀, b -> c의 팀, c -> a의 팀)
+
+    두 번의 교환 (a, b), (b, c)로 표현한다.
+    """
+    rng = sampler.rng
+    parts = [part for part in sampler.swappable_parts if len(sampler.part_teams[part]) >= 3]
+    if not parts:
+        return None
+    part = rng.choice(parts)
+    team_a, team_b, team_c = rng.sample(sampler.part_teams[part], 3)
+    person_a = rng.choice(sampler.members[part][team_a])
+    person_b = rng.choice(sampler.members[part][team_b])
+    person_c = rng.choice(sampler.members[part][team_c])
+    return [(person_a, person_b), (person_b, person_c)]
+
+
+def propose_double_swap(evaluator: IncrementalEvaluator, sampler: SwapSampler):
+    """
+    같은 두 팀 사이에서 두 쌍을 동시에 교환 (두 명을 함께 옮겨야 좋아지는 경우)
+    """
+    person_a, person_b = sampler.sample()
+    team_a, team_b = sampler.team[person_a], sampler.team[person_b]
+
+    pairs = [
+        (other_a, other_b)
+        for part in sampler.swappable_parts
+        for other_a in sampler.members[part][team_a]
+        for other_b in sampler.members[part][team_b]
+        if other_a != person_a and other_b != person_b
+    ]
+    if not pairs:
+        return None
+    return [(person_a, person_b), sampler.rng.choice(pairs)]
+
+
+def propose_redeal(evaluator: IncrementalEvaluator, sampler: SwapSampler):
+    """
+    무작위로 고른 두 팀의 멤버를 다시 나눔
+
+    두 팀 사이의 같은 파트 교환 중 가장 좋은 교환을 더 좋아지는 교환이 없을 때까지 적용해서
+    (두 팀만 놓고 본 국소 최적해) 그 교환 목록을 반환한다. 좋아지는 교환이 없으면 None.
+    """
+    person_a, person_b = sampler.sample()
+    team_a, team_b = sampler.team[person_a], sampler.team[person_b]
+
+    swaps = []
+    while True:
+        members = evaluator.team_members
+        pairs = [
+            (other_a, other_b)
+            for other_a in members[team_a]
+            for other_b in members[team_b]
+            if sampler.part[other_a] == sampler.part[other_b]
+        ]
+        if not pairs:
+            break
+        candidates_a, candidates_b = zip(*pairs)
+        scores = evaluator.get_swap_scores(candidates_a, candidates_b)
+        best = int(scores.argmin())
+        if scores[best] >= evaluator.score - MIN_IMPROVEMENT:
+            break
+        evaluator.apply_swap(*pairs[best])
+        swaps.append(pairs[best])
+
+    # 탐색에 사용한 교환은 되돌리고 교환 목록만 반환
+    evaluator.rollback()
+    return swaps or None
+
+
+# 이동 종류 목록
+# 모든 이동은 propose(evaluator, sampler) -> [(person_a, person_b), ...] 또는 None 형식을 따르며,
+# 반환한 교환 목록을 순서대로 적용하면 이동이 완성된다 (모든 교환은 같은 파트끼리이므로 팀 템플릿 유지)
+MOVE_TYPES = {
+    "swap": propose_swap,
+    "cycle": propose_cycle,
+    "double": propose_double_swap,
+    "redeal": propose_redeal,
+}
+
+
+class AdaptiveMoveSelector:
+    """
+    최근 채택률을 이동의 비용으로 나눈 값(평가 횟수당 채택 수)에 비례하는 확률로 이동 종류를 선택
+
+    비용은 실행 시간이 아니라 이동 한 번을 만들고 판정하는 동안 점수를 계산한 교환 후보 수
+    (IncrementalEvaluator.evaluated_count의 증가량)이다.
+    이동 종류마다 평가 횟수가 크게 다르므로 (redeal은 교환 한 번보다 수십 배 많음)
+    채택 여부와 비용을 각각 지수 이동 평균으로 유지한다.
+    시간을 재지 않으므로 같은 시드로 실행하면 선택 과정이 그대로 재현된다.
+    채택이 드문 이동도 가끔은 다시 시도하도록 채택률은 가장 큰 채택률의 min_weight배 이상으로 본다.
+    """
+
+    def __init__(self, move_types: list[str], decay=0.99, min_weight=0.05, rng=None):
+        self.rng = get_rng(rng)
+        self.move_types = move_types
+        self.decay = decay
+        self.min_weight = min_weight
+        self.rates = [0.5] * len(move_types)
+        self.costs = [None] * len(move_types)
+
+    def choose(self) -> int:
+        # 아직 한 번도 시도하지 않은 이동은 먼저 시도
+        for move, cost in enumerate(self.costs):
+            if cost is None:
+                return move
+
+        floor = max(max(self.rates) * self.min_weight, EPSILON)
+        weights = [max(rate, floor) / cost for rate, cost in zip(self.rates, self.costs)]
+        return self.rng.choices(range(len(self.move_types)), weights=weights)[0]
+
+    def record(self, move: int, accepted: bool, cost: int):
+        """
+        이동 한 번의 채택 여부와 비용(평가 횟수, evaluated_count의 증가량)을 기록
+        """
+        # 이동을 만들지 못한 경우(평가 0회)도 한 번의 시도로 계산
+        cost = max(cost, 1)
+        decay = self.decay
+        self.rates[move] = decay * self.rates[move] + (1 - decay) * accepted
+        if self.costs[move] is None:
+            self.costs[move] = cost
+        else:
+            self.costs[move] = decay * self.costs[move] + (1 - decay) * cost
+
+
+def anneal_moves(
+    evaluator: IncrementalEvaluator,
+    propose,
+    on_result,
+    initial_temp=1.0,
+    min_temp=0.001,
+    time_budget=MATCHING_TIME_BUDGET,
+    patience=MATCHING_PATIENCE,
+    max_iterations=None,
+    rng=None,
+    telemetry=None,
+):
+    """
+    여러 교환으로 이루어진 이동을 사용하는 담금질 반복
+
+    온도와 종료 조건은 simulated_annealing()과 같다.
+
+    input:
+        - evaluator: 초기 해로 만든 IncrementalEvaluator
+        - propose: propose() -> 교환 목록 또는 None (이동이 없으면 그 반복은 건너뜀)
+        - on_result: on_result(swaps, accepted) 이동의 채택 여부를 샘플러 등에 반영
+        - rng: 시드 또는 random.Random (메트로폴리스 판정에 사용, 이동 추출은 propose가 담당)
+        - telemetry: 탐색 통계를 기록할 SolverTelemetry (None이면 기록하지 않음)
+
+    return:
+        - best_assignment: 가장 좋은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - best_score: best_assignment의 점수
+    """
+    rng = get_rng(rng)
+    budget = SearchBudget(time_budget, max_iterations, patience)
+    current_score = evaluator.score
+
+    best_assignment = evaluator.assignment.copy()
+    best_score = current_score
+
+    log_temp_ratio = math.log(min_temp / initial_temp)
+    T = initial_temp
+    band = None
+
+    iteration = 0
+    while not budget.is_stalled(iteration):
+
+        # 0) 시계 확인은 비용이 있으므로 일정 주기마다 진행률과 온도를 갱신
+        if iteration % BUDGET_CHECK_INTERVAL == 0:
+            progress = budget.get_progress(iteration)
+            if progress >= 1:
+                break
+            T = initial_temp * math.exp(log_temp_ratio * progress)
+            if telemetry is not None:
+                band = telemetry.get_band(T)
+        iteration += 1
+
+        # 1) neighbor 생성 (교환 목록을 제자리에서 순서대로 적용)
+        if telemetry is not None:
+            started = time.perf_counter()
+        swaps = propose()
+        if swaps is None:
+            on_result(None, False)
+            continue
+        if telemetry is not None:
+            proposed = time.perf_counter()
+        new_score = evaluator.apply_move(swaps)
+        if telemetry is not None:
+            telemetry.record_time(proposed - started, time.perf_counter() - proposed)
+
+        # 2) score 차이, 3) 더 좋으면 무조건 채택, 4) 더 나쁜 해는 확률적으로 채택
+        delta = new_score - current_score
+        accepted = delta < 0 or rng.random() < math.exp(-delta / T)
+        if telemetry is not None:
+            telemetry.record_proposals(band, 1, accepted)
+        if accepted:
+            evaluator.commit()
+            current_score = new_score
+        else:
+            evaluator.rollback()
+        on_result(swaps, accepted)
+
+        # 5) best 업데이트 (best가 바뀔 때만 팀 구성을 복사)
+        if current_score < best_score:
+            best_assignment = evaluator.assignment.copy()
+            best_score = current_score
+            budget.record_improvement(iteration)
+            if telemetry is not None:
+                telemetry.record_best(iteration, best_score)
+
+    if telemetry is not None:
+        telemetry.finish(iteration)
+    return best_assignment, best_score
+
+
+def adaptive_annealing(
+    context: RoomContext,
+    initial_assignment: np.ndarray,
+    move_types=tuple(MOVE_TYPES),
+    rng=None,
+    **annealing_kwargs,
+):
+    """
+    여러 종류의 이동을 최근 채택률에 맞춰 골라 쓰는 담금질
+
+    input:
+        - context: RoomContext
+        - initial_assignment: 초기 해
+        - move_types: 사용할 이동 종류 (MOVE_TYPES의 키)
+        - rng: 시드 또는 random.Random (이동 종류 선택, 이동 추출, 메트로폴리스 판정에 사용)
+        - annealing_kwargs: anneal_moves()의 온도와 종료 조건 인자
+
+    return:
+        - best_assignment: 가장 좋은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - best_score: best_assignment의 점수
+    """
+    for move_type in move_types:
+        if move_type not in MOVE_TYPES:
+            raise ValueError(
+                f"지원하지 않는 이동 종류입니다: {move_type} (사용 가능: {', '.join(MOVE_TYPES)})"
+            )
+
+    rng = get_rng(rng)
+    evaluator = IncrementalEvaluator(context, initial_assignment)
+    sampler = SwapSampler(context.room, initial_assignment, rng=rng)
+
+    # 교환할 수 있는 쌍이 없으면 더 이상 개선할 수 없음
+    if not sampler.has_move:
+        if annealing_kwargs.get("telemetry") is not None:
+            annealing_kwargs["telemetry"].finish(0)
+        return evaluator.assignment.copy(), evaluator.score
+
+    selector = AdaptiveMoveSelector(list(move_types), rng=rng)
+    proposers = [MOVE_TYPES[move_type] for move_type in move_types]
+    chosen = [0, 0]  # 이번 반복에서 고른 이동 종류, 시작할 때의 평가 후보 수
+
+    def propose():
+        chosen[0], chosen[1] = selector.choose(), evaluator.evaluated_count
+        return proposers[chosen[0]](evaluator, sampler)
+
+    def on_result(swaps, accepted):
+        selector.record(chosen[0], accepted, evaluator.evaluated_count - chosen[1])
+        if accepted:
+            for person_a, person_b in swaps:
+                sampler.swap(person_a, person_b)
+
+    return anneal_moves(evaluator, propose, on_result, rng=rng, **annealing_kwargs)
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 TEAM_COUNT = 6  # 생성할 팀의 개수
 PART_MIN = {"PM": 0, "DE": 1, "FE": 2, "BE": 2}  # 파트별 최소 인원수
 
@@ -7,3 +10,80 @@ CATEGORY = {
     "active_hours": ["day", "night"],
     "meeting_preference": ["online", "offline"],
 }
+
+# 팀 매칭 최적화 엔진 (engines.ENGINES의 키 또는 engines.EXACT_ENGINE)
+MATCHING_ENGINE = os.getenv("MATCHING_ENGINE") or "annealing"
+
+# 초기 해 생성 방법 (engines.INITIALIZERS의 키)
+MATCHING_INITIALIZER = os.getenv("MATCHING_INITIALIZER") or "greedy"
+
+# 엔진 실행 당 종료 조건
+MATCHING_TIME_BUDGET = float(os.getenv("MATCHING_TIME_BUDGET") or 2.0)  # 실행 시간 예산 (초)
+MATCHING_PATIENCE = int(
+    os.getenv("MATCHING_PATIENCE") or 5000
+)  # 최고 점수가 이 반복 횟수 동안 개선되지 않으면 조기 종료
+BUDGET_CHECK_INTERVAL = 64  # 시간 예산을 확인하는 반복 주기
+MIN_BATCH_SIZE = 8  # 교환 후보를 묶음으로 평가하는 최소 후보 수 (더 적으면 하나씩 평가)
+
+# 정확한 풀이(분기 한정법) 설정
+# 정확한 풀이를 시도할 최대 참가자 수 (초과하면 담금질 기법만 실행)
+# 기본값은 모든 팀이 파트별 최소 인원을 채우고 팀마다 한 명씩 더 있는 인원 (PART_MIN 합 + 1) * TEAM_COUNT = 36명
+# (가상 매칭룸에서 1초 동안 실행했을 때 39명 이상은 담금질 기법의 결과를 개선한 경우가 없었고, 36명 이하에서도 최적성 증명은 드묾)
+MATCHING_EXACT_MAX_SIZE = int(
+    os.getenv("MATCHING_EXACT_MAX_SIZE") or (sum(PART_MIN.values()) + 1) * TEAM_COUNT
+)
+MATCHING_EXACT_TIME_LIMIT = float(
+    os.getenv("MATCHING_EXACT_TIME_LIMIT") or 10.0
+)  # 분기 한정법의 최대 실행 시간 (초, 실행 시간 예산이 있으면 그중 MATCHING_EXACT_TIME_SHARE 이하)
+MATCHING_EXACT_TIME_SHARE = 0.5  # 실행 시간 예산 중 분기 한정법에 쓰는 비율 (나머지는 첫 번째 상한을 만드는 담금질 기법)
+
+# 분기 한정법의 팀 구성별 카테고리 점수 상한 캐시 크기 (실행마다 하나씩 사용, 항목 하나는 수백 바이트)
+TEAM_SCORE_CACHE_SIZE = 1 << 16
+
+# 엔진 실행 후 최급 하강법으로 국소 최적해까지 다듬을지 여부
+MATCHING_POLISH = (os.getenv("MATCHING_POLISH") or "true").lower() in ("1", "true", "yes")
+MATCHING_POLISH_TIME_LIMIT = float(
+    os.getenv("MATCHING_POLISH_TIME_LIMIT") or 1.0
+)  # 마무리 탐색의 실행 시간 제한 (초, 넘기면 그때까지 다듬은 결과를 사용)
+
+# 참가자 쌍별 관계 행렬 캐시 경로 (매칭룸 단위 .npz 파일)
+MATCHING_CACHE_DIR = os.getenv("MATCHING_CACHE_DIR") or os.path.join(
+    tempfile.gettempdir(), "devti-matching"
+)
+
+# 팀 매칭 설명글 캐시 (팀 통계와 프롬프트 버전이 같으면 LLM을 호출하지 않고 재사용)
+EXPLANATION_CACHE_URL = os.getenv("EXPLANATION_CACHE_URL") or os.getenv(
+    "REDIS_URL", "redis://localhost:6379/1"
+)  # 캐시를 저장할 Redis 주소 (기본값은 Celery 브로커와 같은 Redis)
+EXPLANATION_CACHE_TTL = int(
+    os.getenv("EXPLANATION_CACHE_TTL") or 30 * 24 * 60 * 60
+)  # 설명글 보관 기간 (초)
+EXPLANATION_CACHE_SIZE = int(
+    os.getenv("EXPLANATION_CACHE_SIZE") or 10000
+)  # 보관할 최대 설명글 수 (초과하면 가장 오래 전에 저장한 설명글부터 삭제)
+EXPLANATION_CACHE_TIMEOUT = 1.0  # Redis 연결, 응답 대기 시간 (초, 초과하면 캐시 없이 진행)
+
+# 팀별 설명글 LLM 호출 설정 (실패하거나 시간을 넘긴 팀은 로컬에서 만든 설명글을 사용)
+EXPLANATION_TIMEOUT = float(
+    os.getenv("EXPLANATION_TIMEOUT") or 30.0
+)  # 팀별 LLM 호출 제한 시간 (초)
+EXPLANATION_WORKERS = int(
+    os.getenv("EXPLANATION_WORKERS") or TEAM_COUNT
+)  # 동시에 호출할 팀 수
+EXPLANATION_BREAKER_THRESHOLD = 3  # 연속으로 이 횟수만큼 실패하면 LLM 호출을 잠시 중단
+EXPLANATION_BREAKER_COOLDOWN = 60.0  # 호출을 중단한 뒤 다시 시도하기까지의 시간 (초)
+
+# 엔진 실행 통계(MatchingRun)를 기록할지 여부와 기록 형식
+MATCHING_TELEMETRY = (os.getenv("MATCHING_TELEMETRY") or "true").lower() in ("1", "true", "yes")
+TELEMETRY_BANDS_PER_DECADE = 2  # 채택률을 집계하는 온도 구간 수 (온도 10배당)
+TELEMETRY_TRACE_SIZE = 100  # 저장할 최고 점수 궤적의 최대 점 수
+
+# 멀티 스타트 설정
+MULTI_START_COUNT = int(os.getenv("MATCHING_START_COUNT") or 4)  # 서로 다른 시드로 실행할 엔진 실행 횟수
+# Celery 워커 프로세스 수 (settings의 CELERY_WORKER_CONCURRENCY와 같은 값, 기본값은 CPU 코어 수)
+WORKER_CONCURRENCY = int(os.getenv("CELERY_WORKER_CONCURRENCY") or os.cpu_count() or 1)
+# 동시에 실행할 프로세스 수 (1이면 순차 실행)
+# 워커 프로세스들이 동시에 매칭을 실행해도 CPU 코어 수를 넘지 않도록 워커 하나당 코어 수를 기본값으로 사용
+MULTI_START_WORKERS = int(
+    os.getenv("MATCHING_WORKERS") or max(1, (os.cpu_count() or 1) // WORKER_CONCURRENCY)
+)
@@ -0,0 +1,92 @@
+import numpy as np
+from django.db import transaction
+
+from ..models import MatchingRun, Member, Result, Room, Team
+from .room_model import MatchingRoom
+
+
+def save_matching_result(
+    matching_room: Room,
+    team_list: list[list[dict]],
+    explanations: list[str] = None,
+    seed: int = None,
+    engine_params: dict = None,
+    run_stats: dict = None,
+) -> Result:
+    """
+    팀 매칭 결과를 참가자 수와 관계없이 일정한 횟수의 쿼리로 저장
+
+    Result, MatchingRun을 하나씩 만들고 팀과 팀원은 각각 bulk_create 한 번으로 저장한다.
+    MySQL의 bulk_create는 생성된 id를 돌려주지 않으므로 팀 id는 한 번의 쿼리로 다시 읽고,
+    팀원은 Participant를 조회하지 않고 participant_id로 바로 만든다.
+
+    input:
+        - team_list: MatchingRoom.to_team_list()의 반환값 (팀 번호 순서)
+        - explanations: 팀별 설명글 (team_list와 같은 순서, None이면 빈 설명글로 저장하고 save_team_explanations()로 채움)
+        - seed, engine_params: 재현용 시드와 실행 설정
+        - run_stats: MatchingRun에 저장할 실행 통계 (None이면 저장하지 않음)
+
+    return:
+        - result: 저장한 Result
+    """
+    if explanations is None:
+        explanations = [""] * len(team_list)
+
+    with transaction.atomic():
+        result = Result.objects.create(
+            room=matching_room, seed=seed, engine_params=engine_params or {}
+        )
+        if run_stats is not None:
+            MatchingRun.objects.create(result=result, **run_stats)
+
+        Team.objects.bulk_create(
+            Team(result=result, team_number=i + 1, explanation=explanation)
+            for i, explanation in enumerate(explanations)
+        )
+        team_ids = dict(
+            Team.objects.filter(result=result).values_list("team_number", "id")
+        )
+        Member.objects.bulk_create(
+            Member(team_id=team_ids[i + 1], participant_id=member["id"])
+            for i, team in enumerate(team_list)
+            for member in team
+        )
+    return result
+
+
+def load_assignment(result: Result, room: MatchingRoom) -> np.ndarray:
+    """
+    저장된 팀 매칭 결과를 room의 참가자 인덱스별 팀 번호로 변환 (쿼리 1회)
+
+    매칭 이후 room의 참가자가 바뀌어서 팀이 없는 참가자가 있으면 ValueError를 발생시킨다.
+    """
+    assignment = np.full(room.size, -1, dtype=np.int64)
+    members = Member.objects.filter(team__result=result).values_list(
+        "team__team_number", "participant_id"
+    )
+    for team_number, participant_id in members:
+        if participant_id in room.index_of:
+            assignment[room.index_of[participant_id]] = team_number - 1
+
+    if (assignment < 0).any():
+        raise ValueError(
+            f"ID가 {result.id}인 매칭 결과 이후 매칭룸의 참가자가 바뀌어 팀 구성을 복원할 수 없습니다."
+        )
+    return assignment
+
+
+def save_team_explanations(result: Result, explanations: list[str]) -> list[Team]:
+    """
+    팀별 설명글을 bulk_update 한 번으로 저장
+
+    input:
+        - explanations: 팀별 설명글 (팀 번호 순서)
+
+    return:
+        - teams: 설명글을 저장한 Team 리스트 (팀 번호 순서)
+    """
+    teams = list(Team.objects.filter(result=result).order_by("team_number"))
+    for team, explanation in zip(teams, explanations):
+        team.explanation = explanation
+    Team.objects.bulk_update(teams, ["explanation"])
+    return teams
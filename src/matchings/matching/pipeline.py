@@ -0,0 +1,126 @@
+import time
+
+from .engines import EXACT_ENGINE, EXACT_WARM_START_ENGINE
+from .exact_solver import exact_search
+from .multi_start import run_multi_start
+from .parameter import (
+    MATCHING_ENGINE,
+    MATCHING_EXACT_MAX_SIZE,
+    MATCHING_EXACT_TIME_LIMIT,
+    MATCHING_EXACT_TIME_SHARE,
+    MATCHING_INITIALIZER,
+    MATCHING_PATIENCE,
+    MATCHING_POLISH,
+    MATCHING_POLISH_TIME_LIMIT,
+    MATCHING_TELEMETRY,
+    MATCHING_TIME_BUDGET,
+    MULTI_START_COUNT,
+)
+from .polish import steepest_descent
+from .room_context import RoomContext
+from .telemetry import summarize_runs
+
+# 팀 매칭 실행 과정 (멀티 스타트 엔진, 분기 한정법, 마무리 탐색)
+# DB와 Celery에 의존하지 않으므로 tasks.py와 벤치마크에서 같은 과정을 실행한다.
+
+
+def get_engine_params(engine=None, polish=None) -> dict:
+    """
+    팀 매칭 실행 설정을 Result.engine_params에 저장할 형식으로 반환
+    """
+    return {
+        "engine": engine or MATCHING_ENGINE,
+        "initializer": MATCHING_INITIALIZER,
+        "start_count": MULTI_START_COUNT,
+        "polish": MATCHING_POLISH if polish is None else polish,
+        "polish_time_limit": MATCHING_POLISH_TIME_LIMIT,
+        "exact_time_limit": MATCHING_EXACT_TIME_LIMIT,
+        "engine_kwargs": {
+            "time_budget": MATCHING_TIME_BUDGET,
+            "patience": MATCHING_PATIENCE,
+        },
+    }
+
+
+def solve_matching(
+    context: RoomContext, seed: int, engine_params: dict, telemetry=MATCHING_TELEMETRY
+):
+    """
+    시드와 실행 설정으로 멀티 스타트 엔진과 마무리 탐색을 실행
+
+    엔진이 EXACT_ENGINE이면 EXACT_WARM_START_ENGINE으로 멀티 스타트를 실행한 뒤 그 결과를 첫 번째 상한으로
+    분기 한정법을 한 번만 실행한다. 실행 시간 예산(engine_kwargs의 time_budget) 중 MATCHING_EXACT_TIME_SHARE를
+    분기 한정법에, 나머지를 멀티 스타트에 쓰므로 전체 실행 시간은 다른 엔진과 같다.
+    (분기 한정법의 실행 시간은 exact_time_limit 이하, 시간 예산이 None이면 exact_time_limit)
+    참가자 수가 MATCHING_EXACT_MAX_SIZE보다 많으면 분기 한정법 없이 시간 예산을 모두 멀티 스타트에 쓴다.
+
+    return:
+        - best_assignment: 가장 좋은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - score: best_assignment의 점수
+        - run_stats: MatchingRun에 저장할 실행 통계 (telemetry가 False이면 None)
+    """
+    engine = engine_params["engine"]
+    engine_kwargs = engine_params["engine_kwargs"]
+    exact_time_limit = None
+    if engine == EXACT_ENGINE:
+        engine = EXACT_WARM_START_ENGINE
+        if context.room.size > MATCHING_EXACT_MAX_SIZE:
+            print(
+                f"참가자 수({context.room.size}명)가 정확한 풀이 기준({MATCHING_EXACT_MAX_SIZE}명)보다 많아 "
+                f"{EXACT_WARM_START_ENGINE} 엔진만 실행합니다."
+            )
+        else:
+            exact_time_limit = engine_params.get("exact_time_limit", MATCHING_EXACT_TIME_LIMIT)
+            time_budget = engine_kwargs.get("time_budget", MATCHING_TIME_BUDGET)
+            if time_budget is not None:
+                exact_time_limit = min(exact_time_limit, time_budget * MATCHING_EXACT_TIME_SHARE)
+                engine_kwargs = {**engine_kwargs, "time_budget": time_budget - exact_time_limit}
+
+    runs = [] if telemetry else None
+    best_assignment, score = run_multi_start(
+        context,
+        engine,
+        engine_params["initializer"],
+        engine_params["start_count"],
+        seed=seed,
+        telemetry=runs,
+        **engine_kwargs,
+    )
+
+    run_stats = None
+    if telemetry:
+        best_index = min(range(len(runs)), key=lambda i: runs[i]["score"])
+        run_stats = {
+            "engine": engine_params["engine"],
+            **summarize_runs(runs, best_index),
+            "starts": [
+                {key: run[key] for key in ("seed", "score", "iterations", "elapsed")}
+                for run in runs
+            ],
+        }
+
+    # 분기 한정법: 멀티 스타트의 결과보다 좋은 해를 찾고, 시간 제한 안에 탐색을 마치면 최적해임을 증명
+    if exact_time_limit is not None:
+        best_assignment, score, gap = exact_search(context, best_assignment, exact_time_limit)
+        if run_stats is not None:
+            run_stats["exact_gap"] = gap
+            run_stats["exact_proven"] = gap == 0
+
+    # 마무리 탐색: 한 번의 교환으로 더 좋아지는 팀 구성이 없을 때까지 다듬기
+    # (polish_time_limit초를 넘기면 그때까지 다듬은 결과를 사용, None이면 제한 없음)
+    if engine_params["polish"]:
+        polish_started = time.perf_counter()
+        best_assignment, polished_score, converged = steepest_descent(
+            context,
+            best_assignment,
+            engine_params.get("polish_time_limit", MATCHING_POLISH_TIME_LIMIT),
+        )
+        if run_stats is not None:
+            run_stats["polish_improvement"] = score - polished_score
+            run_stats["polish_seconds"] = time.perf_counter() - polish_started
+            run_stats["polish_converged"] = converged
+        score = polished_score
+
+    if run_stats is not None:
+        run_stats["score"] = score
+    return best_assignment, score, run_stats
@@ -0,0 +1,268 @@
+import numpy as np
+
+from .budget import SearchBudget
+from .category_score import _get_team_category_scores
+from .incremental_score import IncrementalEvaluator, _combine_score
+from .parameter import MATCHING_POLISH_TIME_LIMIT
+from .room_context import RoomContext
+from .room_model import CATEGORY_SIZE
+
+# 부동소수점 오차를 개선으로 착각하지 않기 위한 최소 개선량
+MIN_IMPROVEMENT = 1e-9
+
+
+def steepest_descent(
+    context: RoomContext,
+    assignment: np.ndarray,
+    time_limit=MATCHING_POLISH_TIME_LIMIT,
+) -> tuple[np.ndarray, float, bool]:
+    """
+    최급 하강법으로 팀 매칭 결과를 국소 최적해까지 다듬음
+
+    같은 파트이면서 서로 다른 팀에 있는 모든 참가자 쌍의 교환 중 가장 많이 좋아지는 교환을 적용하는 과정을
+    더 좋아지는 교환이 없거나 time_limit초가 지날 때까지 반복한다.
+    난수를 사용하지 않으므로 시간 제한에 걸리지 않으면 같은 입력에는 항상 같은 결과를 반환한다.
+
+    점수는 팀 간 평균과 분산으로 계산하므로 교환 하나의 점수 변화가 다른 팀의 상태에 따라 달라지지만,
+    교환이 바꾸는 두 팀의 카테고리 점수와 꼬리흔들기 누적값의 변화량은 그 두 팀에만 의존한다.
+    그래서 팀 쌍별로 후보 교환의 변화량(_get_pair_deltas())을 보관해 두고 매 단계에서 전체 누적값과 합쳐 점수를 구하며,
+    교환을 적용한 뒤에는 바뀐 두 팀이 포함된 팀 쌍의 변화량만 다시 계산한다.
+
+    input:
+        - context: RoomContext
+        - assignment = [0, 3, 1, ...] 참가자 인덱스별 팀 번호
+        - time_limit: 실행 시간 제한 (초, None이면 제한 없음)
+
+    return:
+        - best_assignment: 다듬은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - best_score: best_assignment의 점수
+        - converged: 국소 최적해에 도달했는지 여부 (False이면 시간 제한으로 중단)
+    """
+    evaluator = IncrementalEvaluator(context, assignment)
+    team_count = len(evaluator.team_members)
+
+    # 카테고리 점수는 참가자의 카테고리 선택 조합(최대 2^카테고리 개수 가지)에만 의존하므로
+    # 팀별로 (나가는 사람의 조합, 들어오는 사람의 조합)에 대한 점수 표를 만들어 둠
+    profiles, profile_of = np.unique(
+        context.room.category, axis=0, return_inverse=True
+    )
+    profile_onehot = np.eye(CATEGORY_SIZE, dtype=np.int64)[profiles]
+    category_tables = [
+        _get_category_table(evaluator, profile_onehot, team)
+        for team in range(team_count)
+    ]
+    # 꼬리흔들기 행렬 곱에 BLAS를 사용하도록 실수형으로 저장 (값은 작은 정수이므로 오차 없음)
+    tables = (
+        context.wagging_matrix.astype(np.float64),
+        profile_of.reshape(-1),
+        category_tables,
+    )
+    deltas = {
+        (team_c, team_d): _get_pair_deltas(evaluator, tables, team_c, team_d)
+        for team_c in range(team_count)
+        for team_d in range(team_c + 1, team_count)
+    }
+
+    budget = SearchBudget(time_budget=time_limit) if time_limit is not None else None
+    while budget is None or budget.get_progress(0) < 1:
+        best = _get_best_swap(evaluator, deltas)
+        if best is None:
+            return evaluator.assignment.copy(), evaluator.score, True
+
+        # 선택에는 합산 순서가 다른 근삿값을 사용했으므로 실제 점수로 개선 여부를 다시 확인
+        score = evaluator.score
+        if evaluator.apply_swap(*best) >= score - MIN_IMPROVEMENT:
+            evaluator.undo()
+            return evaluator.assignment.copy(), evaluator.score, True
+        evaluator.commit()
+
+        changed = (int(evaluator.assignment[best[0]]), int(evaluator.assignment[best[1]]))
+        for team in changed:
+            category_tables[team] = _get_category_table(evaluator, profile_onehot, team)
+        for team_c, team_d in deltas:
+            if team_c in changed or team_d in changed:
+                deltas[team_c, team_d] = _get_pair_deltas(
+                    evaluator, tables, team_c, team_d
+                )
+
+    return evaluator.assignment.copy(), evaluator.score, False
+
+
+def _get_pair_deltas(evaluator: IncrementalEvaluator, tables, team_c: int, team_d: int):
+    """
+    팀 c와 팀 d 사이의 모든 같은 파트 교환 후보에 대해 두 팀의 새로운 카테고리 점수와 꼬리흔들기 누적값 변화량을 계산
+
+    두 팀의 인원수 크기의 행렬만 사용하므로 전체 참가자 수와 무관하게 팀 쌍 단위로 계산할 수 있다.
+
+    return:
+        - (person_c, person_d, score_c, score_d, wagging_sum, wagging_square_sum, wagging_fail_count)
+          후보별 교환할 두 참가자, 교환 후 두 팀의 카테고리 점수, 꼬리흔들기 누적값의 변화량 (후보가 없으면 None)
+    """
+    wagging, profile_of, category_tables = tables
+    part = evaluator.context.room.part
+    members_c = np.array(evaluator.team_members[team_c], dtype=np.int64)
+    members_d = np.array(evaluator.team_members[team_d], dtype=np.int64)
+    index_c, index_d = np.nonzero(part[members_c][:, None] == part[members_d][None, :])
+    if len(index_c) == 0:
+        return None
+    person_c, person_d = members_c[index_c], members_d[index_d]
+
+    # 1) 카테고리: 두 팀의 점수 표에서 두 사람의 카테고리 선택 조합으로 조회
+    profile_c, profile_d = profile_of[person_c], profile_of[person_d]
+    score_c = category_tables[team_c][profile_c, profile_d]
+    score_d = category_tables[team_d][profile_d, profile_c]
+
+    # 2) 꼬리흔들기: 두 팀 각각의 (나가는 사람, 들어오는 사람) 조합별 누적값 변화량을 행렬 곱으로 계산
+    wagging_count = np.array(evaluator.wagging_count, dtype=np.float64)
+    wagging_cd = wagging[np.ix_(members_c, members_d)]
+    wagging_dc = wagging[np.ix_(members_d, members_c)]
+    changes_c = _get_team_changes(
+        wagging_count[members_c],
+        wagging_cd,
+        wagging[np.ix_(members_c, members_c)],
+        wagging_dc,
+    )
+    changes_d = _get_team_changes(
+        wagging_count[members_d],
+        wagging_dc,
+        wagging[np.ix_(members_d, members_d)],
+        wagging_cd,
+    )
+    wagging_sum, wagging_square_sum, wagging_fail_count = (
+        change_c[index_c, index_d] + change_d[index_d, index_c]
+        for change_c, change_d in zip(changes_c, changes_d)
+    )
+    return (
+        person_c,
+        person_d,
+        score_c,
+        score_d,
+        wagging_sum,
+        wagging_square_sum,
+        wagging_fail_count,
+    )
+
+
+def _get_category_table(
+    evaluator: IncrementalEvaluator, profile_onehot: np.ndarray, team: int
+) -> np.ndarray:
+    """
+    팀에서 카테고리 선택 조합 p인 사람이 나가고 조합 q인 사람이 들어올 때의 팀 카테고리 점수 표
+
+    input:
+        - profile_onehot: (P, 카테고리 개수, 선택지 개수) 조합별 카테고리 선택
+
+    return:
+        - table: (P, P) [p][q] 교환 후 팀 카테고리 점수 (팀에 조합 p인 사람이 없으면 의미 없는 값)
+    """
+    context = evaluator.context
+    count = np.array(evaluator.category_count[team])
+    move = profile_onehot[None, :] - profile_onehot[:, None]
+    size = len(profile_onehot)
+    scores = _get_team_category_scores(
+        (count + move).reshape(size * size, *count.shape),
+        np.array(context.category_weight),
+        context.max_weight,
+    )
+    return scores.reshape(size, size)
+
+
+def _get_team_changes(
+    old: np.ndarray,
+    stay_to_in: np.ndarray,
+    stay_to_out: np.ndarray,
+    in_to_team: np.ndarray,
+):
+    """
+    팀원 i가 나가고 상대 팀의 k가 들어올 때 팀 안의 꼬리흔들기 누적값(합, 제곱합, 실패 수) 변화량
+
+    남는 팀원 m의 적중 횟수는 old[m] + W[m][k] - W[m][i] 이며 W는 0 또는 1이므로
+    제곱합과 실패 수(값이 0인 팀원 수)도 팀원에 대한 합을 행렬 곱으로 나눠 계산할 수 있다.
+        - 제곱합: (o + u - v)^2 = o^2 + u + v + 2ou - 2ov - 2uv
+        - 실패 수: W[m][i] = 1이면 old[m] >= 1이므로 (o = 0, u = 0) 또는 (o = 1, v = 1, u = 0)일 때만 0
+    모든 팀원에 대한 합에서 나가는 사람 i의 항을 빼고 들어오는 사람 k의 새로운 적중 횟수를 더한다.
+
+    input:
+        - old: (M,) 팀원별 적중 횟수
+        - stay_to_in: (M, K) [m][k] 팀원 m이 상대 팀의 k에게 꼬리를 흔들었는지 여부
+        - stay_to_out: (M, M) [m][i] 팀원 m이 팀원 i에게 꼬리를 흔들었는지 여부
+        - in_to_team: (K, M) [k][m] 상대 팀의 k가 팀원 m에게 꼬리를 흔들었는지 여부
+
+    return:
+        - (합, 제곱합, 실패 수) 변화량, 각각 (M, K) 배열
+    """
+    u_sum = stay_to_in.sum(axis=0)[None, :]
+    v_sum = stay_to_out.sum(axis=0)[:, None]
+    is_zero = (old == 0).astype(np.float64)
+    is_one = (old == 1).astype(np.float64)
+
+    wagging_sum = u_sum - v_sum
+    wagging_square_sum = (
+        u_sum
+        + v_sum
+        + 2 * (old @ stay_to_in)[None, :]
+        - 2 * (old @ stay_to_out)[:, None]
+        - 2 * (stay_to_out.T @ stay_to_in)
+    )
+    wagging_fail_count = (
+        -(is_zero @ stay_to_in)[None, :]
+        + (is_one @ stay_to_out)[:, None]
+        - (stay_to_out * is_one[:, None]).T @ stay_to_in
+    )
+
+    # 위의 합에 들어 있는 나가는 사람 i의 항(W[i][i] = 0)을 빼고
+    # 들어오는 사람 k의 새로운 적중 횟수(나가는 사람 i 제외)를 더함
+    leaving = old[:, None] + stay_to_in
+    entering = in_to_team.sum(axis=1)[None, :] - in_to_team.T
+    wagging_sum += entering - leaving
+    wagging_square_sum += entering * entering - leaving * leaving
+    wagging_fail_count += (entering == 0).astype(np.float64) - (leaving == 0)
+
+    return wagging_sum, wagging_square_sum, wagging_fail_count
+
+
+def _get_best_swap(evaluator: IncrementalEvaluator, deltas: dict):
+    """
+    팀 쌍별 변화량을 현재 누적값과 합쳐서 점수가 가장 낮은 교환을 선택
+
+    return:
+        - (person_a, person_b) 현재 점수보다 좋아지는 교환 중 가장 좋은 교환 (없으면 None)
+    """
+    category_scores = np.array(evaluator.category_scores)
+    team_count = len(category_scores)
+    category_sum = category_scores.sum()
+    category_square_sum = (category_scores * category_scores).sum()
+    n = evaluator.member_count
+
+    best, best_score = None, evaluator.score - MIN_IMPROVEMENT
+    for (team_c, team_d), delta in deltas.items():
+        if delta is None:
+            continue
+        person_c, person_d, score_c, score_d, d_sum, d_square_sum, d_fail_count = delta
+
+        # 두 팀의 점수만 바꾼 카테고리 점수의 평균과 분산
+        old_c, old_d = category_scores[team_c], category_scores[team_d]
+        category_mean = (category_sum - old_c - old_d + score_c + score_d) / team_count
+        category_variance = (
+            category_square_sum
+            - old_c * old_c
+            - old_d * old_d
+            + score_c * score_c
+            + score_d * score_d
+        ) / team_count - category_mean**2
+
+        wagging_sum = evaluator.wagging_sum + d_sum
+        wagging_square_sum = evaluator.wagging_square_sum + d_square_sum
+        scores = _combine_score(
+            category_mean,
+            category_variance,
+            wagging_sum / n,
+            (n * wagging_square_sum - wagging_sum**2) / n**2,
+            evaluator.wagging_fail_count + d_fail_count,
+        )
+
+        index = int(scores.argmin())
+        if scores[index] < best_score:
+            best = (int(person_c[index]), int(person_d[index]))
+            best_score = scores[index]
+    return best
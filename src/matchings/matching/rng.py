@@ -0,0 +1,34 @@
+import random
+
+# 시드의 범위 (32비트 부호 없는 정수)
+SEED_RANGE = 2**32
+
+
+def get_rng(rng=None) -> random.Random:
+    """
+    시드 또는 난수 생성기로 팀 매칭에 사용할 난수 생성기를 반환
+
+    엔진과 초기 해 생성 함수는 모든 무작위 선택에 이 난수 생성기를 사용하므로
+    같은 시드로 실행하면 같은 과정을 그대로 재현할 수 있다.
+
+    input:
+        - rng: random.Random이면 그대로 사용, 정수이면 그 시드로 생성, None이면 임의의 시드로 생성
+    """
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+
+def new_seed() -> int:
+    """
+    재현용으로 기록할 새 시드를 OS 난수로 생성
+    """
+    return random.SystemRandom().randrange(SEED_RANGE)
+
+
+def derive_seeds(seed: int, count: int) -> list[int]:
+    """
+    하나의 시드에서 count개의 시드를 결정적으로 생성 (멀티 스타트의 실행별 시드)
+    """
+    rng = random.Random(seed)
+    return [rng.randrange(SEED_RANGE) for _ in range(count)]
@@ -0,0 +1,67 @@
+import numpy as np
+
+from .affinity import build_affinity, load_affinity
+from .category_score import _get_category_weight, _get_max_weight
+from .room_model import MatchingRoom
+
+
+class RoomContext:
+    """
+    한 번의 팀 매칭 실행 동안 바뀌지 않는 매칭룸 데이터를 미리 계산해 둔 객체
+
+    점수 계산, 증분 평가기, 설명용 통계가 모두 이 객체를 공유한다.
+
+        - room: MatchingRoom
+        - room_id: Room.id (있으면 참가자 쌍별 관계 행렬을 매칭룸 단위로 캐시)
+        - category_weight: 카테고리 가중치 (전체 참가자의 분포로 결정되므로 팀 구성과 무관)
+        - max_weight: 가장 큰 카테고리 가중치
+        - wagging_matrix: (N, N) bool 배열, wagging_matrix[i][j]는 i가 j에게 꼬리를 흔들었는지 여부
+        - category_agreement: (N, N) 배열, 두 참가자가 같은 선택지를 고른 카테고리의 가중치 합 (0 ~ 1)
+
+    팀의 꼬리흔들기 적중 횟수는 wagging_matrix의 부분 행렬 합과 정확히 같다.
+    카테고리 점수는 팀의 최빈값 비율로 계산하므로 쌍별 합으로 분해되지 않으며,
+    category_agreement의 부분 행렬 합은 통계용 팀 응집도 지표로만 사용한다.
+    """
+
+    def __init__(self, room: MatchingRoom, room_id: int = None):
+        self.room = room
+        self.room_id = room_id
+        self.category_weight = _get_category_weight(room)
+        self.max_weight = _get_max_weight(self.category_weight)
+
+        if room_id is None:
+            affinity = build_affinity(room, self.category_weight, self.max_weight)
+        else:
+            affinity = load_affinity(
+                room_id, room, self.category_weight, self.max_weight
+            )
+        self.wagging_matrix = affinity["wagging"]
+        self.category_agreement = affinity["category_agreement"]
+
+        # 반복문 안에서 빠르게 조회할 수 있도록 파이썬 리스트로도 저장
+        self.wagging_rows = self.wagging_matrix.tolist()
+
+    def get_team_wagging_pairs(self, members: list[int]) -> list[tuple[int, int]]:
+        """
+        팀 안에서 꼬리 흔들기가 적중한 (wagger, waggee) 인덱스 쌍을 반환
+        """
+        members = np.asarray(members, dtype=np.int64)
+        waggers, waggees = np.nonzero(self.wagging_matrix[np.ix_(members, members)])
+        return list(zip(members[waggers].tolist(), members[waggees].tolist()))
+
+    def get_team_wagging_count(self, members: list[int]) -> int:
+        """
+        팀 안에서 적중한 꼬리 흔들기 수 (팀원들의 적중 횟수 합)
+        """
+        members = np.asarray(members, dtype=np.int64)
+        return int(self.wagging_matrix[np.ix_(members, members)].sum())
+
+    def get_team_category_agreement(self, members: list[int]) -> float:
+        """
+        팀원 쌍들의 평균 카테고리 일치도 (0 ~ 1, 팀원이 한 명이면 0)
+        """
+        members = np.asarray(members, dtype=np.int64)
+        if len(members) < 2:
+            return 0.0
+        total = float(self.category_agreement[np.ix_(members, members)].sum())
+        return total / (len(members) * (len(members) - 1))
@@ -0,0 +1,102 @@
+from .parameter import CATEGORY, PART_MIN, TEAM_COUNT
+from .rng import get_rng
+from .room_model import CATEGORY_KEYS, MBTI_KEYS, PARTS, MatchingRoom
+
+# 벤치마크(benchmarks)와 테스트(matchings/tests)에서 사용하는 가상 매칭룸 생성기
+# 같은 인자와 시드이면 항상 같은 매칭룸을 만든다.
+
+# 최소 인원을 채우고 남은 참가자를 나눌 파트별 비율
+DEFAULT_PART_MIX = {"PM": 1.0, "DE": 1.0, "FE": 2.0, "BE": 2.0}
+
+
+def get_min_room_size() -> int:
+    """
+    모든 팀이 PART_MIN을 채울 수 있는 최소 참가자 수
+    """
+    return sum(PART_MIN.values()) * TEAM_COUNT
+
+
+def make_participants(
+    size: int, part_mix: dict = None, category_skew: float = 0.0, rng=None
+) -> list[dict]:
+    """
+    가상의 참가자 목록을 생성 (MatchingRoom의 participant_list 형식)
+
+    input:
+        - size: 참가자 수 (get_min_room_size() 이상)
+        - part_mix: 최소 인원(PART_MIN * TEAM_COUNT)을 채우고 남은 참가자를 나눌 파트별 비율
+        - category_skew: 카테고리마다 첫 번째 선택지를 고를 확률을 (1 + category_skew) / 2로 설정 (-1 ~ 1)
+        - rng: 시드 또는 random.Random
+    """
+    min_size = get_min_room_size()
+    if size < min_size:
+        raise ValueError(
+            f"참가자 수({size}명)가 팀 {TEAM_COUNT}개의 파트별 최소 인원({min_size}명)보다 적습니다."
+        )
+    rng = get_rng(rng)
+    part_mix = part_mix or DEFAULT_PART_MIX
+
+    parts = [part for part in PARTS for _ in range(PART_MIN[part] * TEAM_COUNT)]
+    parts += rng.choices(
+        PARTS, weights=[part_mix.get(part, 0) for part in PARTS], k=size - min_size
+    )
+
+    first_rate = (1 + category_skew) / 2
+    participants = []
+    for participant_id, part in enumerate(parts, start=1):
+        participant = {"id": participant_id, "part": part}
+        for key in CATEGORY_KEYS:
+            values = CATEGORY[key]
+            participant[key] = (
+                values[0] if rng.random() < first_rate else rng.choice(values[1:])
+            )
+        for key in MBTI_KEYS:
+            participant[key] = round(rng.random(), 2)
+        participant["devti"] = "".join(
+            letters[participant[key] >= 0.5]
+            for key, letters in zip(MBTI_KEYS, ("EI", "SN", "TF", "JP"))
+        )
+        participants.append(participant)
+    return participants
+
+
+def make_waggings(
+    participants: list[dict], density: float = 0.05, reciprocity: float = 0.3, rng=None
+) -> list[dict]:
+    """
+    가상의 꼬리 흔들기 목록을 생성 (MatchingRoom의 waggings 형식)
+
+    input:
+        - density: 참가자가 다른 참가자 한 명에게 꼬리를 흔들 확률
+        - reciprocity: 꼬리 흔들기를 받은 참가자가 상대에게 다시 꼬리를 흔들 확률
+        - rng: 시드 또는 random.Random
+    """
+    rng = get_rng(rng)
+    ids = [participant["id"] for participant in participants]
+
+    pairs = set()
+    for wagger in ids:
+        for waggee in ids:
+            if wagger == waggee or rng.random() >= density:
+                continue
+            pairs.add((wagger, waggee))
+            if rng.random() < reciprocity:
+                pairs.add((waggee, wagger))
+    return [{"wagger": wagger, "waggee": waggee} for wagger, waggee in sorted(pairs)]
+
+
+def make_room(
+    size: int,
+    part_mix: dict = None,
+    category_skew: float = 0.0,
+    wagging_density: float = 0.05,
+    reciprocity: float = 0.3,
+    seed: int = 0,
+) -> MatchingRoom:
+    """
+    가상의 매칭룸을 생성 (같은 인자와 seed이면 항상 같은 매칭룸)
+    """
+    rng = get_rng(seed)
+    participants = make_participants(size, part_mix, category_skew, rng)
+    waggings = make_waggings(participants, wagging_density, reciprocity, rng)
+    return MatchingRoom(participants, waggings)
@@ -0,0 +1,146 @@
+import numpy as np
+
+from .parameter import CATEGORY, PART_MIN, TEAM_COUNT
+
+PARTS = list(PART_MIN.keys())  # part 코드 -> 파트 이름
+CATEGORY_KEYS = list(CATEGORY.keys())  # category 열 -> 카테고리 이름
+CATEGORY_SIZE = max(len(values) for values in CATEGORY.values())  # 카테고리별 최대 선택지 개수
+MBTI_KEYS = ["ei", "sn", "tf", "jp"]
+
+
+class MatchingRoom:
+    """
+    팀 매칭 알고리즘에서 사용하는 매칭룸 데이터
+
+    참가자를 0부터 시작하는 인덱스로 구분하고, 참가자 정보를 정수로 인코딩한 NumPy 배열로 저장한다.
+    팀 매칭 결과는 참가자 인덱스별 팀 번호를 담은 배열(assignment)로 표현한다.
+
+        - participant_ids: (N,) 인덱스 -> Participant.id
+        - part: (N,) PARTS의 인덱스
+        - category: (N, len(CATEGORY)) 카테고리별 CATEGORY 선택지의 인덱스
+        - mbti: (N, 4) ei, sn, tf, jp 값 (프로필이 없으면 nan)
+        - devti: (N,) devti 이름 리스트
+        - wagger, waggee: (W,) 꼬리 흔들기 주체와 대상의 인덱스
+        - index_of: Participant.id -> 인덱스
+    """
+
+    def __init__(self, participant_list: list[dict], waggings: list[dict] = None):
+        """
+        input:
+            - participant_list = [
+                {
+                    "id": 1,
+                    "part": "PM",
+                    "team_vibe": "learning",
+                    "active_hours": "day",
+                    "meeting_preference": "offline",
+                    "ei": 0.65,
+                    "sn": 0.73,
+                    "tf": 0.42,
+                    "jp": 0.58,
+                    "devti": "골든 리트리버"
+                },
+                {participant},
+                {participant}
+            ]
+
+            - waggings = [
+                {
+                    "wagger": 1,
+                    "waggee": 3
+                },
+                {wagging info},
+                {wagging info}
+            ]
+        """
+        participant_list = [
+            participant
+            for participant in participant_list
+            if self._is_valid_part(participant)
+        ]
+        self.participant_list = participant_list
+
+        self.participant_ids = np.array(
+            [participant["id"] for participant in participant_list], dtype=np.int64
+        )
+        self.index_of = {
+            participant_id: idx
+            for idx, participant_id in enumerate(self.participant_ids.tolist())
+        }
+        self.part = np.array(
+            [PARTS.index(participant["part"]) for participant in participant_list],
+            dtype=np.int8,
+        ).reshape(-1)
+        self.category = np.array(
+            [
+                [CATEGORY[key].index(participant[key]) for key in CATEGORY_KEYS]
+                for participant in participant_list
+            ],
+            dtype=np.int8,
+        ).reshape(-1, len(CATEGORY_KEYS))
+        self.mbti = np.array(
+            [
+                [
+                    np.nan if participant.get(key) is None else participant[key]
+                    for key in MBTI_KEYS
+                ]
+                for participant in participant_list
+            ],
+            dtype=np.float64,
+        ).reshape(-1, len(MBTI_KEYS))
+        self.devti = [participant.get("devti") for participant in participant_list]
+
+        # 매칭룸 밖의 참가자, 자기 자신, 중복된 꼬리 흔들기는 제외
+        wagging_pairs = set()
+        for wagging in waggings or []:
+            wagger = self.index_of.get(wagging["wagger"])
+            waggee = self.index_of.get(wagging["waggee"])
+            if wagger is None or waggee is None or wagger == waggee:
+                continue
+            wagging_pairs.add((wagger, waggee))
+        wagging_pairs = sorted(wagging_pairs)
+        self.wagger = np.array([pair[0] for pair in wagging_pairs], dtype=np.int64)
+        self.waggee = np.array([pair[1] for pair in wagging_pairs], dtype=np.int64)
+
+    @property
+    def size(self) -> int:
+        return len(self.participant_ids)
+
+    def get_team_members(self, assignment: np.ndarray, team_count: int = TEAM_COUNT):
+        """
+        팀별 참가자 인덱스 리스트를 반환
+
+        return:
+            - team_members = [[0, 4, 7, ...], [1, 2, ...], ...]
+        """
+        team_members = [[] for _ in range(team_count)]
+        for idx, team in enumerate(assignment.tolist()):
+            team_members[team].append(idx)
+        return team_members
+
+    def to_team_list(
+        self, assignment: np.ndarray, team_count: int = TEAM_COUNT
+    ) -> list[list[dict]]:
+        """
+        팀 매칭 결과를 참가자 딕셔너리 리스트 형식으로 변환 (DB 저장용)
+
+        return:
+            - team_list = [
+                [{participant}, {participant}, ...],
+                [],
+                ...
+            ]
+        """
+        return [
+            [self.participant_list[idx] for idx in members]
+            for members in self.get_team_members(assignment, team_count)
+        ]
+
+    @staticmethod
+    def _is_valid_part(participant: dict) -> bool:
+        if participant.get("part") in PART_MIN:
+            return True
+        print(
+            f"id: {participant['id']} 참가자의 파트를 구분할 수 없습니다. (해당 인원을 제외하고 팀 매팅 진행)"
+        )
+        return False
@@ -1,32 +1,33 @@
-import random
 import math
+import time
+
+import numpy as np
 
 from .category_score import get_category_score
 from .wagging_score import get_wagging_score
-from .parameter import TEAM_COUNT, PART_MIN
-
-
-def _get_team_template(participant_list: list[dict]) -> list[str, int]:
+from .incremental_score import IncrementalEvaluator, get_solution_score
+from .budget import SearchBudget
+from .parameter import (
+    BUDGET_CHECK_INTERVAL,
+    MIN_BATCH_SIZE,
+    MATCHING_PATIENCE,
+    MATCHING_TIME_BUDGET,
+    PART_MIN,
+    TEAM_COUNT,
+)
+from .rng import get_rng
+from .room_context import RoomContext
+from .room_model import PARTS, MatchingRoom
+from .swap_sampler import SwapSampler
+
+
+def _get_team_template(room: MatchingRoom, team_count: int = TEAM_COUNT) -> list[dict]:
     """
     참가자 수와 파트당 인원에 적절한 팀 매칭 템플릿을 생성
 
     input:
-        - participant_list = [
-            {
-                "id": 1,
-                "part": "pm",
-                "team_vibe": "learning",
-                "active_hours": "day",
-                "meeting_preference": "offline",
-                "openness": 0.73,
-                "conscientiousness": 0.82,
-                "extraversion": 0.41,
-                "agreeableness": 0.78,
-                "neuroticism": 0.32
-            },
-            {participant},
-            {participant}
-        ]
+        - room: MatchingRoom
+        - team_count: 생성할 팀의 개수
 
     return:
         - team_template = [
@@ -40,120 +41,67 @@ def _get_team_template(participant_list: list[dict]) -> list[str, int]:
             {team size},
         ]
     """
-    part_total = {
-        role: 0 for role in PART_MIN.keys()
-    }  # 팀 매칭 참여자들의 파트별 인원수 통계값
-    for participant in participant_list:
-        if participant.get("part") not in part_total:
-            print(
-                f"id: {participant['id']} 참가자의 파트를 구분할 수 없습니다. (해당 인원을 제외하고 팀 매팅 진행)"
-            )
-            continue
-        part_total[participant["part"]] += 1
-
-    # TEAM_COUNT 만큼의 팀을 생성할 수 있는지 여부 판단
+    # 팀 매칭 참여자들의 파트별 인원수 통계값
+    part_total = dict(
+        zip(PARTS, np.bincount(room.part, minlength=len(PARTS)).tolist())
+    )
+
+    # team_count 만큼의 팀을 생성할 수 있는지 여부 판단
     team_max = min(
         (part_total[part] // min_cnt) if min_cnt > 0 else float("inf")
         for part, min_cnt in PART_MIN.items()
     )
-    if TEAM_COUNT > team_max:
+    if team_count > team_max:
         print("설정한 팀의 개수만큼 팀을 생성할 수 없습니다.")
         return []
 
     team_template = [
-        {part: part_total[part] // TEAM_COUNT for part in part_total.keys()}
-        for _ in range(TEAM_COUNT)
+        {part: part_total[part] // team_count for part in part_total.keys()}
+        for _ in range(team_count)
     ]
 
     # 파트별로 남은 인원 분배
-    leftovers = {part: part_total[part] % TEAM_COUNT for part in part_total.keys()}
+    leftovers = {part: part_total[part] % team_count for part in part_total.keys()}
     team_idx = 0
 
     for part, left_count in leftovers.items():
         for _ in range(left_count):
             team_template[team_idx][part] += 1
-            team_idx = (team_idx + 1) % TEAM_COUNT
+            team_idx = (team_idx + 1) % team_count
 
     return team_template
 
 
-def random_team_assignment(participant_list: list[dict]) -> list[dict]:
+def random_team_assignment(room: MatchingRoom, rng=None) -> np.ndarray:
     """
     초기 팀 매칭 템플릿을 랜덤으로 생성
 
     input:
-        - participant_list = [
-            {
-                "id": 1,
-                "part": "pm",
-                "team_vibe": "learning",
-                "active_hours": "day",
-                "meeting_preference": "offline",
-                "openness": 0.73,
-                "conscientiousness": 0.82,
-                "extraversion": 0.41,
-                "agreeableness": 0.78,
-                "neuroticism": 0.32
-            },
-            {participant},
-            {participant}
-        ]
-
-        - team_template = [
-            {
-                "pm": 1,
-                "de": 1,
-                "fe": 2,
-                "be": 3
-            }
-            {team size},
-            {team size},
-        ]
+        - room: MatchingRoom
+        - rng: 시드 또는 random.Random (None이면 임의의 시드)
 
     return:
-        - team_list = [
-            [
-                {
-                    "id" 1,
-                    "team_vibe": "빡세게",
-                    "active_hours": "밤",
-                    "meeting_preference": "온라인",
-                    "waggee_list": [1, 3, 4, 5, 6, 9],
-                    "openness": 0.84,
-                    "conscientiousness": 0.34,
-                    "extraversion": 0.56,
-                    "agreeableness": 0.34,
-                    "neuroticism': 0.99,
-                },
-                {},
-                {},
-                ...
-            ],
-            [],
-            []
-        ]
+        - assignment = [0, 3, 1, ...] 참가자 인덱스별 팀 번호
     """
-    team_template = _get_team_template(participant_list)
+    team_template = _get_team_template(room)
     if not team_template:
         raise ValueError("요청하신 개수만큼의 팀을 생성할 수 없습니다.")
 
-    part_groups = {part: [] for part in PART_MIN.keys()}
-
     # 참여자들을 파트별로 분리해서 저장
-    for participant in participant_list:
-        part = participant.get("part")
-        part_groups[part].append(participant)
+    part_groups = {
+        part: np.flatnonzero(room.part == part_idx).tolist()
+        for part_idx, part in enumerate(PARTS)
+    }
 
     # 파트별로 랜덤하게 셔플
+    rng = get_rng(rng)
     for part in part_groups.keys():
-        random.shuffle(part_groups[part])
+        rng.shuffle(part_groups[part])
 
-    team_list = []
+    assignment = np.zeros(room.size, dtype=np.int64)
     for team_id in range(len(team_template)):
 
         # 파트별로 인원 수 채우기
-        team = []
-        # team = {"id": team_id + 1}
         for part, required_count in team_template[team_id].items():
 
             if len(part_groups[part]) < required_count:
@@ -163,195 +111,196 @@ def random_team_assignment(participant_list: list[dict]) -> list[dict]:
 
             for _ in range(required_count):
                 person = part_groups[part].pop()
-                team.append(person)
+                assignment[person] = team_id
 
-        team_list.append(team)
+    return assignment
 
-    return team_list
 
-
-def evaluate_solution(team_list: list[list[dict]], waggings: list[dict] = None):
+def evaluate_solution(
+    context: RoomContext, assignment: np.ndarray, team_count: int = TEAM_COUNT
+):
     """
     팀 매칭의 품질을 평가하는 함수
     낮은 점수일수록 좋은 매칭을 의미함 (최소화 문제)
 
     input:
-        - team_list = [
-            [
-                {
-                    "id" 1,
-                    "team_vibe": "빡세게",
-                    "active_hours": "밤",
-                    "meeting_preference": "온라인",
-                    "waggee_list": [1, 3, 4, 5, 6, 9],
-                    "openness": 0.84,
-                    "conscientiousness": 0.34,
-                    "extraversion": 0.56,
-                    "agreeableness": 0.34,
-                    "neuroticism': 0.99,
-                },
-                {},
-                {},
-                ...
-            ],
-            [],
-            []
-        ]
-
-        - waggings = [
-            {
-                "id": 1,
-                "wagger": 1,
-                "waggee": 3
-            },
-            {wagging info},
-            {wagging info}
-        ]
+        - context: RoomContext
+        - assignment = [0, 3, 1, ...] 참가자 인덱스별 팀 번호
 
     return:
         - score: 알고리즘에 사용되는 점수
     """
 
     # 카테고리 점수 계산 (높을수록 좋음)
-    category_scores = get_category_score(team_list)
-
-    # 카테고리 점수의 평균과 분산 계산
-    # 평균: 전체적인 매칭 품질
-    # 분산: 팀 간 균형 (분산이 낮을수록 모든 팀이 고르게 좋음)
-    category_mean = sum(category_scores) / len(category_scores)
-    category_variance = sum(
-        (score - category_mean) ** 2 for score in category_scores
-    ) / len(category_scores)
+    category_scores = get_category_score(context, assignment, team_count)
 
     # 꼬리흔들기 점수 계산 (높을수록 좋음)
-    wagging_scores, _ = get_wagging_score(team_list, waggings)
+    wagging_scores, _ = get_wagging_score(context.room, assignment, team_count)
 
     # 꼬리흔들기에 성공하지 못한 사람의 수를 계산 후 패널티 부여
-    wagging_fail_count = wagging_scores.count(0)
-
-    wagging_mean = sum(wagging_scores) / len(wagging_scores)
-    wagging_variance = sum(
-        (score - wagging_mean) ** 2 for score in wagging_scores
-    ) / len(wagging_scores)
-
-    # 3. 최종 점수 계산 (낮을수록 좋게 변환)
-    # 가중치 설정
-    w_category_mean = 2.0  # 카테고리 매칭의 평균 품질
-    w_category_var = 0.1  # 팀 간 카테고리 균형
-    w_wagging_mean = 2.0  # 꼬리흔들기 매칭의 평균 품질
-    w_wagging_var = 0.1  # 팀 간 꼬리흔들기 균형
-    w_wagging_penalty = 50.0  # 꼬리흔들기 매칭 실패 패널티
-
-    # 높은 점수를 낮은 비용으로 변환 (음수 사용)
-    # 분산은 그대로 사용 (낮을수록 좋음)
-    score = (
-        -w_category_mean * category_mean  # 카테고리 평균이 높을수록 비용 감소
-        + w_category_var * category_variance  # 분산이 낮을수록 비용 감소
-        + -w_wagging_mean * wagging_mean  # 꼬리흔들기 평균이 높을수록 비용 감소
-        + w_wagging_var * wagging_variance  # 분산이 낮을수록 비용 감소
-        + w_wagging_penalty * wagging_fail_count
+    wagging_fail_count = int(np.count_nonzero(wagging_scores == 0))
+
+    # 최종 점수 계산 (낮을수록 좋게 변환)
+    return get_solution_score(
+        category_scores,
+        int(wagging_scores.sum()),
+        int((wagging_scores * wagging_scores).sum()),
+        wagging_fail_count,
+        context.room.size,
     )
 
-    return score
 
-
-def neighbor_solution(teams):
+def simulated_annealing(
+    context: RoomContext,
+    initial_assignment: np.ndarray,
+    initial_temp=1.0,
+    min_temp=0.001,
+    time_budget=MATCHING_TIME_BUDGET,
+    patience=MATCHING_PATIENCE,
+    max_iterations=None,
+    batch_size=64,
+    rng=None,
+    telemetry=None,
+):
     """
-    현재 팀 매칭에서 두 명의 멤버를 교환하여 이웃 해를 생성
+    담금질 기법으로 팀 매칭 결과를 최적화
+
+    온도는 예산의 진행률에 맞춰 initial_temp에서 min_temp까지 지수적으로 감소한다.
+    (시간 예산을 모두 쓰는 시점에 min_temp에 도달)
+    최고 점수가 patience번 동안 개선되지 않으면 예산이 남아 있어도 종료한다.
+
+    채택률이 낮아지면(연속으로 거절되는 후보가 많아지면) 교환 후보를 묶음으로 뽑아 점수를 한 번에 계산(get_swap_scores)하고
+    후보마다 메트로폴리스 판정을 한 뒤 처음으로 채택된 후보만 적용한다.
+    거절된 후보는 순차 담금질에서 상태가 그대로인 반복과 같으므로 후보를 하나씩 판정하는 것과 같은 과정이다.
+    채택률이 높을 때는 NumPy 호출 비용이 더 크므로 후보를 하나씩 판정한다.
 
     input:
-        - teams = [
-            [member1, member2, member3, ...],  # team 1
-            [member1, member2, ...],           # team 2
-            ...
-        ]
+        - context: RoomContext
+        - initial_assignment: 초기 해
+        - initial_temp, min_temp: 시작/종료 온도
+        - time_budget: 실행 시간 예산 (초, None이면 max_iterations만 사용)
+        - patience: 조기 종료 기준 반복 횟수 (None이면 조기 종료하지 않음)
+        - max_iterations: 최대 반복 횟수 (None이면 시간 예산만 사용)
+        - batch_size: 한 번에 평가하는 교환 후보의 최대 개수
+        - rng: 시드 또는 random.Random (같은 시드와 max_iterations로 실행하면 같은 결과)
+        - telemetry: 탐색 통계를 기록할 SolverTelemetry (None이면 기록하지 않음)
 
     return:
-        - new_teams: 새로운 팀 매칭 (깊은 복사)
+        - best_assignment: 가장 좋은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - best_score: best_assignment의 점수
     """
-    # 깊은 복사로 원본 teams 훼손 방지
-    new_teams = [[member.copy() for member in team] for team in teams]
-
-    # 팀이 2개 미만이거나 전체 인원이 2명 미만이면 swap 불가
-    if len(new_teams) < 2:
-        return new_teams
-
-    total_members = sum(len(team) for team in new_teams)
-    if total_members < 2:
-        return new_teams
-
-    # 두 명의 멤버를 무작위로 선택하여 교환
-    max_iter = 200
-    for _ in range(max_iter):
-        # 랜덤하게 두 개의 다른 팀 선택
-        team_a_idx, team_b_idx = random.sample(range(len(new_teams)), 2)
-
-        # 각 팀이 비어있지 않은지 확인
-        if len(new_teams[team_a_idx]) == 0 or len(new_teams[team_b_idx]) == 0:
-            continue
-
-        # 각 팀에서 랜덤하게 한 명씩 선택
-        person_a_idx = random.randint(0, len(new_teams[team_a_idx]) - 1)
-        person_b_idx = random.randint(0, len(new_teams[team_b_idx]) - 1)
-
-        person_a = new_teams[team_a_idx][person_a_idx]
-        person_b = new_teams[team_b_idx][person_b_idx]
-
-        # 같은 파트끼리만 교환 (파트 제약 유지)
-        if person_a.get("part") == person_b.get("part"):
-            # 교환 수행
-            new_teams[team_a_idx][person_a_idx] = person_b
-            new_teams[team_b_idx][person_b_idx] = person_a
-            break
+    budget = SearchBudget(time_budget, max_iterations, patience)
 
-    return new_teams
+    # 매 반복마다 전체 팀을 다시 평가하지 않도록 증분 평가기 사용
+    rng = get_rng(rng)
+    evaluator = IncrementalEvaluator(context, initial_assignment)
+    sampler = SwapSampler(context.room, initial_assignment, rng=rng)
+    current_score = evaluator.score
 
-
-def simulated_annealing(
-    initial_solution,
-    waggings=None,
-    initial_temp=1.0,
-    min_temp=0.001,
-    cooling_rate=0.995,
-    max_iterations=10000,
-):
-    current_solution = initial_solution
-    current_score = evaluate_solution(current_solution, waggings)
-
-    best_solution = current_solution
+    best_assignment = evaluator.assignment.copy()
     best_score = current_score
 
-    T = initial_temp
-
-    iteration = 0
-    while T > min_temp and iteration < max_iterations:
+    # 교환할 수 있는 쌍이 없으면 더 이상 개선할 수 없음
+    if not sampler.has_move:
+        if telemetry is not None:
+            telemetry.finish(0)
+        return best_assignment, best_score
 
-        # 1) neighbor 생성
-        new_solution = neighbor_solution(current_solution)
-        new_score = evaluate_solution(new_solution, waggings)
+    log_temp_ratio = math.log(min_temp / initial_temp)
+    T = initial_temp
+    band = None
 
-        # 2) score 차이
-        delta = new_score - current_score
+    # 채택 사이의 평균 후보 수 (지수 이동 평균), 묶음 크기를 정하는 데 사용
+    run_length = 1.0
+    rejected = 0
 
-        # 3) 더 좋으면 무조건 채택
-        if delta < 0:
-            accept = True
+    iteration = 0
+    next_check = 0
+    while not budget.is_stalled(iteration):
+
+        # 0) 시계 확인은 비용이 있으므로 일정 주기마다 진행률과 온도를 갱신
+        if iteration >= next_check:
+            progress = budget.get_progress(iteration)
+            if progress >= 1:
+                break
+            T = initial_temp * math.exp(log_temp_ratio * progress)
+            next_check = iteration + BUDGET_CHECK_INTERVAL
+            if telemetry is not None:
+                band = telemetry.get_band(T)
+
+        batch = min(int(run_length), batch_size)
+        if batch < MIN_BATCH_SIZE:
+            # 1) neighbor 생성 (같은 파트의 두 멤버를 선택해서 제자리에서 교환)
+            if telemetry is not None:
+                started = time.perf_counter()
+            swap = sampler.sample()
+            if telemetry is not None:
+                sampled = time.perf_counter()
+            new_score = evaluator.apply_swap(*swap)
+            if telemetry is not None:
+                telemetry.record_time(sampled - started, time.perf_counter() - sampled)
+
+            # 2) score 차이
+            delta = new_score - current_score
+
+            # 3) 더 좋으면 무조건 채택, 4) 더 나쁜 해는 확률적으로 채택
+            accept = delta < 0 or rng.random() < math.exp(-delta / T)
+            iteration += 1
+            if telemetry is not None:
+                telemetry.record_proposals(band, 1, accept)
+            if not accept:
+                evaluator.undo()
+                rejected += 1
+                run_length = max(run_length, rejected)
+                continue
         else:
-            # 4) 더 나쁜 해는 확률적으로 채택
-            p = math.exp(-delta / T)
-            accept = random.random() < p
-
-        if accept:
-            current_solution = new_solution
-            current_score = new_score
-
-        # 5) best 업데이트
+            # 1) neighbor 후보를 묶음으로 생성
+            if telemetry is not None:
+                started = time.perf_counter()
+            swaps = [sampler.sample() for _ in range(batch)]
+            person_a, person_b = zip(*swaps)
+            if telemetry is not None:
+                sampled = time.perf_counter()
+
+            # 2) score 차이
+            deltas = evaluator.get_swap_scores(person_a, person_b) - current_score
+            if telemetry is not None:
+                telemetry.record_time(sampled - started, time.perf_counter() - sampled)
+
+            # 3) 더 좋으면 무조건 채택, 4) 더 나쁜 해는 확률적으로 채택
+            p = np.exp(-np.maximum(deltas, 0) / T)
+            accept = (deltas < 0) | (np.array([rng.random() for _ in swaps]) < p)
+            if not accept.any():
+                iteration += batch
+                rejected += batch
+                run_length = max(run_length, rejected)
+                if telemetry is not None:
+                    telemetry.record_proposals(band, batch, 0)
+                continue
+
+            # 처음으로 채택된 후보를 제자리에서 교환 (이전 후보들은 거절된 반복)
+            chosen = int(accept.argmax())
+            swap = swaps[chosen]
+            new_score = evaluator.apply_swap(*swap)
+            iteration += chosen + 1
+            rejected += chosen
+            if telemetry is not None:
+                telemetry.record_proposals(band, chosen + 1, 1)
+
+        evaluator.commit()
+        sampler.swap(*swap)
+        current_score = new_score
+        run_length = 0.9 * run_length + 0.1 * (rejected + 1)
+        rejected = 0
+
+        # 5) best 업데이트 (best가 바뀔 때만 팀 구성을 복사)
         if current_score < best_score:
-            best_solution = current_solution
+            best_assignment = evaluator.assignment.copy()
             best_score = current_score
+            budget.record_improvement(iteration)
+            if telemetry is not None:
+                telemetry.record_best(iteration, best_score)
 
-        # 온도 감소
-        T *= cooling_rate
-        iteration += 1
-
-    return best_solution, best_score
+    if telemetry is not None:
+        telemetry.finish(iteration)
+    return best_assignment, best_score
@@ -0,0 +1,48 @@
+from django.db.models import Prefetch
+
+from users.models import Profile
+from ..models import Participant, Room, Wagging
+from .room_model import MatchingRoom
+
+PROFILE_FIELDS = ["ei", "sn", "tf", "jp", "devti"]
+
+
+def get_matching_room(matching_room: Room) -> MatchingRoom:
+    """
+    매칭룸의 참가자, 프로필, 꼬리 흔들기를 DB에서 읽어서 MatchingRoom으로 변환
+
+    참가자 수와 관계없이 쿼리 3회(참가자와 사용자, 프로필, 꼬리 흔들기)로 읽는다.
+    팀 매칭 엔진과 설명 생성은 모두 이 함수로 매칭룸을 읽는다.
+    (대시보드는 관계 지표를 계산하지 않으므로 매칭 결과의 팀원만 쿼리 1회로 읽음)
+    """
+    # 참가자 인덱스가 실행마다 같도록 id 순으로 정렬 (같은 시드로 재현하기 위해 필요)
+    # 사용자당 프로필은 id가 가장 작은 것을 사용 (profile_set.first()와 같음)
+    participants = (
+        Participant.objects.filter(room=matching_room)
+        .select_related("user")
+        .prefetch_related(
+            Prefetch(
+                "user__profile_set",
+                queryset=Profile.objects.only("user", *PROFILE_FIELDS).order_by("id"),
+                to_attr="profiles",
+            )
+        )
+        .order_by("id")
+    )
+    participant_list = []
+    for p in participants:
+        profile = p.user.profiles[0] if p.user.profiles else None
+        participant = {
+            "id": p.id, "part": p.part, "team_vibe": p.team_vibe,
+            "active_hours": p.active_hours, "meeting_preference": p.meeting_preference,
+        }
+        for field in PROFILE_FIELDS:
+            participant[field] = getattr(profile, field) if profile else None
+        participant_list.append(participant)
+
+    waggings = list(
+        Wagging.objects.filter(wagger__room=matching_room)
+        .order_by("id")
+        .values("wagger", "waggee")
+    )
+    return MatchingRoom(participant_list, waggings)
@@ -0,0 +1,95 @@
+from itertools import accumulate
+
+import numpy as np
+
+from .parameter import TEAM_COUNT
+from .rng import get_rng
+from .room_model import PARTS, MatchingRoom
+
+
+class SwapSampler:
+    """
+    같은 파트이면서 서로 다른 팀에 있는 두 참가자를 O(1)로 뽑는 샘플러
+
+    파트별, 팀별 참가자 인덱스 리스트를 유지한다.
+    같은 파트끼리만 교환하므로 파트별 팀 인원수는 교환해도 바뀌지 않는다.
+    따라서 교환 가능한 파트와 팀 목록은 처음에 한 번만 계산한다.
+    무작위 선택에는 rng(시드 또는 random.Random)를 사용한다.
+    """
+
+    def __init__(
+        self,
+        room: MatchingRoom,
+        assignment: np.ndarray,
+        team_count: int = TEAM_COUNT,
+        rng=None,
+    ):
+        self.rng = get_rng(rng)
+        self.part = room.part.tolist()
+        self.team = assignment.tolist()
+
+        # members[파트][팀] = [참가자 인덱스, ...]
+        self.members = [[[] for _ in range(team_count)] for _ in PARTS]
+        self.position = [0] * room.size  # 참가자별 members 안에서의 위치
+        for person, team in enumerate(self.team):
+            part_members = self.members[self.part[person]][team]
+            self.position[person] = len(part_members)
+            part_members.append(person)
+
+        # 파트별로 해당 파트 인원이 있는 팀 목록
+        self.part_teams = [
+            [team for team in range(team_count) if self.members[part][team]]
+            for part in range(len(PARTS))
+        ]
+
+        # 교환 가능한 파트와 파트별 교환 가능한 쌍의 수 (파트를 뽑을 때 가중치로 사용)
+        self.swappable_parts = []
+        pair_counts = []
+        for part, teams in enumerate(self.part_teams):
+            if len(teams) < 2:
+                continue
+            sizes = [len(self.members[part][team]) for team in teams]
+            self.swappable_parts.append(part)
+            pair_counts.append(
+                (sum(sizes) ** 2 - sum(size * size for size in sizes)) // 2
+            )
+        self.cum_weights = list(accumulate(pair_counts))
+
+    @property
+    def has_move(self) -> bool:
+        """
+        교환 가능한 두 참가자가 존재하는지 여부
+        """
+        return bool(self.swappable_parts)
+
+    def sample(self):
+        """
+        같은 파트이면서 서로 다른 팀에 있는 두 참가자를 무작위로 선택
+
+        return:
+            - (person_a, person_b) 교환할 두 참가자의 인덱스
+            - 교환할 수 있는 쌍이 없으면 None
+        """
+        if not self.swappable_parts:
+            return None
+
+        rng = self.rng
+        part = rng.choices(self.swappable_parts, cum_weights=self.cum_weights)[0]
+        team_a, team_b = rng.sample(self.part_teams[part], 2)
+        return (
+            rng.choice(self.members[part][team_a]),
+            rng.choice(self.members[part][team_b]),
+        )
+
+    def swap(self, person_a: int, person_b: int):
+        """
+        두 참가자의 교환을 인덱스에 반영 (한 번 더 호출하면 원래대로 돌아감)
+        """
+        part = self.part[person_a]
+        team_a, team_b = self.team[person_a], self.team[person_b]
+        pos_a, pos_b = self.position[person_a], self.position[person_b]
+
+        self.members[part][team_a][pos_a] = person_b
+        self.members[part][team_b][pos_b] = person_a
+        self.position[person_a], self.position[person_b] = pos_b, pos_a
+        self.team[person_a], self.team[person_b] = team_b, team_a
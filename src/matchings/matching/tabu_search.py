@@ -0,0 +1,122 @@
+import time
+
+import numpy as np
+
+from .budget import SearchBudget
+from .incremental_score import IncrementalEvaluator
+from .parameter import MATCHING_PATIENCE, MATCHING_TIME_BUDGET, TEAM_COUNT
+from .rng import get_rng
+from .room_context import RoomContext
+from .swap_sampler import SwapSampler
+
+
+def tabu_search(
+    context: RoomContext,
+    initial_assignment: np.ndarray,
+    tenure=None,
+    batch_size=64,
+    time_budget=MATCHING_TIME_BUDGET,
+    patience=MATCHING_PATIENCE,
+    max_iterations=None,
+    rng=None,
+    telemetry=None,
+):
+    """
+    타부 탐색으로 팀 매칭 결과를 최적화
+
+    매 반복마다 교환 후보를 batch_size개 뽑아 get_swap_scores()로 점수를 한 번에 계산하고,
+    타부가 아닌 후보 중 가장 좋은 교환을 (점수가 나빠지더라도) 적용한다.
+    참가자가 떠난 팀으로 tenure번 동안 돌아가지 못하게 막아서(최근성 메모리) 같은 해를 맴도는 것을 방지한다.
+    단, 타부인 교환이라도 지금까지의 최고 점수보다 좋아지면 허용한다(aspiration).
+
+    input:
+        - context: RoomContext
+        - initial_assignment: 초기 해
+        - tenure: 타부 유지 기간 (이동 횟수, None이면 참가자 수에 비례)
+        - batch_size: 한 번의 이동을 위해 평가하는 교환 후보 수
+        - time_budget: 실행 시간 예산 (초, None이면 max_iterations만 사용)
+        - patience: 최고 점수가 이 횟수의 후보 평가 동안 개선되지 않으면 조기 종료
+        - max_iterations: 최대 후보 평가 횟수 (None이면 시간 예산만 사용)
+        - rng: 시드 또는 random.Random (교환 후보 추출에 사용)
+        - telemetry: 탐색 통계를 기록할 SolverTelemetry (온도가 없으므로 채택률은 하나의 구간으로 기록)
+
+    return:
+        - best_assignment: 가장 좋은 팀 매칭 (참가자 인덱스별 팀 번호)
+        - best_score: best_assignment의 점수
+    """
+    # 반복 횟수는 평가한 교환 후보 수 기준으로 센다 (담금질과 같은 기준)
+    budget = SearchBudget(time_budget, max_iterations, patience)
+
+    room = context.room
+    evaluator = IncrementalEvaluator(context, initial_assignment)
+    sampler = SwapSampler(room, initial_assignment, rng=get_rng(rng))
+    current_score = evaluator.score
+
+    best_assignment = evaluator.assignment.copy()
+    best_score = current_score
+
+    # 교환할 수 있는 쌍이 없으면 더 이상 개선할 수 없음
+    if not sampler.has_move:
+        if telemetry is not None:
+            telemetry.finish(0)
+        return best_assignment, best_score
+
+    if tenure is None:
+        tenure = max(5, room.size // 8)
+
+    # tabu_until[참가자][팀]: 참가자가 해당 팀으로 돌아갈 수 있게 되는 이동 번호
+    tabu_until = [[0] * TEAM_COUNT for _ in range(room.size)]
+    team = sampler.team
+
+    move = 0
+    iteration = 0
+    while not budget.is_stalled(iteration) and budget.get_progress(iteration) < 1:
+
+        # 1) 교환 후보를 묶음으로 평가해서 가장 좋은 허용 후보 선택
+        if telemetry is not None:
+            started = time.perf_counter()
+        swaps = [sampler.sample() for _ in range(batch_size)]
+        person_a, person_b = zip(*swaps)
+        if telemetry is not None:
+            sampled = time.perf_counter()
+        scores = evaluator.get_swap_scores(person_a, person_b)
+        iteration += batch_size
+        if telemetry is not None:
+            telemetry.record_time(sampled - started, time.perf_counter() - sampled)
+
+        # 타부가 아니거나, 타부라도 최고 점수를 갱신하면 허용(aspiration)
+        allowed = np.array(
+            [
+                tabu_until[a][team[b]] <= move and tabu_until[b][team[a]] <= move
+                for a, b in swaps
+            ]
+        ) | (scores < best_score)
+
+        # 모든 후보가 타부이면 다음 묶음으로
+        if telemetry is not None:
+            telemetry.record_proposals(None, batch_size, int(allowed.any()))
+        if not allowed.any():
+            continue
+        best_swap = swaps[int(np.where(allowed, scores, np.inf).argmin())]
+
+        # 2) 선택한 교환을 적용하고 떠난 팀으로의 복귀를 타부로 등록
+        person_a, person_b = best_swap
+        tabu_until[person_a][team[person_a]] = move + tenure
+        tabu_until[person_b][team[person_b]] = move + tenure
+
+        current_score = evaluator.apply_swap(person_a, person_b)
+        evaluator.commit()
+        sampler.swap(person_a, person_b)
+        move += 1
+
+        # 3) best 업데이트
+        if current_score < best_score:
+            best_assignment = evaluator.assignment.copy()
+            best_score = current_score
+            budget.record_improvement(iteration)
+            if telemetry is not None:
+                telemetry.record_best(iteration, best_score)
+
+    if telemetry is not None:
+        telemetry.finish(iteration)
+    return best_assignment, best_score
@@ -1,17 +1,49 @@
 from config.celery import app as celery_app
-from django.db import transaction
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 
-from ..models import Participant, Room, Team, Result, Member, Wagging
-from .simulated_annealing import random_team_assignment, simulated_annealing
+from ..models import Participant, Room, Result
+from .room_context import RoomContext
+from .snapshot import get_matching_room
+from .persistence import load_assignment, save_matching_result, save_team_explanations
+from .pipeline import get_engine_params, solve_matching
 from .explain import get_matching_explanations
+from .rng import new_seed
+
+
+def replay_matching(result: Result, **engine_kwargs):
+    """
+    Result에 기록된 시드와 실행 설정으로 팀 매칭을 다시 실행 (DB에 저장하지 않음, 프로파일링용)
+
+    시간 예산으로 끝난 실행은 실행 환경에 따라 반복 횟수가 달라지므로,
+    정확히 같은 과정을 재현하려면 engine_kwargs로 max_iterations를 지정하고 time_budget=None을 넘긴다.
+    매칭룸의 참가자나 꼬리 흔들기가 그 사이 바뀌었으면 다른 결과가 나올 수 있다.
+
+    input:
+        - result: seed와 engine_params가 기록된 Result
+        - engine_kwargs: 기록된 엔진 인자 대신 사용할 값
+
+    return:
+        - best_assignment, score, run_stats: solve_matching()의 반환값 (실행 통계는 항상 기록)
+    """
+    if result.seed is None:
+        raise ValueError(f"ID가 {result.id}인 매칭 결과에는 재현용 시드가 기록되어 있지 않습니다.")
+
+    engine_params = {**get_engine_params(), **result.engine_params}
+    engine_params["engine_kwargs"] = {**engine_params["engine_kwargs"], **engine_kwargs}
+    room = get_matching_room(result.room)
+    context = RoomContext(room, result.room_id)
+    return solve_matching(context, result.seed, engine_params, telemetry=True)
 
 
 @celery_app.task
-def run_matching_task(room_id):
+def run_matching_task(room_id, engine=None, polish=None, seed=None):
     """
     백그라운드에서 매칭 알고리즘을 실행하는 Celery Task.
+
+    engine: 사용할 최적화 엔진 이름 (engines.ENGINES의 키 또는 engines.EXACT_ENGINE, 없으면 MATCHING_ENGINE)
+    polish: 엔진 실행 후 최급 하강법으로 다듬을지 여부 (없으면 MATCHING_POLISH)
+    seed: 난수 시드 (없으면 새로 생성), 실행 설정과 함께 Result에 저장되어 replay_matching()으로 재현 가능
     """
     try:
         matching_room = Room.objects.get(id=room_id)
@@ -26,41 +58,27 @@ def run_matching_task(room_id):
         # 모든 참가자의 carrot 상태를 False로 초기화
         Participant.objects.filter(room=matching_room).update(carrot=False)
 
-        participants = Participant.objects.filter(room=matching_room).select_related("user")
-        participant_list = []
-        participant_ids = []
-        for p in participants:
-            profile = getattr(p.user, "profile_set", None)
-            if profile:
-                profile = profile.first()
-            participant_list.append({
-                "id": p.id, "part": p.part, "team_vibe": p.team_vibe,
-                "active_hours": p.active_hours, "meeting_preference": p.meeting_preference,
-                "ei": profile.ei if profile else None, "sn": profile.sn if profile else None,
-                "tf": profile.tf if profile else None, "jp": profile.jp if profile else None,
-                "devti": profile.devti if profile else None,
-            })
-            participant_ids.append(p.id)
-
-        waggings = list(
-            Wagging.objects.filter(wagger__id__in=participant_ids).values(
-                "wagger", "waggee"
-            )
+        room = get_matching_room(matching_room)
+        # 가중치와 꼬리 흔들기 인접 행렬을 한 번만 계산 (관계 행렬은 매칭룸 단위로 캐시되어 재매칭 시 재사용)
+        context = RoomContext(room, matching_room.id)
+
+        # 재현할 수 있도록 시드와 실행 설정을 정해서 Result에 함께 저장
+        seed = new_seed() if seed is None else seed
+        engine_params = get_engine_params(engine, polish)
+        best_assignment, score, run_stats = solve_matching(context, seed, engine_params)
+
+        # 저장할 때만 참가자 딕셔너리 형식으로 변환
+        best_team_list = room.to_team_list(best_assignment)
+
+        # 새로운 매칭 결과를 저장 (참가자 수와 관계없이 일정한 횟수의 쿼리)
+        # 설명글은 LLM 호출을 기다리지 않도록 비워 두고 explain_matching_task에서 채움
+        result = save_matching_result(
+            matching_room,
+            best_team_list,
+            seed=seed,
+            engine_params=engine_params,
+            run_stats=run_stats,
         )
-        initial_team = random_team_assignment(participant_list)
-        best_team_list, score = simulated_annealing(initial_team, waggings)
-        explanations = get_matching_explanations(best_team_list, waggings)
-
-        # 새로운 매칭 결과를 저장
-        with transaction.atomic():
-            result = Result.objects.create(room=matching_room)
-            for i, team in enumerate(best_team_list):
-                team_instance = Team.objects.create(
-                    team_number=i + 1, result=result, explanation=explanations[i].reason
-                )
-                for member in team:
-                    participant_obj = Participant.objects.get(id=member["id"])
-                    Member.objects.create(team=team_instance, participant=participant_obj)
 
         # rematch_count를 1 증가
         matching_room.rematch_count += 1
@@ -86,3 +104,50 @@ def run_matching_task(room_id):
             "payload": {"new_state": matching_room.status, "error": f"매칭 과정에서 오류가 발생했습니다: {str(e)}"},
         }
         async_to_sync(channel_layer.group_send)(room_group_name, error_event)
+        return
+
+    # 팀을 먼저 공개한 뒤 팀별 설명글 생성
+    # (팀 매칭은 이미 저장하고 공개했으므로 설명글 Task를 보내지 못해도 매칭룸 상태는 되돌리지 않음)
+    try:
+        explain_matching_task.delay(result.id)
+    except Exception as e:
+        print(f"ID가 {result.id}인 매칭 결과의 설명글 생성 Task를 보낼 수 없습니다: {str(e)}")
+
+
+@celery_app.task
+def explain_matching_task(result_id):
+    """
+    저장된 팀 매칭 결과의 팀별 설명글을 생성해서 저장하는 Celery Task.
+
+    run_matching_task가 팀을 저장하고 공개한 뒤 실행되며,
+    설명글을 저장하면 팀마다 team.explanation_ready 이벤트를 전송한다.
+    LLM 호출이 실패한 팀은 대체 설명글을 사용하고, 그 밖의 오류가 나면 팀 매칭 결과는 그대로 두고 설명글만 비워 둔다.
+    """
+    try:
+        result = Result.objects.select_related("room").get(id=result_id)
+    except Result.DoesNotExist:
+        print(f"ID가 {result_id}인 매칭 결과가 존재하지 않아 설명글 생성 Task를 건너뜁니다.")
+        return
+
+    try:
+        room = get_matching_room(result.room)
+        context = RoomContext(room, result.room_id)
+        assignment = load_assignment(result, room)
+        explanations = get_matching_explanations(context, assignment)
+        teams = save_team_explanations(result, explanations)
+    except Exception as e:
+        print(f"ID가 {result_id}인 매칭 결과의 설명글 생성에 실패했습니다: {str(e)}")
+        return
+
+    room_group_name = f"room_{result.room_id}"
+    channel_layer = get_channel_layer()
+    for team in teams:
+        explanation_event = {
+            "type": "team.explanation_ready",
+            "payload": {
+                "result_id": result.id,
+                "team_number": team.team_number,
+                "explanation": team.explanation,
+            },
+        }
+        async_to_sync(channel_layer.group_send)(room_group_name, explanation_event)
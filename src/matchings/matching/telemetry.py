@@ -0,0 +1,137 @@
+import math
+import time
+
+from .parameter import TELEMETRY_BANDS_PER_DECADE, TELEMETRY_TRACE_SIZE
+
+
+class SolverTelemetry:
+    """
+    엔진 실행 한 번의 탐색 통계를 기록하는 객체 (엔진의 telemetry 인자로 전달)
+
+        - iterations: 엔진의 반복 횟수 (엔진마다 세는 기준은 SearchBudget과 같음)
+        - proposals, accepted: 점수를 계산한 이웃 해 후보 수와 채택한 수
+        - bands: 온도 구간별 [후보 수, 채택 수] (구간은 온도의 log10을 TELEMETRY_BANDS_PER_DECADE로 나눈 칸)
+        - neighbor_time, scoring_time: 이웃 해 생성과 점수 계산에 걸린 시간 (초)
+        - best_trace: 최고 점수가 바뀔 때마다 [반복 번호, 경과 시간, 점수]
+        - elapsed: 엔진 실행 시간 (초)
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.iterations = 0
+        self.proposals = 0
+        self.accepted = 0
+        self.bands = {}
+        self.neighbor_time = 0.0
+        self.scoring_time = 0.0
+        self.best_trace = []
+        self.elapsed = 0.0
+
+    @staticmethod
+    def get_band(temperature):
+        """
+        온도가 속한 구간 번호 (온도가 없는 엔진은 None)
+        """
+        if temperature is None:
+            return None
+        return math.floor(math.log10(temperature) * TELEMETRY_BANDS_PER_DECADE)
+
+    def record_proposals(self, band, proposals: int, accepted: int):
+        """
+        band 구간에서 proposals개의 후보를 평가하고 accepted개를 채택했음을 기록
+        """
+        self.proposals += proposals
+        self.accepted += accepted
+        counts = self.bands.get(band)
+        if counts is None:
+            self.bands[band] = [proposals, accepted]
+        else:
+            counts[0] += proposals
+            counts[1] += accepted
+
+    def record_time(self, neighbor_time: float, scoring_time: float):
+        self.neighbor_time += neighbor_time
+        self.scoring_time += scoring_time
+
+    def record_best(self, iteration: int, score: float):
+        self.best_trace.append(
+            [iteration, time.perf_counter() - self.start_time, score]
+        )
+
+    def finish(self, iterations: int):
+        """
+        엔진이 끝날 때 반복 횟수와 실행 시간을 기록
+        """
+        self.iterations = iterations
+        self.elapsed = time.perf_counter() - self.start_time
+
+    def to_dict(self, trace_size: int = TELEMETRY_TRACE_SIZE) -> dict:
+        """
+        JSON으로 저장할 수 있는 통계 (최고 점수 궤적은 최대 trace_size개로 줄임)
+        """
+        return {
+            "iterations": self.iterations,
+            "proposals": self.proposals,
+            "accepted": self.accepted,
+            "elapsed": self.elapsed,
+            "neighbor_time": self.neighbor_time,
+            "scoring_time": self.scoring_time,
+            "bands": [
+                [band, counts[0], counts[1]] for band, counts in self.bands.items()
+            ],
+            "best_trace": _downsample(self.best_trace, trace_size),
+        }
+
+
+def _downsample(trace: list, size: int) -> list:
+    """
+    처음과 마지막 점을 포함해서 고른 간격으로 최대 size개의 점을 선택
+    """
+    if len(trace) <= size:
+        return list(trace)
+    step = (len(trace) - 1) / (size - 1)
+    return [trace[round(i * step)] for i in range(size)]
+
+
+def summarize_runs(runs: list[dict], best_index: int) -> dict:
+    """
+    멀티 스타트의 실행별 통계(SolverTelemetry.to_dict())를 MatchingRun에 저장할 형식으로 합산
+
+    acceptance는 온도 구간별 채택률, best_trace는 가장 좋은 결과를 낸 실행의 궤적이다.
+    온도 구간이 없는 엔진(타부 탐색)은 온도를 None으로 기록한다.
+    """
+    bands = {}
+    for run in runs:
+        for band, proposals, accepted in run["bands"]:
+            counts = bands.setdefault(band, [0, 0])
+            counts[0] += proposals
+            counts[1] += accepted
+
+    acceptance = []
+    for band in sorted(bands, key=lambda band: (band is None, band)):
+        proposals, accepted = bands[band]
+        acceptance.append(
+            {
+                "min_temp": None
+                if band is None
+                else 10 ** (band / TELEMETRY_BANDS_PER_DECADE),
+                "max_temp": None
+                if band is None
+                else 10 ** ((band + 1) / TELEMETRY_BANDS_PER_DECADE),
+                "proposals": proposals,
+                "accepted": accepted,
+                "acceptance_rate": accepted / proposals if proposals else 0.0,
+            }
+        )
+
+    elapsed = sum(run["elapsed"] for run in runs)
+    proposals = sum(run["proposals"] for run in runs)
+    return {
+        "iterations": sum(run["iterations"] for run in runs),
+        "elapsed": elapsed,
+        "proposals_per_second": proposals / elapsed if elapsed > 0 else 0.0,
+        "neighbor_time": sum(run["neighbor_time"] for run in runs),
+        "scoring_time": sum(run["scoring_time"] for run in runs),
+        "acceptance": acceptance,
+        "best_trace": runs[best_index]["best_trace"],
+    }
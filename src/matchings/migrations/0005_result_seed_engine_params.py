@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matchings', '0004_room_rematch_count_alter_participant_role'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='result',
+            name='engine_params',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='result',
+            name='seed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matchings', '0005_result_seed_engine_params'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchingRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('engine', models.CharField(max_length=30)),
+                ('score', models.FloatField()),
+                ('iterations', models.BigIntegerField()),
+                ('elapsed', models.FloatField()),
+                ('proposals_per_second', models.FloatField()),
+                ('neighbor_time', models.FloatField()),
+                ('scoring_time', models.FloatField()),
+                ('acceptance', models.JSONField(default=list)),
+                ('best_trace', models.JSONField(default=list)),
+                ('starts', models.JSONField(default=list)),
+                ('polish_improvement', models.FloatField(blank=True, null=True)),
+                ('polish_seconds', models.FloatField(blank=True, null=True)),
+                ('polish_converged', models.BooleanField(blank=True, null=True)),
+                ('exact_gap', models.FloatField(blank=True, null=True)),
+                ('exact_proven', models.BooleanField(blank=True, null=True)),
+                ('result', models.OneToOneField(db_column='result_id', on_delete=django.db.models.deletion.CASCADE, related_name='matching_run', to='matchings.result')),
+            ],
+            options={
+                'db_table': 'matching_run',
+            },
+        ),
+    ]
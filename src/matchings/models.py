@@ -90,10 +90,51 @@ class Result(models.Model):
 
     room = models.ForeignKey("Room", on_delete=models.CASCADE, db_column="room_id")
 
+    # 팀 매칭을 재현하기 위한 시드와 엔진 설정 (matching.tasks.replay_matching에서 사용)
+    seed = models.BigIntegerField(null=True, blank=True)
+    engine_params = models.JSONField(default=dict, blank=True)
+
     class Meta:
         db_table = "result"
 
 
+class MatchingRun(models.Model):
+    """
+    팀 매칭 엔진 실행 통계 테이블 (매칭 결과마다 하나)
+    """
+
+    result = models.OneToOneField(
+        "Result",
+        related_name="matching_run",
+        on_delete=models.CASCADE,
+        db_column="result_id",
+    )
+    engine = models.CharField(max_length=30)
+    score = models.FloatField()  # 마무리 탐색까지 끝난 최종 점수
+
+    # 멀티 스타트의 모든 실행을 합산한 값
+    iterations = models.BigIntegerField()
+    elapsed = models.FloatField()  # 엔진 실행 시간 (초)
+    proposals_per_second = models.FloatField()
+    neighbor_time = models.FloatField()  # 이웃 해 생성에 걸린 시간 (초)
+    scoring_time = models.FloatField()  # 점수 계산에 걸린 시간 (초)
+    acceptance = models.JSONField(default=list)  # 온도 구간별 후보 수, 채택 수, 채택률
+
+    best_trace = models.JSONField(default=list)  # 가장 좋은 실행의 [반복 번호, 경과 시간, 점수]
+    starts = models.JSONField(default=list)  # 실행별 시드, 점수, 반복 횟수, 실행 시간
+
+    # 마무리 탐색을 실행한 경우의 개선량, 실행 시간 (초), 국소 최적해 도달 여부 (False이면 시간 제한으로 중단)
+    polish_improvement = models.FloatField(null=True, blank=True)
+    polish_seconds = models.FloatField(null=True, blank=True)
+    polish_converged = models.BooleanField(null=True, blank=True)
+    exact_gap = models.FloatField(null=True, blank=True)  # 분기 한정법의 최적해와의 최대 차이
+    # 분기 한정법이 시간 제한 안에 최적해임을 증명했는지 여부 (False이면 증명하지 못함, 실행하지 않았으면 None)
+    exact_proven = models.BooleanField(null=True, blank=True)
+
+    class Meta:
+        db_table = "matching_run"
+
+
 class Team(models.Model):
     """
     팀 명단 테이블
@@ -113,3 +113,9 @@ class RoomConsumer(AsyncJsonWebsocketConsumer):
         carrot.new 이벤트 핸들러
         '''
         await self.send_json(event)
+
+    async def team_explanation_ready(self, event):
+        '''
+        team.explanation_ready 이벤트 핸들러 (팀별 매칭 설명글 생성 완료)
+        '''
+        await self.send_json(event)
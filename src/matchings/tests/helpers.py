@@ -0,0 +1,46 @@
+from django.utils import timezone
+
+from matchings.matching.room_factory import make_participants, make_waggings
+from matchings.models import Participant, Room, Wagging
+from users.models import Profile, User
+
+
+def create_room(size: int, seed: int = 0) -> Room:
+    """
+    room_factory의 가상 참가자와 꼬리 흔들기로 테스트용 매칭룸을 DB에 생성
+    """
+    room = Room.objects.create(
+        room_name=f"room {seed}",
+        participant_code="code",
+        admin_code="admin",
+        matching_at=timezone.now(),
+        status=Room.Status.MATCHING,
+    )
+    participants = make_participants(size, rng=seed)
+    participant_of = {}
+    for p in participants:
+        user = User.objects.create_user(
+            email=f"user{seed}_{p['id']}@example.com", username=f"user{p['id']}"
+        )
+        Profile.objects.create(
+            user=user, devti=p["devti"], ei=p["ei"], sn=p["sn"], tf=p["tf"], jp=p["jp"]
+        )
+        participant_of[p["id"]] = Participant.objects.create(
+            room=room,
+            user=user,
+            username=user.username,
+            role=Participant.Role.PARTICIPANT,
+            part=p["part"],
+            team_vibe=p["team_vibe"],
+            active_hours=p["active_hours"],
+            meeting_preference=p["meeting_preference"],
+            ei=p["ei"],
+            sn=p["sn"],
+            tf=p["tf"],
+            jp=p["jp"],
+        )
+    Wagging.objects.bulk_create(
+        Wagging(wagger=participant_of[w["wagger"]], waggee=participant_of[w["waggee"]])
+        for w in make_waggings(participants, rng=seed)
+    )
+    return room
@@ -0,0 +1,62 @@
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+
+from matchings.dashboard.views import DashboardAPIView
+from matchings.matching.persistence import save_matching_result
+from matchings.matching.simulated_annealing import random_team_assignment
+from matchings.matching.snapshot import get_matching_room
+from matchings.models import Participant
+from users.models import User
+
+from .helpers import create_room
+
+
+class DashboardTest(TestCase):
+    """
+    대시보드가 매칭룸의 전체 파트 분포와 최근 매칭 결과의 팀별 분포를 반환하는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matching_room = create_room(30, seed=9)
+        room = get_matching_room(cls.matching_room)
+        cls.team_list = room.to_team_list(random_team_assignment(room, rng=0))
+        save_matching_result(cls.matching_room, cls.team_list)
+
+        # 파트를 고르지 않은 참가자는 팀 매칭에서는 빠지지만 전체 파트 분포에는 포함
+        user = User.objects.create_user(email="nopart@example.com", username="nopart")
+        Participant.objects.create(
+            room=cls.matching_room,
+            user=user,
+            username=user.username,
+            role=Participant.Role.PARTICIPANT,
+            part="",
+            team_vibe="learning",
+            active_hours="day",
+            meeting_preference="offline",
+            ei=0.5,
+            sn=0.5,
+            tf=0.5,
+            jp=0.5,
+        )
+
+    def get_dashboard(self):
+        request = APIRequestFactory().get(f"/dashboard/{self.matching_room.id}/")
+        return DashboardAPIView.as_view()(request, room_id=self.matching_room.id)
+
+    def test_part_dist(self):
+        response = self.get_dashboard()
+        self.assertEqual(response.status_code, 200)
+
+        part_dist_total = response.data["part_dist_total"]
+        self.assertEqual(part_dist_total[""], 1)
+        self.assertEqual(sum(part_dist_total.values()), 31)
+
+        part_dist = response.data["part_dist"]
+        self.assertEqual(len(part_dist), len(self.team_list))
+        for team, counts in zip(self.team_list, part_dist):
+            for part in ["PM", "DE", "FE", "BE"]:
+                self.assertEqual(
+                    counts[part], sum(1 for member in team if member["part"] == part)
+                )
+        self.assertNotIn("affinity_dist", response.data)
@@ -0,0 +1,86 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from matchings.matching.engines import ENGINES, INITIALIZERS, get_engine
+from matchings.matching.room_context import RoomContext
+from matchings.matching.room_factory import make_room
+from matchings.matching.simulated_annealing import evaluate_solution, random_team_assignment
+from matchings.matching.telemetry import SolverTelemetry
+
+# 실행 시간과 무관하게 같은 양만 탐색하도록 반복 횟수로만 종료
+ENGINE_KWARGS = {"time_budget": None, "patience": None, "max_iterations": 500}
+
+
+def get_team_parts(room, assignment):
+    """
+    팀별 파트 인원 구성 (같은 파트끼리만 교환하므로 엔진 실행 전후로 같아야 함)
+    """
+    return sorted(
+        tuple(np.bincount(room.part[members], minlength=4))
+        for members in room.get_team_members(assignment)
+    )
+
+
+class EngineSmokeTest(SimpleTestCase):
+    """
+    ENGINES의 모든 엔진이 올바른 팀 매칭과 점수를 반환하는지 확인
+    """
+
+    def setUp(self):
+        self.context = RoomContext(make_room(42, seed=3))
+        self.initial_assignment = random_team_assignment(self.context.room, rng=0)
+
+    def run_engine(self, name, seed=0):
+        telemetry = SolverTelemetry()
+        assignment, score = ENGINES[name](
+            self.context,
+            self.initial_assignment,
+            rng=seed,
+            telemetry=telemetry,
+            **ENGINE_KWARGS,
+        )
+        return assignment, score, telemetry
+
+    def test_engines(self):
+        initial_score = evaluate_solution(self.context, self.initial_assignment)
+        for name in ENGINES:
+            with self.subTest(engine=name):
+                assignment, score, telemetry = self.run_engine(name)
+                self.assertEqual(
+                    get_team_parts(self.context.room, assignment),
+                    get_team_parts(self.context.room, self.initial_assignment),
+                )
+                self.assertAlmostEqual(score, evaluate_solution(self.context, assignment), places=9)
+                self.assertLessEqual(score, initial_score + 1e-9)
+                self.assertGreater(telemetry.iterations, 0)
+
+    def test_engines_are_seeded(self):
+        for name in ENGINES:
+            with self.subTest(engine=name):
+                first, first_score, _ = self.run_engine(name, seed=7)
+                second, second_score, _ = self.run_engine(name, seed=7)
+                np.testing.assert_array_equal(first, second)
+                self.assertEqual(first_score, second_score)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            get_engine("tempering")
+
+    def test_initializers(self):
+        for name, initializer in INITIALIZERS.items():
+            with self.subTest(initializer=name):
+                assignment = initializer(self.context, 0)
+                self.assertEqual(
+                    get_team_parts(self.context.room, assignment),
+                    get_team_parts(self.context.room, self.initial_assignment),
+                )
+
+    def test_greedy_initializer(self):
+        # 탐욕적 초기 해는 무작위 초기 해보다 평균적으로 좋아야 함
+        scores = {
+            name: np.mean(
+                [evaluate_solution(self.context, initializer(self.context, seed)) for seed in range(5)]
+            )
+            for name, initializer in INITIALIZERS.items()
+        }
+        self.assertLess(scores["greedy"], scores["random"])
@@ -0,0 +1,157 @@
+import itertools
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from matchings.matching.exact_solver import _BranchAndBound, exact_search
+from matchings.matching.multi_start import run_multi_start
+from matchings.matching.parameter import MATCHING_EXACT_MAX_SIZE, MATCHING_EXACT_TIME_SHARE
+from matchings.matching.pipeline import get_engine_params, solve_matching
+from matchings.matching.room_context import RoomContext
+from matchings.matching.room_factory import make_participants, make_room, make_waggings
+from matchings.matching.room_model import PARTS, MatchingRoom
+from matchings.matching.simulated_annealing import (
+    _get_team_template,
+    evaluate_solution,
+    random_team_assignment,
+)
+
+# 모든 팀 매칭을 나열할 수 있도록 팀 2개, 파트별 인원이 짝수인 작은 매칭룸
+SMALL_TEAM_COUNT = 2
+SMALL_PART_SIZES = {"PM": 2, "DE": 4, "FE": 4, "BE": 6}
+
+# 반복 횟수로만 종료해서 실행 환경과 무관하게 같은 첫 번째 상한을 사용
+EXACT_PARAMS = {
+    "polish_time_limit": None,
+    "exact_time_limit": 30.0,
+    "engine_kwargs": {"time_budget": None, "patience": None, "max_iterations": 2000},
+}
+
+
+def make_small_room(seed: int) -> MatchingRoom:
+    participants = make_participants(60, rng=seed)
+    selected = []
+    for part, size in SMALL_PART_SIZES.items():
+        selected += [p for p in participants if p["part"] == part][:size]
+    return MatchingRoom(selected, make_waggings(selected, density=0.2, rng=seed))
+
+
+def brute_force(context: RoomContext, team_count: int):
+    """
+    팀 템플릿을 지키는 모든 팀 매칭의 점수 중 최솟값과 첫 번째 팀 매칭
+    """
+    room = context.room
+    template = _get_team_template(room, team_count)
+    part_members = [np.flatnonzero(room.part == part).tolist() for part in range(len(PARTS))]
+
+    # 파트마다 팀별 인원수만큼 나누는 모든 방법
+    part_splits = []
+    for part, members in enumerate(part_members):
+        slots = [team for team in range(team_count) for _ in range(template[team][PARTS[part]])]
+        part_splits.append(set(itertools.permutations(slots)))
+
+    best_score, first = float("inf"), None
+    for splits in itertools.product(*part_splits):
+        assignment = np.zeros(room.size, dtype=np.int64)
+        for members, split in zip(part_members, splits):
+            assignment[members] = split
+        if first is None:
+            first = assignment
+        best_score = min(best_score, evaluate_solution(context, assignment, team_count))
+    return best_score, first
+
+
+class ExactSearchTest(SimpleTestCase):
+    """
+    분기 한정법이 모든 팀 매칭을 나열한 결과와 같은 최적해를 찾고 최적성을 증명하는지 확인
+    """
+
+    def test_matches_brute_force(self):
+        for seed in range(4):
+            with self.subTest(seed=seed):
+                context = RoomContext(make_small_room(seed))
+                best_score, initial_assignment = brute_force(context, SMALL_TEAM_COUNT)
+
+                assignment, score, gap = exact_search(
+                    context, initial_assignment, 30.0, SMALL_TEAM_COUNT
+                )
+                self.assertEqual(gap, 0)
+                self.assertAlmostEqual(score, best_score, places=9)
+                self.assertAlmostEqual(
+                    evaluate_solution(context, assignment, SMALL_TEAM_COUNT), score, places=9
+                )
+
+    def test_keeps_initial_assignment_on_timeout(self):
+        context = RoomContext(make_room(36, seed=1))
+        initial_assignment = random_team_assignment(context.room, rng=0)
+        initial_score = evaluate_solution(context, initial_assignment)
+
+        assignment, score, gap = exact_search(context, initial_assignment, 0.0)
+        self.assertGreater(gap, 0)
+        self.assertLessEqual(score, initial_score)
+        self.assertAlmostEqual(evaluate_solution(context, assignment), score, places=9)
+
+
+class ExactPipelineTest(SimpleTestCase):
+    """
+    exact 엔진이 멀티 스타트 담금질 기법의 결과로 분기 한정법을 한 번만 실행하는지 확인
+    """
+
+    def test_proves_small_room(self):
+        context = RoomContext(make_room(30, seed=0))
+        params = {**get_engine_params("exact"), **EXACT_PARAMS}
+        _, score, run_stats = solve_matching(context, 1, params, telemetry=True)
+        self.assertIs(run_stats["exact_proven"], True)
+        self.assertEqual(run_stats["exact_gap"], 0)
+        self.assertEqual(run_stats["engine"], "exact")
+
+        # 같은 첫 번째 상한에서 시작한 담금질 기법보다 나쁠 수 없음
+        annealing = {**params, "engine": "annealing"}
+        _, annealing_score, _ = solve_matching(context, 1, annealing, telemetry=True)
+        self.assertLessEqual(score, annealing_score + 1e-9)
+
+    def test_runs_once_within_time_budget(self):
+        context = RoomContext(make_room(30, seed=1))
+        params = {
+            **get_engine_params("exact"),
+            "polish": False,
+            "engine_kwargs": {"time_budget": 0.4, "patience": None},
+        }
+        with mock.patch(
+            "matchings.matching.pipeline.exact_search", wraps=exact_search
+        ) as search, mock.patch(
+            "matchings.matching.pipeline.run_multi_start",
+            wraps=run_multi_start,
+        ) as multi_start:
+            solve_matching(context, 1, params, telemetry=True)
+
+        search.assert_called_once()
+        exact_time_limit = search.call_args.args[2]
+        self.assertAlmostEqual(exact_time_limit, 0.4 * MATCHING_EXACT_TIME_SHARE)
+        self.assertEqual(multi_start.call_args.args[1], "annealing")
+        self.assertAlmostEqual(
+            multi_start.call_args.kwargs["time_budget"], 0.4 - exact_time_limit
+        )
+
+    def test_large_room_skips_exact_search(self):
+        context = RoomContext(make_room(MATCHING_EXACT_MAX_SIZE + 6, seed=0))
+        params = {**get_engine_params("exact"), **EXACT_PARAMS}
+        with mock.patch("matchings.matching.pipeline.exact_search") as search:
+            _, _, run_stats = solve_matching(context, 1, params, telemetry=True)
+        search.assert_not_called()
+        self.assertNotIn("exact_proven", run_stats)
+
+
+
+class CategoryUpperCacheTest(SimpleTestCase):
+    """
+    팀 구성별 카테고리 점수 상한 캐시가 탐색 중에 재사용되는지 확인 (값의 정확성은 ExactSearchTest에서 확인)
+    """
+
+    def test_cache_hits(self):
+        context = RoomContext(make_room(30, seed=4))
+        search = _BranchAndBound(context, random_team_assignment(context.room, rng=0), 0.2)
+        search.run()
+        info = search.category_upper.cache_info()
+        self.assertGreater(info.hits, info.misses)
@@ -0,0 +1,120 @@
+import random
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from matchings.matching.incremental_score import IncrementalEvaluator
+from matchings.matching.room_context import RoomContext
+from matchings.matching.room_factory import make_room
+from matchings.matching.simulated_annealing import evaluate_solution, random_team_assignment
+
+
+def random_swap(room, assignment, rng):
+    """
+    같은 파트이면서 팀이 다른 두 참가자를 임의로 선택
+    """
+    while True:
+        person_a, person_b = rng.sample(range(room.size), 2)
+        if (
+            room.part[person_a] == room.part[person_b]
+            and assignment[person_a] != assignment[person_b]
+        ):
+            return person_a, person_b
+
+
+def swapped(assignment, swap):
+    """
+    두 참가자의 팀을 교환한 복사본
+    """
+    person_a, person_b = swap
+    assignment = assignment.copy()
+    assignment[person_a], assignment[person_b] = assignment[person_b], assignment[person_a]
+    return assignment
+
+
+class IncrementalEvaluatorTest(SimpleTestCase):
+    """
+    증분 평가 결과가 전체 재계산(evaluate_solution)과 같은지 확인
+    """
+
+    def setUp(self):
+        self.context = RoomContext(make_room(60, wagging_density=0.08, seed=1))
+        self.rng = random.Random(0)
+        self.evaluator = IncrementalEvaluator(
+            self.context, random_team_assignment(self.context.room, rng=0)
+        )
+
+    def assertMatchesFullScore(self, score, assignment):
+        self.assertAlmostEqual(score, evaluate_solution(self.context, assignment), places=9)
+
+    def test_initial_score(self):
+        self.assertMatchesFullScore(self.evaluator.score, self.evaluator.assignment)
+
+    def test_apply_swap(self):
+        evaluator = self.evaluator
+        for _ in range(300):
+            swap = random_swap(self.context.room, evaluator.assignment, self.rng)
+            expected = swapped(evaluator.assignment, swap)
+            score = evaluator.apply_swap(*swap)
+            evaluator.commit()
+            np.testing.assert_array_equal(evaluator.assignment, expected)
+            self.assertMatchesFullScore(score, expected)
+
+    def test_get_swap_score(self):
+        evaluator = self.evaluator
+        for _ in range(100):
+            swap = random_swap(self.context.room, evaluator.assignment, self.rng)
+            self.assertMatchesFullScore(
+                evaluator.get_swap_score(*swap), swapped(evaluator.assignment, swap)
+            )
+
+    def test_undo_and_commit(self):
+        evaluator = self.evaluator
+        for _ in range(300):
+            before = evaluator.assignment.copy()
+            before_score = evaluator.score
+
+            swap = random_swap(self.context.room, evaluator.assignment, self.rng)
+            evaluator.apply_swap(*swap)
+            if self.rng.random() < 0.5:
+                self.assertAlmostEqual(evaluator.undo(), before_score, places=9)
+                np.testing.assert_array_equal(evaluator.assignment, before)
+            else:
+                evaluator.commit()
+                np.testing.assert_array_equal(evaluator.assignment, swapped(before, swap))
+            self.assertMatchesFullScore(evaluator.score, evaluator.assignment)
+
+    def test_undo_several_swaps(self):
+        evaluator = self.evaluator
+        before = evaluator.assignment.copy()
+        before_score = evaluator.score
+        for _ in range(5):
+            evaluator.apply_swap(
+                *random_swap(self.context.room, evaluator.assignment, self.rng)
+            )
+        for _ in range(5):
+            evaluator.undo()
+        np.testing.assert_array_equal(evaluator.assignment, before)
+        self.assertAlmostEqual(evaluator.score, before_score, places=9)
+        self.assertMatchesFullScore(evaluator.score, evaluator.assignment)
+
+    def test_get_swap_scores(self):
+        evaluator = self.evaluator
+        for _ in range(20):
+            swaps = [
+                random_swap(self.context.room, evaluator.assignment, self.rng)
+                for _ in range(32)
+            ]
+            person_a, person_b = zip(*swaps)
+            before = evaluator.assignment.copy()
+            scores = evaluator.get_swap_scores(person_a, person_b)
+            self.assertEqual(scores.shape, (len(swaps),))
+            for swap, score in zip(swaps, scores):
+                self.assertMatchesFullScore(score, swapped(evaluator.assignment, swap))
+                self.assertAlmostEqual(score, evaluator.get_swap_score(*swap), places=9)
+
+            # 묶음 평가는 상태를 바꾸지 않으므로 이어서 교환을 적용해도 결과가 같아야 함
+            np.testing.assert_array_equal(evaluator.assignment, before)
+            evaluator.apply_swap(*swaps[0])
+            evaluator.commit()
+            self.assertMatchesFullScore(evaluator.score, evaluator.assignment)
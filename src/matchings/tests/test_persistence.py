@@ -0,0 +1,106 @@
+import numpy as np
+from django.test import TestCase
+
+from matchings.matching.persistence import (
+    load_assignment,
+    save_matching_result,
+    save_team_explanations,
+)
+from matchings.matching.room_context import RoomContext
+from matchings.matching.simulated_annealing import random_team_assignment
+from matchings.matching.snapshot import get_matching_room
+from matchings.matching.telemetry import SolverTelemetry, summarize_runs
+from matchings.models import MatchingRun, Member, Team
+
+from .helpers import create_room
+
+# TestCase는 테스트마다 트랜잭션 안에서 실행되므로 transaction.atomic()이 SAVEPOINT, RELEASE SAVEPOINT 쿼리를 추가
+SAVEPOINT_QUERIES = 2
+
+
+class PersistenceQueryTest(TestCase):
+    """
+    팀 매칭 결과 저장과 복원이 참가자 수와 관계없이 일정한 횟수의 쿼리로 실행되는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matching_room = create_room(42, seed=5)
+
+    def setUp(self):
+        self.room = get_matching_room(self.matching_room)
+        self.assignment = random_team_assignment(self.room, rng=0)
+
+    def get_run_stats(self):
+        telemetry = SolverTelemetry()
+        telemetry.finish(0)
+        run = {**telemetry.to_dict(), "seed": 1, "score": 0.0}
+        return {"engine": "annealing", **summarize_runs([run], 0), "score": 0.0}
+
+    def test_save_and_load(self):
+        team_list = self.room.to_team_list(self.assignment)
+        with self.assertNumQueries(5 + SAVEPOINT_QUERIES):
+            result = save_matching_result(
+                self.matching_room,
+                team_list,
+                seed=1,
+                engine_params={"engine": "annealing"},
+                run_stats=self.get_run_stats(),
+            )
+        self.assertEqual(Team.objects.filter(result=result).count(), len(team_list))
+        self.assertEqual(Member.objects.filter(team__result=result).count(), 42)
+        self.assertTrue(MatchingRun.objects.filter(result=result).exists())
+
+        with self.assertNumQueries(1):
+            assignment = load_assignment(result, self.room)
+        np.testing.assert_array_equal(assignment, self.assignment)
+
+    def test_save_without_run_stats(self):
+        with self.assertNumQueries(4 + SAVEPOINT_QUERIES):
+            save_matching_result(
+                self.matching_room, self.room.to_team_list(self.assignment)
+            )
+
+    def test_save_team_explanations(self):
+        team_list = self.room.to_team_list(self.assignment)
+        result = save_matching_result(self.matching_room, team_list)
+        explanations = [f"팀 {i + 1}" for i in range(len(team_list))]
+        with self.assertNumQueries(2):
+            teams = save_team_explanations(result, explanations)
+        self.assertEqual([team.explanation for team in teams], explanations)
+        self.assertEqual(
+            list(
+                Team.objects.filter(result=result)
+                .order_by("team_number")
+                .values_list("explanation", flat=True)
+            ),
+            explanations,
+        )
+
+    def test_load_assignment_after_participant_left(self):
+        result = save_matching_result(
+            self.matching_room, self.room.to_team_list(self.assignment)
+        )
+        self.matching_room.participant_set.order_by("id").first().delete()
+        with self.assertRaises(ValueError):
+            load_assignment(result, self.room)
+
+
+class SnapshotQueryTest(TestCase):
+    """
+    매칭룸 스냅샷을 참가자 수와 관계없이 일정한 횟수의 쿼리로 읽는지 확인
+    """
+
+    def test_get_matching_room(self):
+        for size, seed in [(30, 1), (60, 2)]:
+            with self.subTest(size=size):
+                matching_room = create_room(size, seed=seed)
+                with self.assertNumQueries(3):
+                    room = get_matching_room(matching_room)
+                self.assertEqual(room.size, size)
+                # 참가자 인덱스는 id 순서
+                self.assertEqual(
+                    [room.index_of[pid] for pid in sorted(room.index_of)], list(range(size))
+                )
+                context = RoomContext(room)
+                self.assertGreater(int(context.wagging_matrix.sum()), 0)
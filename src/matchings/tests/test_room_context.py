@@ -0,0 +1,44 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from matchings.matching.category_score import _get_category_weight, _get_max_weight
+from matchings.matching.room_context import RoomContext
+from matchings.matching.room_factory import make_room
+from matchings.matching.simulated_annealing import random_team_assignment
+from matchings.matching.wagging_score import get_wagging_score
+
+
+class RoomContextTest(SimpleTestCase):
+    """
+    미리 계산한 가중치와 꼬리 흔들기 인접 행렬이 매칭룸 데이터와 일치하는지 확인
+    """
+
+    def setUp(self):
+        self.room = make_room(60, wagging_density=0.08, seed=2)
+        self.context = RoomContext(self.room)
+
+    def test_category_weight(self):
+        self.assertEqual(self.context.category_weight, _get_category_weight(self.room))
+        self.assertEqual(
+            self.context.max_weight, _get_max_weight(self.context.category_weight)
+        )
+
+    def test_wagging_matrix(self):
+        expected = np.zeros((self.room.size, self.room.size), dtype=bool)
+        expected[self.room.wagger, self.room.waggee] = True
+        np.testing.assert_array_equal(self.context.wagging_matrix, expected)
+        self.assertEqual(self.context.wagging_rows, expected.tolist())
+
+    def test_team_wagging_count(self):
+        assignment = random_team_assignment(self.room, rng=0)
+        wagging_score, _ = get_wagging_score(self.room, assignment)
+        for members in self.room.get_team_members(assignment):
+            self.assertEqual(
+                self.context.get_team_wagging_count(members),
+                int(wagging_score[members].sum()),
+            )
+
+    def test_category_agreement(self):
+        agreement = self.context.category_agreement
+        np.testing.assert_allclose(agreement, agreement.T)
+        self.assertTrue(((agreement >= 0) & (agreement <= 1 + 1e-9)).all())
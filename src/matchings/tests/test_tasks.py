@@ -0,0 +1,95 @@
+import tempfile
+from unittest import mock
+
+import numpy as np
+from django.test import TestCase
+
+from matchings.matching.tasks import replay_matching, run_matching_task
+from matchings.models import MatchingRun, Result, Room
+
+from .helpers import create_room
+
+# 재현을 확인할 때는 시간 예산 대신 반복 횟수로만 종료
+REPLAY_KWARGS = {"time_budget": None, "patience": None, "max_iterations": 300}
+
+
+class FakeChannelLayer:
+    def __init__(self):
+        self.events = []
+
+    async def group_send(self, group, event):
+        self.events.append((group, event))
+
+
+class ReplayMatchingTest(TestCase):
+    """
+    run_matching_task가 저장한 시드와 실행 설정으로 replay_matching이 같은 결과를 재현하는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matching_room = create_room(42, seed=7)
+
+    def setUp(self):
+        # 관계 행렬 캐시는 테스트용 임시 디렉터리에 저장
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.channel_layer = FakeChannelLayer()
+        patches = [
+            mock.patch("matchings.matching.affinity.MATCHING_CACHE_DIR", cache_dir.name),
+            mock.patch("matchings.matching.pipeline.MATCHING_TIME_BUDGET", 0.1),
+            mock.patch(
+                "matchings.matching.tasks.get_channel_layer",
+                return_value=self.channel_layer,
+            ),
+            mock.patch("matchings.matching.tasks.explain_matching_task.delay"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_run_matching_task_records_seed(self):
+        run_matching_task.run(self.matching_room.id, engine="tabu", seed=1234)
+
+        result = Result.objects.get(room=self.matching_room)
+        self.assertEqual(result.seed, 1234)
+        self.assertEqual(result.engine_params["engine"], "tabu")
+        self.assertTrue(MatchingRun.objects.filter(result=result).exists())
+        self.matching_room.refresh_from_db()
+        self.assertEqual(self.matching_room.status, Room.Status.COMPLETED)
+        self.assertEqual(
+            self.channel_layer.events[-1][1]["payload"]["new_state"], Room.Status.COMPLETED
+        )
+
+    def test_explain_dispatch_failure_keeps_result(self):
+        # 설명글 Task를 보내지 못해도 이미 공개한 팀 매칭은 유지
+        with mock.patch(
+            "matchings.matching.tasks.explain_matching_task.delay",
+            side_effect=ConnectionError("broker down"),
+        ) as delay:
+            run_matching_task.run(self.matching_room.id, seed=1234)
+
+        result = Result.objects.get(room=self.matching_room)
+        delay.assert_called_once_with(result.id)
+        self.matching_room.refresh_from_db()
+        self.assertEqual(self.matching_room.status, Room.Status.COMPLETED)
+        self.assertEqual(len(self.channel_layer.events), 1)
+        self.assertNotIn("error", self.channel_layer.events[0][1]["payload"])
+
+    def test_replay_is_deterministic(self):
+        run_matching_task.run(self.matching_room.id, seed=1234)
+        result = Result.objects.get(room=self.matching_room)
+
+        first, first_score, first_stats = replay_matching(result, **REPLAY_KWARGS)
+        second, second_score, second_stats = replay_matching(result, **REPLAY_KWARGS)
+        np.testing.assert_array_equal(first, second)
+        self.assertEqual(first_score, second_score)
+        self.assertEqual(
+            [start["seed"] for start in first_stats["starts"]],
+            [start["seed"] for start in second_stats["starts"]],
+        )
+
+    def test_replay_without_seed(self):
+        result = Result.objects.create(room=self.matching_room)
+        with self.assertRaises(ValueError):
+            replay_matching(result, **REPLAY_KWARGS)